@@ -1,5 +1,11 @@
 from ragas import backends
-from ragas.cache import CacheInterface, DiskCacheBackend, cacher
+from ragas.cache import (
+    CacheInterface,
+    DiskCacheBackend,
+    MemoryCacheBackend,
+    TieredCache,
+    cacher,
+)
 from ragas.dataset import Dataset, DataTable
 from ragas.dataset_schema import EvaluationDataset, MultiTurnSample, SingleTurnSample
 from ragas.evaluation import aevaluate, evaluate
@@ -25,6 +31,8 @@ __all__ = [
     "cacher",
     "CacheInterface",
     "DiskCacheBackend",
+    "MemoryCacheBackend",
+    "TieredCache",
     "backends",
     "Experiment",
     "experiment",
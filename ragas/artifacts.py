@@ -0,0 +1,131 @@
+"""Intermediate artefacts shared across metrics, such as statement decompositions."""
+
+from __future__ import annotations
+
+import contextvars
+import logging
+import threading
+import typing as t
+from contextlib import contextmanager
+
+from ragas.cache import (
+    CacheInterface,
+    MemoryCacheBackend,
+    SingleFlight,
+    _CacheKeyBuilder,
+)
+
+logger = logging.getLogger(__name__)
+
+T = t.TypeVar("T")
+
+_MISSING = object()
+
+_current_store: contextvars.ContextVar[t.Optional["ArtifactStore"]] = (
+    contextvars.ContextVar("ragas_artifact_store", default=None)
+)
+
+
+def artifact_key(kind: str, *parts: t.Any) -> str:
+    """
+    Key of an artefact of type ``kind`` computed from ``parts``.
+
+    Parts are hashed like cache keys, so LLMs, embeddings and prompts contribute
+    their registered identity (provider, model, prompt text) rather than their
+    memory address.
+    """
+    builder = _CacheKeyBuilder()
+    builder.update(kind)
+    builder.update(list(parts))
+    return f"{kind}:{builder.hexdigest()}"
+
+
+class ArtifactStore:
+    """
+    Store for intermediate results that several metrics compute identically.
+
+    Metrics decomposing the same text into statements with the same prompt and
+    LLM (e.g. Faithfulness and AnswerCorrectness on a response, or NoiseSensitivity
+    in both modes) look the decomposition up here instead of calling the LLM again.
+    Concurrent requests for the same artefact are coalesced into one call.
+
+    `evaluate` scopes a fresh in-memory store to each call. Pass a store backed by
+    a `DiskCacheBackend` to keep artefacts across runs, or activate one around your
+    own scoring code with `use_artifact_store`.
+
+    Parameters
+    ----------
+    cache : CacheInterface, optional
+        Backend holding the artefacts. Defaults to an in-memory LRU cache.
+    """
+
+    def __init__(self, cache: t.Optional[CacheInterface] = None):
+        self.cache = cache if cache is not None else MemoryCacheBackend()
+        self._single_flight = SingleFlight()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    async def get_or_compute(
+        self, key: str, compute: t.Callable[[], t.Awaitable[T]]
+    ) -> T:
+        """Return the artefact stored under ``key``, computing it on a miss."""
+
+        async def load():
+            value = await self.cache.aget(key, _MISSING)
+            if value is not _MISSING:
+                with self._lock:
+                    self.hits += 1
+                return value
+            with self._lock:
+                self.misses += 1
+            value = await compute()
+            await self.cache.aset(key, value)
+            return value
+
+        return await self._single_flight.do(key, load)
+
+    def __repr__(self) -> str:
+        return f"ArtifactStore(cache={self.cache!r}, hits={self.hits}, misses={self.misses})"
+
+
+def get_artifact_store() -> t.Optional[ArtifactStore]:
+    """Return the artefact store active in the current context, if any."""
+    return _current_store.get()
+
+
+@contextmanager
+def use_artifact_store(
+    store: t.Optional[ArtifactStore] = None,
+) -> t.Iterator[ArtifactStore]:
+    """
+    Share artefacts between the metrics scored inside the ``with`` block.
+
+    Examples
+    --------
+    >>> from ragas.artifacts import use_artifact_store
+    >>> with use_artifact_store():
+    ...     faithfulness = await Faithfulness(llm=llm).ascore(**sample)
+    ...     correctness = await AnswerCorrectness(llm=llm, embeddings=emb).ascore(**sample)
+    """
+    store = store if store is not None else ArtifactStore()
+    token = _current_store.set(store)
+    try:
+        yield store
+    finally:
+        _current_store.reset(token)
+
+
+async def shared_artifact(
+    kind: str, key_parts: t.Sequence[t.Any], compute: t.Callable[[], t.Awaitable[T]]
+) -> T:
+    """
+    Compute an artefact, reusing it from the active store if there is one.
+
+    ``key_parts`` must identify the result completely, typically the rendered
+    prompt (or the prompt and its input) and the LLM.
+    """
+    store = _current_store.get()
+    if store is None:
+        return await compute()
+    return await store.get_or_compute(artifact_key(kind, *key_parts), compute)
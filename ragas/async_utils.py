@@ -1,11 +1,28 @@
 """Async utils."""
 
+from __future__ import annotations
+
 import asyncio
+import collections
+import contextvars
+import inspect
 import logging
+import os
+import time
+import types
 import typing as t
 
+if t.TYPE_CHECKING:
+    from ragas.concurrency import AdaptiveConcurrencyLimiter
+
 logger = logging.getLogger(__name__)
 
+LOOP_BLOCK_THRESHOLD_ENV_VAR = "RAGAS_LOOP_BLOCK_THRESHOLD"
+
+_watching_loop_blocks: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "ragas_watching_loop_blocks", default=False
+)
+
 
 def is_event_loop_running() -> bool:
     """
@@ -61,13 +78,19 @@ def as_completed(
     *,
     cancel_check: t.Optional[t.Callable[[], bool]] = None,
     cancel_pending: bool = True,
+    limiter: t.Optional[AdaptiveConcurrencyLimiter] = None,
 ) -> t.Iterator[asyncio.Future]:
     """
     Wrap coroutines with a semaphore if max_workers is specified.
 
+    If an adaptive `limiter` is given it replaces the static semaphore and
+    max_workers is ignored.
+
     Returns an iterator of futures that completes as tasks finish.
     """
-    if max_workers == -1:
+    if limiter is not None:
+        tasks = [asyncio.create_task(limiter.run(coro)) for coro in coroutines]
+    elif max_workers == -1:
         tasks = [asyncio.create_task(coro) for coro in coroutines]
     else:
         semaphore = asyncio.Semaphore(max_workers)
@@ -96,6 +119,256 @@ def as_completed(
     return _iter_with_cancel()
 
 
+async def as_ordered(
+    jobs: t.Iterable[t.Callable[[], t.Awaitable[t.Any]]],
+    max_workers: int = -1,
+    lookahead: int = 0,
+    *,
+    cancel_check: t.Optional[t.Callable[[], bool]] = None,
+    on_done: t.Optional[t.Callable[[asyncio.Task], None]] = None,
+    limiter: t.Optional[AdaptiveConcurrencyLimiter] = None,
+) -> t.AsyncGenerator[t.Any, None]:
+    """
+    Run jobs from a (possibly lazy) iterable and yield their results in order.
+
+    Jobs are pulled from ``jobs`` only when there is room in the window, so at
+    most ``max_workers`` jobs run concurrently and at most
+    ``max_workers + lookahead`` jobs are alive at any time (running, or
+    finished and waiting in the reorder buffer for an earlier job).
+
+    Args:
+        jobs: Iterable of zero-argument callables returning awaitables
+        max_workers: Maximum number of concurrently running jobs (-1 for
+            unlimited, in which case the window is bounded by ``lookahead``)
+        lookahead: Number of extra jobs that may be started or buffered ahead
+            of the oldest unfinished job
+        cancel_check: Optional callable; when it returns True no new jobs are
+            started and pending ones are cancelled
+        on_done: Optional callback invoked with each task as soon as it
+            finishes, regardless of the order in which results are yielded
+        limiter: Optional adaptive limiter replacing ``max_workers``; the
+            window follows its current limit
+
+    Yields:
+        Job results in the order the jobs were produced by ``jobs``. Exceptions
+        raised by a job propagate to the consumer.
+    """
+    semaphore = None
+    if limiter is None and max_workers is not None and max_workers >= 1:
+        semaphore = asyncio.Semaphore(max_workers)
+
+    def window() -> int:
+        if limiter is not None:
+            return limiter.limit + max(lookahead, 0)
+        if semaphore is None:
+            return max(lookahead, 1)
+        return max_workers + max(lookahead, 0)
+
+    async def sema_coro(job):
+        if limiter is not None:
+            return await limiter.run(job())
+        if semaphore is None:
+            return await job()
+        async with semaphore:
+            return await job()
+
+    job_iter = iter(jobs)
+    in_flight: t.Deque[asyncio.Task] = collections.deque()
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(in_flight) < window():
+                if cancel_check is not None and cancel_check():
+                    exhausted = True
+                    break
+                try:
+                    job = next(job_iter)
+                except StopIteration:
+                    exhausted = True
+                    break
+                task = asyncio.create_task(sema_coro(job))
+                if on_done is not None:
+                    task.add_done_callback(on_done)
+                in_flight.append(task)
+
+            if not in_flight:
+                break
+            if cancel_check is not None and cancel_check():
+                break
+
+            # only the head of the window is awaited; later jobs keep running
+            # and their results wait in their task objects until their turn
+            head = in_flight.popleft()
+            yield await head
+    finally:
+        for task in in_flight:
+            if not task.done():
+                task.cancel()
+
+
+async def gather_bounded(
+    aws: t.Iterable[t.Awaitable[t.Any]],
+    max_concurrency: int = -1,
+) -> t.List[t.Any]:
+    """
+    Await ``aws`` concurrently and return their results in order.
+
+    Unlike ``asyncio.gather``, at most ``max_concurrency`` awaitables run at once
+    and the first exception cancels everything still pending before it is
+    raised, so a failed call does not leave its siblings spending tokens.
+
+    Args:
+        aws: Awaitables (typically coroutines) to run
+        max_concurrency: Maximum number running at once (-1 or 0 for unlimited,
+            1 to run them one after another)
+    """
+    aws = list(aws)
+    if not aws:
+        return []
+    if max_concurrency == 1:
+        results = []
+        try:
+            for aw in aws:
+                results.append(await aw)
+        finally:
+            # close coroutines that never started, avoiding "never awaited" warnings
+            for aw in aws[len(results) + 1 :]:
+                if asyncio.iscoroutine(aw):
+                    aw.close()
+        return results
+
+    semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency > 0 else None
+
+    async def bounded(aw):
+        if semaphore is None:
+            return await aw
+        async with semaphore:
+            return await aw
+
+    tasks = [asyncio.ensure_future(bounded(aw)) for aw in aws]
+    try:
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        for task in tasks:
+            if task in done and not task.cancelled() and task.exception() is not None:
+                raise task.exception()  # type: ignore[misc]
+        return [task.result() for task in tasks]
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for aw in aws:
+            if (
+                asyncio.iscoroutine(aw)
+                and inspect.getcoroutinestate(aw) == inspect.CORO_CREATED
+            ):
+                aw.close()
+
+
+async def first_valid(
+    aws: t.Iterable[t.Awaitable[t.Any]],
+    is_valid: t.Callable[[t.Any], bool],
+    default: t.Any = None,
+) -> t.Any:
+    """
+    Await ``aws`` concurrently and return the first result accepted by ``is_valid``.
+
+    Awaitables still running are cancelled as soon as a valid result arrives.
+    Exceptions count as invalid results; ``default`` is returned when no result
+    is valid.
+
+    Args:
+        aws: Awaitables (typically coroutines) to race
+        is_valid: Predicate a result must satisfy
+        default: Value returned when no awaitable produces a valid result
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            try:
+                result = await next_done
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.debug("Discarding failed attempt: %s", e)
+                continue
+            if is_valid(result):
+                return result
+        return default
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def get_loop_block_threshold() -> float:
+    """Seconds a coroutine step may run before it counts as blocking the loop."""
+    try:
+        return float(os.environ.get(LOOP_BLOCK_THRESHOLD_ENV_VAR, "0.1"))
+    except ValueError:
+        return 0.1
+
+
+@types.coroutine
+def _drive_timed(
+    coro: t.Coroutine[t.Any, t.Any, t.Any], name: str, threshold: float
+) -> t.Generator[t.Any, t.Any, t.Any]:
+    # run ``coro`` step by step on behalf of the awaiting task, timing each step;
+    # a step is the synchronous work between two suspension points
+    send, error = None, None
+    while True:
+        start = time.perf_counter()
+        try:
+            yielded = coro.send(send) if error is None else coro.throw(error)
+        except StopIteration as e:
+            _report_block(name, time.perf_counter() - start, threshold)
+            return e.value
+        except BaseException:
+            _report_block(name, time.perf_counter() - start, threshold)
+            raise
+        _report_block(name, time.perf_counter() - start, threshold)
+        try:
+            send, error = (yield yielded), None
+        except BaseException as e:
+            send, error = None, e
+
+
+def _report_block(name: str, elapsed: float, threshold: float) -> None:
+    if elapsed > threshold:
+        logger.warning(
+            "%s blocked the event loop for %.3fs (threshold %.3fs); "
+            "move sync or CPU-bound work off the loop",
+            name,
+            elapsed,
+            threshold,
+        )
+
+
+async def watch_loop_blocking(
+    coro: t.Coroutine[t.Any, t.Any, t.Any],
+    name: str,
+    threshold: t.Optional[float] = None,
+) -> t.Any:
+    """
+    Await ``coro`` and warn whenever one of its steps blocks the event loop.
+
+    Every stretch of synchronous work between two ``await`` points of ``coro``
+    is timed, and a warning naming ``name`` is logged for each one longer than
+    ``threshold`` seconds (default: the ``RAGAS_LOOP_BLOCK_THRESHOLD`` environment
+    variable, or 0.1). Work in tasks spawned by ``coro`` is not attributed to it.
+    Nested watches are skipped so a block is reported once, by the outermost one.
+    """
+    if _watching_loop_blocks.get():
+        return await coro
+    threshold = get_loop_block_threshold() if threshold is None else threshold
+    token = _watching_loop_blocks.set(True)
+    try:
+        return await _drive_timed(coro, name, threshold)
+    finally:
+        _watching_loop_blocks.reset(token)
+
+
 async def process_futures(
     futures: t.Iterator[asyncio.Future],
 ) -> t.AsyncGenerator[t.Any, None]:
@@ -164,6 +437,7 @@ def run_async_tasks(
     max_workers: int = -1,
     *,
     cancel_check: t.Optional[t.Callable[[], bool]] = None,
+    limiter: t.Optional[AdaptiveConcurrencyLimiter] = None,
 ) -> t.List[t.Any]:
     """
     Execute async tasks with optional batching and progress tracking.
@@ -175,6 +449,7 @@ def run_async_tasks(
         batch_size: Optional size for batching tasks. If None, runs all concurrently
         show_progress: Whether to display progress bars
         max_workers: Maximum number of concurrent tasks (-1 for unlimited)
+        limiter: Optional adaptive concurrency limiter used instead of max_workers
     """
     from ragas.utils import ProgressBarManager, batched
 
@@ -187,7 +462,9 @@ def run_async_tasks(
         if not batch_size:
             with pbm.create_single_bar(total_tasks) as pbar:
                 async for result in process_futures(
-                    as_completed(tasks, max_workers, cancel_check=cancel_check)
+                    as_completed(
+                        tasks, max_workers, cancel_check=cancel_check, limiter=limiter
+                    )
                 ):
                     if isinstance(result, Exception):
                         logger.error(
@@ -209,7 +486,12 @@ def run_async_tasks(
                 for i, batch in enumerate(batches, 1):
                     pbm.update_batch_bar(batch_pbar, i, n_batches, len(batch))
                     async for result in process_futures(
-                        as_completed(batch, max_workers, cancel_check=cancel_check)
+                        as_completed(
+                            batch,
+                            max_workers,
+                            cancel_check=cancel_check,
+                            limiter=limiter,
+                        )
                     ):
                         if isinstance(result, Exception):
                             logger.error(
@@ -1,16 +1,27 @@
+import asyncio
 import functools
 import hashlib
 import inspect
-import json
 import logging
+import pickle
+import re
+import sys
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, replace
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
 
+import numpy as np
 from pydantic import BaseModel, GetCoreSchemaHandler
 from pydantic_core import CoreSchema, core_schema
 
 logger = logging.getLogger(__name__)
 
+# sentinel telling a cache miss apart from a cached ``None``
+_MISSING = object()
+
 
 class CacheInterface(ABC):
     """Abstract base class defining the interface for cache implementations.
@@ -53,6 +64,32 @@ class CacheInterface(ABC):
         """
         pass
 
+    async def aget(self, key: str, default: Any = None) -> Any:
+        """Asynchronously retrieve a value from the cache by key.
+
+        The default implementation calls the synchronous methods directly.
+        Backends doing blocking I/O should override this to keep the event loop free.
+
+        Args:
+            key: The key to look up in the cache.
+            default: Value returned if the key is not in the cache.
+
+        Returns:
+            The cached value associated with the key, or ``default`` if not found.
+        """
+        if self.has_key(key):
+            return self.get(key)
+        return default
+
+    async def aset(self, key: str, value) -> None:
+        """Asynchronously store a value in the cache with the given key.
+
+        Args:
+            key: The key to store the value under.
+            value: The value to cache.
+        """
+        self.set(key, value)
+
     @classmethod
     def __get_pydantic_core_schema__(
         cls, source_type: Any, handler: GetCoreSchemaHandler
@@ -117,6 +154,29 @@ class DiskCacheBackend(CacheInterface):
         """
         return key in self.cache
 
+    async def aget(self, key: str, default: Any = None) -> Any:
+        """Retrieve a value from the disk cache without blocking the event loop.
+
+        The lookup is a single SQLite read run in a worker thread.
+
+        Args:
+            key: The key to look up in the cache.
+            default: Value returned if the key is not in the cache.
+
+        Returns:
+            The cached value associated with the key, or ``default`` if not found.
+        """
+        return await asyncio.to_thread(self.cache.get, key, default)
+
+    async def aset(self, key: str, value) -> None:
+        """Store a value in the disk cache without blocking the event loop.
+
+        Args:
+            key: The key to store the value under.
+            value: The value to cache.
+        """
+        await asyncio.to_thread(self.cache.set, key, value)
+
     def __del__(self):
         """Cleanup method to properly close the cache when the object is destroyed."""
         if hasattr(self, "cache"):
@@ -131,34 +191,453 @@ class DiskCacheBackend(CacheInterface):
         return f"DiskCacheBackend(cache_dir={self.cache.directory})"
 
 
-def _make_hashable(o):
-    if isinstance(o, (tuple, list)):
-        return tuple(_make_hashable(e) for e in o)
-    elif isinstance(o, dict):
-        return tuple(sorted((k, _make_hashable(v)) for k, v in o.items()))
-    elif isinstance(o, set):
-        return tuple(sorted(_make_hashable(e) for e in o))
-    elif isinstance(o, BaseModel):
-        return _make_hashable(o.model_dump())
-    else:
-        return o
+@dataclass
+class CacheStats:
+    """Counters describing how a cache has been used.
+
+    Attributes:
+        hits: Lookups answered by the cache (for `TieredCache`, by any tier).
+        misses: Lookups that found nothing.
+        evictions: Entries dropped to respect size, count or TTL limits.
+        memory_hits: Hits served from the memory tier (`TieredCache` only).
+        disk_hits: Hits served from the lower tier (`TieredCache` only).
+        entries: Number of entries currently held in memory.
+        size_bytes: Estimated size of the entries held in memory.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    memory_hits: int = 0
+    disk_hits: int = 0
+    entries: int = 0
+    size_bytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {**asdict(self), "hit_rate": self.hit_rate}
+
+
+class MemoryCacheBackend(CacheInterface):
+    """A bounded in-process cache with LRU eviction and optional expiry.
+
+    Entries are evicted least-recently-used first once ``max_entries`` or
+    ``max_size_bytes`` is exceeded, and are treated as missing once they are older
+    than ``ttl`` seconds. Values are stored as-is (not copied), so hits cost a
+    dictionary lookup instead of a SQLite read and unpickling.
+
+    Args:
+        max_entries (int, optional): Maximum number of entries. Defaults to 10_000.
+        max_size_bytes (int, optional): Maximum estimated total size of the values.
+            Sizes are estimated by pickling values on insert, so only set this if
+            you need it. Defaults to None (no size limit).
+        ttl (float, optional): Seconds after which an entry expires. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = 10_000,
+        max_size_bytes: Optional[int] = None,
+        ttl: Optional[float] = None,
+    ):
+        self.max_entries = max_entries
+        self.max_size_bytes = max_size_bytes
+        self.ttl = ttl
+        # key -> (value, size in bytes, expiry time)
+        self._entries: "OrderedDict[str, Tuple[Any, int, Optional[float]]]" = (
+            OrderedDict()
+        )
+        self._size_bytes = 0
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+
+    def _lookup(self, key: str) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats.misses += 1
+                return _MISSING
+            value, size, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                self._remove(key)
+                self._stats.evictions += 1
+                self._stats.misses += 1
+                return _MISSING
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return value
+
+    def _remove(self, key: str) -> None:
+        _, size, _ = self._entries.pop(key)
+        self._size_bytes -= size
+
+    def get(self, key: str) -> Any:
+        """Retrieve a value from the memory cache by key.
+
+        Args:
+            key: The key to look up in the cache.
+
+        Returns:
+            The cached value associated with the key, or None if not found.
+        """
+        value = self._lookup(key)
+        return None if value is _MISSING else value
+
+    async def aget(self, key: str, default: Any = None) -> Any:
+        value = self._lookup(key)
+        return default if value is _MISSING else value
+
+    def set(self, key: str, value) -> None:
+        """Store a value in the memory cache, evicting old entries if needed.
+
+        Args:
+            key: The key to store the value under.
+            value: The value to cache.
+        """
+        size = 0
+        if self.max_size_bytes is not None:
+            try:
+                size = len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+            except Exception:
+                size = sys.getsizeof(value)
+            if size > self.max_size_bytes:
+                # would evict everything else and still not fit
+                return
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, size, expires_at)
+            self._size_bytes += size
+            while self._entries and (
+                (self.max_entries is not None and len(self._entries) > self.max_entries)
+                or (
+                    self.max_size_bytes is not None
+                    and self._size_bytes > self.max_size_bytes
+                )
+            ):
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._stats.evictions += 1
+
+    async def aset(self, key: str, value) -> None:
+        self.set(key, value)
+
+    def has_key(self, key: str) -> bool:
+        """Check if an unexpired entry exists in the memory cache.
+
+        Args:
+            key: The key to check for.
+
+        Returns:
+            True if the key exists in the cache, False otherwise.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and (
+                entry[2] is None or entry[2] > time.monotonic()
+            )
+
+    def clear(self) -> None:
+        """Remove all entries (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+
+    def stats(self) -> CacheStats:
+        """Return a snapshot of the hit/miss/eviction counters."""
+        with self._lock:
+            return replace(
+                self._stats, entries=len(self._entries), size_bytes=self._size_bytes
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self):
+        return (
+            f"MemoryCacheBackend(max_entries={self.max_entries}, "
+            f"max_size_bytes={self.max_size_bytes}, ttl={self.ttl})"
+        )
+
+
+class TieredCache(CacheInterface):
+    """A two-level cache: a memory tier in front of a slower persistent tier.
+
+    Lookups check memory first, then the lower tier; lower-tier hits are promoted
+    into memory. Writes go to both tiers.
+
+    Args:
+        memory (MemoryCacheBackend, optional): The memory tier. Defaults to a
+            `MemoryCacheBackend` with default limits.
+        disk (CacheInterface, optional): The persistent tier. Defaults to a
+            `DiskCacheBackend` in ".cache".
+
+    Example:
+        >>> cache = TieredCache(MemoryCacheBackend(max_entries=50_000), DiskCacheBackend())
+        >>> llm = LangchainLLMWrapper(chat_model, cache=cache)
+        >>> cache.stats().to_dict()
+    """
+
+    def __init__(
+        self,
+        memory: Optional[MemoryCacheBackend] = None,
+        disk: Optional[CacheInterface] = None,
+    ):
+        self.memory = memory if memory is not None else MemoryCacheBackend()
+        self.disk = disk if disk is not None else DiskCacheBackend()
+        self._disk_hits = 0
+        self._misses = 0
+
+    def get(self, key: str) -> Any:
+        value = self.memory._lookup(key)
+        if value is not _MISSING:
+            return value
+        if not self.disk.has_key(key):
+            self._misses += 1
+            return None
+        value = self.disk.get(key)
+        self._disk_hits += 1
+        self.memory.set(key, value)
+        return value
+
+    async def aget(self, key: str, default: Any = None) -> Any:
+        value = self.memory._lookup(key)
+        if value is not _MISSING:
+            return value
+        value = await self.disk.aget(key, _MISSING)
+        if value is _MISSING:
+            self._misses += 1
+            return default
+        self._disk_hits += 1
+        self.memory.set(key, value)
+        return value
+
+    def set(self, key: str, value) -> None:
+        self.memory.set(key, value)
+        self.disk.set(key, value)
+
+    async def aset(self, key: str, value) -> None:
+        self.memory.set(key, value)
+        await self.disk.aset(key, value)
+
+    def has_key(self, key: str) -> bool:
+        return self.memory.has_key(key) or self.disk.has_key(key)
+
+    def stats(self) -> CacheStats:
+        """Return combined counters; ``evictions`` refer to the memory tier."""
+        memory = self.memory.stats()
+        return CacheStats(
+            hits=memory.hits + self._disk_hits,
+            misses=self._misses,
+            evictions=memory.evictions,
+            memory_hits=memory.hits,
+            disk_hits=self._disk_hits,
+            entries=memory.entries,
+            size_bytes=memory.size_bytes,
+        )
+
+    def __repr__(self):
+        return f"TieredCache(memory={self.memory!r}, disk={self.disk!r})"
 
 
 EXCLUDE_KEYS = ["callbacks"]
 
+_CACHE_KEY_FUNCTIONS: Dict[type, Callable[[Any], Any]] = {}
+_MEMORY_ADDRESS = re.compile(r" at 0x[0-9a-fA-F]+")
+
+
+def register_cache_key(cls: type, key_fn: Optional[Callable[[Any], Any]] = None):
+    """Register a function returning the cache identity of instances of ``cls``.
+
+    The returned value is hashed in place of the object itself, and it applies to
+    subclasses too. Use it for objects whose ``str`` is not stable across processes
+    (clients, memory addresses) or whose full state is expensive to hash.
+
+    Can be used directly or as a class decorator::
+
+        register_cache_key(MyLLM, lambda llm: (llm.provider, llm.model))
+
+        @register_cache_key
+        class MyPrompt: ...  # uses MyPrompt.__cache_key__
+
+    Args:
+        cls: The type to register.
+        key_fn: Callable returning plain data (str, numbers, lists, dicts, models)
+            identifying the instance. Defaults to ``cls.__cache_key__``.
+    """
+    if key_fn is None:
+        key_fn = getattr(cls, "__cache_key__")
+    _CACHE_KEY_FUNCTIONS[cls] = key_fn
+    return cls
+
+
+def _get_cache_key_function(obj) -> Optional[Callable[[Any], Any]]:
+    if not _CACHE_KEY_FUNCTIONS:
+        return None
+    for klass in type(obj).__mro__:
+        key_fn = _CACHE_KEY_FUNCTIONS.get(klass)
+        if key_fn is not None:
+            return key_fn
+    return None
+
+
+class _CacheKeyBuilder:
+    """Feed objects into a hash as a canonical, length-prefixed byte stream.
+
+    No intermediate JSON string is built: values are written to a small buffer
+    that is flushed into the hasher as it fills up.
+    """
+
+    _FLUSH_AT = 1 << 16
+
+    def __init__(self):
+        self._hasher = hashlib.blake2b(digest_size=16)
+        self._buffer = bytearray()
+
+    def _write(self, tag: bytes, data: bytes) -> None:
+        buffer = self._buffer
+        buffer += tag
+        buffer += str(len(data)).encode()
+        buffer += b":"
+        buffer += data
+        if len(buffer) >= self._FLUSH_AT:
+            self._hasher.update(buffer)
+            buffer.clear()
+
+    def update(self, o) -> None:
+        # order matters: bool is an int and str-enums are strs
+        if o is None:
+            self._buffer += b"N"
+        elif o is True or o is False:
+            self._buffer += b"T" if o else b"F"
+        elif type(o) is str:
+            self._write(b"s", o.encode("utf-8"))
+        elif type(o) is int:
+            self._write(b"i", str(o).encode())
+        elif type(o) is float:
+            self._write(b"f", repr(o).encode())
+        elif isinstance(o, (list, tuple)):
+            self._buffer += b"l%d;" % len(o)
+            for e in o:
+                self.update(e)
+        elif isinstance(o, dict):
+            self._buffer += b"d%d;" % len(o)
+            try:
+                items = sorted(o.items())
+            except TypeError:
+                items = sorted(o.items(), key=lambda kv: repr(kv[0]))
+            for k, v in items:
+                self.update(k)
+                self.update(v)
+        elif isinstance(o, (set, frozenset)):
+            # element order is arbitrary, so hash the sorted element digests
+            self._write(b"S", b"".join(sorted(_digest(e) for e in o)))
+        elif isinstance(o, (bytes, bytearray)):
+            self._write(b"b", bytes(o))
+        elif isinstance(o, np.ndarray):
+            self._write(b"a", f"{o.dtype.str}{o.shape}".encode())
+            self._write(b"", np.ascontiguousarray(o).tobytes())
+        else:
+            key_fn = _get_cache_key_function(o)
+            if key_fn is not None:
+                self._write(b"k", type(o).__qualname__.encode())
+                self.update(key_fn(o))
+            elif isinstance(o, BaseModel):
+                # walk the fields instead of materialising model_dump()
+                self._write(b"m", type(o).__qualname__.encode())
+                for name in type(o).model_fields:
+                    self._write(b"", name.encode())
+                    self.update(getattr(o, name))
+            elif isinstance(o, str):
+                self._write(b"s", str(o).encode("utf-8"))
+            elif isinstance(o, (int, float)):
+                self._write(b"f", repr(o).encode())
+            else:
+                # last resort; strip memory addresses so keys survive restarts
+                text = _MEMORY_ADDRESS.sub("", str(o))
+                self._write(b"o", type(o).__qualname__.encode())
+                self._write(b"", text.encode("utf-8"))
+
+    def hexdigest(self) -> str:
+        self._hasher.update(self._buffer)
+        self._buffer.clear()
+        return self._hasher.hexdigest()
+
+    def digest(self) -> bytes:
+        self._hasher.update(self._buffer)
+        self._buffer.clear()
+        return self._hasher.digest()
+
+
+def _digest(o) -> bytes:
+    builder = _CacheKeyBuilder()
+    builder.update(o)
+    return builder.digest()
+
 
 def _generate_cache_key(func, args, kwargs):
-    filtered_kwargs = {k: v for k, v in kwargs.items() if k not in EXCLUDE_KEYS}
+    builder = _CacheKeyBuilder()
+    builder.update(func.__qualname__)
+    # bound methods of registered types (LLMs, embeddings) include their identity
+    owner = getattr(func, "__self__", None)
+    if owner is not None and _get_cache_key_function(owner) is not None:
+        builder.update(owner)
+    builder.update(args)
+    builder.update({k: v for k, v in kwargs.items() if k not in EXCLUDE_KEYS})
+    return builder.hexdigest()
+
+
+class SingleFlight:
+    """Coalesce concurrent async calls that share a key into a single call.
+
+    The first caller for a key runs the call; callers arriving while it is in
+    flight await the same result instead of repeating the work. If the running
+    call is cancelled, the next waiter takes over.
+    """
 
-    key_data = {
-        "function": func.__qualname__,
-        "args": _make_hashable(args),
-        "kwargs": _make_hashable(filtered_kwargs),
-    }
+    def __init__(self):
+        self._calls: Dict[str, asyncio.Future] = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        loop = asyncio.get_running_loop()
+        while True:
+            future = self._calls.get(key)
+            # futures are bound to their loop, ignore ones left by another loop
+            if future is None or future.done() or future.get_loop() is not loop:
+                break
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if future.cancelled():
+                    continue
+                raise
+
+        future = loop.create_future()
+        # mark the outcome as retrieved even if nobody else is waiting on it
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._calls[key] = future
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if self._calls.get(key) is future:
+                del self._calls[key]
 
-    key_string = json.dumps(key_data, sort_keys=True, default=str)
-    cache_key = hashlib.sha256(key_string.encode("utf-8")).hexdigest()
-    return cache_key
+    def __len__(self) -> int:
+        return len(self._calls)
 
 
 def cacher(cache_backend: Optional[CacheInterface] = None):
@@ -167,6 +646,9 @@ def cacher(cache_backend: Optional[CacheInterface] = None):
     This decorator can be applied to both synchronous and asynchronous functions to cache their results.
     If no cache backend is provided, the original function is returned unchanged.
 
+    For asynchronous functions the backend is accessed through `CacheInterface.aget`/`aset`,
+    and concurrent calls with the same cache key share a single pending call.
+
     Args:
         cache_backend (Optional[CacheInterface]): The cache backend to use for storing results.
             If None, caching is disabled.
@@ -183,18 +665,23 @@ def cacher(cache_backend: Optional[CacheInterface] = None):
         backend: CacheInterface = cache_backend
 
         is_async = inspect.iscoroutinefunction(func)
+        in_flight = SingleFlight()
 
         @functools.wraps(func)
         async def async_wrapper(*args, **kwargs):
             cache_key = _generate_cache_key(func, args, kwargs)
 
-            if backend.has_key(cache_key):
+            cached = await backend.aget(cache_key, _MISSING)
+            if cached is not _MISSING:
                 logger.debug(f"Cache hit for {cache_key}")
-                return backend.get(cache_key)
+                return cached
 
-            result = await func(*args, **kwargs)
-            backend.set(cache_key, result)
-            return result
+            async def call_and_store():
+                result = await func(*args, **kwargs)
+                await backend.aset(cache_key, result)
+                return result
+
+            return await in_flight.do(cache_key, call_and_store)
 
         @functools.wraps(func)
         def sync_wrapper(*args, **kwargs):
@@ -0,0 +1,348 @@
+"""Adaptive concurrency control for LLM-bound workloads."""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import logging
+import re
+import threading
+import time
+import typing as t
+from collections import deque
+from dataclasses import dataclass
+
+if t.TYPE_CHECKING:
+    from ragas.run_config import RunConfig
+
+logger = logging.getLogger(__name__)
+
+_current_limiter: contextvars.ContextVar[t.Optional["AdaptiveConcurrencyLimiter"]] = (
+    contextvars.ContextVar("ragas_concurrency_limiter", default=None)
+)
+# errors reported by the job `AdaptiveConcurrencyLimiter.run` is awaiting
+_job_failures: contextvars.ContextVar[t.Optional[t.List[BaseException]]] = (
+    contextvars.ContextVar("ragas_concurrency_job_failures", default=None)
+)
+
+# a 429 only counts next to a status phrase, not as any number in the message
+_RATE_LIMIT_MESSAGE = re.compile(
+    r"\b(?:error|status|code|http)\b\W{0,3}(?:code\W{0,3})?429\b"
+    r"|too many requests|rate[ _-]?limit"
+)
+
+
+def is_rate_limit_error(exc: BaseException) -> bool:
+    """
+    Check whether an exception signals throttling by the provider.
+
+    Works across provider SDKs by looking at HTTP status codes and the
+    conventional ``RateLimitError`` naming instead of importing every client.
+    """
+    for attr in ("status_code", "status", "http_status"):
+        if getattr(exc, attr, None) == 429:
+            return True
+    response = getattr(exc, "response", None)
+    if getattr(response, "status_code", None) == 429:
+        return True
+    name = type(exc).__name__.lower()
+    if "ratelimit" in name or "throttl" in name:
+        return True
+    return _RATE_LIMIT_MESSAGE.search(str(exc).lower()) is not None
+
+
+@dataclass
+class ConcurrencyStats:
+    """Snapshot of an `AdaptiveConcurrencyLimiter`'s state."""
+
+    limit: int
+    peak_limit: int
+    in_flight: int
+    completed: int
+    errors: int
+    throttled: int
+    retries: int
+    increases: int
+    decreases: int
+    p95_latency: t.Optional[float]
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD (additive increase, multiplicative decrease) concurrency limiter.
+
+    The limit grows by ``increase_step`` after every round (``limit`` completions,
+    at least ``min_round_size``) in which the limiter was saturated and both p95 latency and the
+    error rate stayed healthy. It is multiplied by ``decrease_factor`` when p95
+    latency exceeds ``latency_tolerance`` times the healthy baseline, when the
+    error rate of the round exceeds ``error_rate_threshold``, or immediately on a
+    rate-limit error (at most once per round).
+
+    Retries performed by `ragas.run_config.add_retry` / `add_async_retry` inside a
+    job are reported to the limiter the job runs under, so throttling absorbed by
+    tenacity still counts as an error signal.
+
+    The limiter holds no event-loop-bound primitives, so the same instance can be
+    reused across ``asyncio.run`` calls and keeps what it learned.
+
+    Parameters
+    ----------
+    initial_limit : int
+        Concurrency to start from.
+    min_limit : int
+        Lower bound for the limit.
+    max_limit : int
+        Upper bound for the limit.
+    increase_step : int
+        Additive increase applied after a healthy, saturated round.
+    decrease_factor : float
+        Multiplicative decrease applied when the limiter backs off.
+    latency_tolerance : float
+        Allowed ratio between the current and the baseline p95 latency.
+    error_rate_threshold : float
+        Fraction of failed or retried calls in a round that triggers a back-off.
+    window_size : int
+        Number of recent latency samples used for the p95 estimate.
+    min_round_size : int
+        Minimum number of completions before the limit is re-evaluated.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 16,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        increase_step: int = 1,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 2.0,
+        error_rate_threshold: float = 0.1,
+        window_size: int = 100,
+        min_round_size: int = 10,
+    ):
+        if min_limit < 1 or max_limit < min_limit:
+            raise ValueError("Expected 1 <= min_limit <= max_limit")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.error_rate_threshold = error_rate_threshold
+        self.min_round_size = min_round_size
+
+        self._limit = min(max(initial_limit, min_limit), max_limit)
+        self._peak_limit = self._limit
+        self._in_flight = 0
+        self._waiters: t.Deque[asyncio.Future] = deque()
+        self._latencies: t.Deque[float] = deque(maxlen=window_size)
+        self._baseline_p95: t.Optional[float] = None
+        self._lock = threading.Lock()
+
+        # per-round counters
+        self._round_completed = 0
+        self._round_errors = 0
+        self._round_saturated = False
+        self._round_decreased = False
+
+        # lifetime counters
+        self._completed = 0
+        self._errors = 0
+        self._throttled = 0
+        self._retries = 0
+        self._increases = 0
+        self._decreases = 0
+
+    @classmethod
+    def from_run_config(cls, run_config: RunConfig) -> "AdaptiveConcurrencyLimiter":
+        max_workers = run_config.max_workers if run_config.max_workers > 0 else 16
+        return cls(
+            initial_limit=max_workers,
+            min_limit=run_config.min_workers,
+            max_limit=run_config.adaptive_max_workers or 4 * max_workers,
+        )
+
+    @property
+    def limit(self) -> int:
+        """The current concurrency limit."""
+        return self._limit
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def stats(self) -> ConcurrencyStats:
+        return ConcurrencyStats(
+            limit=self._limit,
+            peak_limit=self._peak_limit,
+            in_flight=self._in_flight,
+            completed=self._completed,
+            errors=self._errors,
+            throttled=self._throttled,
+            retries=self._retries,
+            increases=self._increases,
+            decreases=self._decreases,
+            p95_latency=self._p95(),
+        )
+
+    async def acquire(self) -> None:
+        while self._in_flight >= self._limit:
+            self._round_saturated = True
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                else:
+                    # pass on a wake-up this waiter can no longer use
+                    self._wake_waiters()
+                raise
+        self._in_flight += 1
+        if self._in_flight >= self._limit:
+            self._round_saturated = True
+
+    def release(self) -> None:
+        self._in_flight -= 1
+        self._wake_waiters()
+
+    async def run(self, coro: t.Awaitable[t.Any]) -> t.Any:
+        """Await ``coro`` under the limiter and record its outcome."""
+        await self.acquire()
+        token = _current_limiter.set(self)
+        failures: t.List[BaseException] = []
+        failures_token = _job_failures.set(failures)
+        start = time.perf_counter()
+        try:
+            result = await coro
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.record(time.perf_counter() - start, error=e)
+            raise
+        else:
+            # a job may swallow its error (e.g. into a NaN score) and report it
+            error = failures[0] if failures else None
+            self.record(time.perf_counter() - start, error=error)
+            return result
+        finally:
+            _job_failures.reset(failures_token)
+            _current_limiter.reset(token)
+            self.release()
+
+    def record(self, latency: float, error: t.Optional[BaseException] = None) -> None:
+        """Record a finished call and adjust the limit at the end of a round."""
+        with self._lock:
+            self._completed += 1
+            self._round_completed += 1
+            if error is None:
+                self._latencies.append(latency)
+            else:
+                self._errors += 1
+                self._round_errors += 1
+                if is_rate_limit_error(error):
+                    self._throttled += 1
+                    self._decrease("rate limit error")
+            if self._round_completed >= max(self._limit, self.min_round_size):
+                self._end_round()
+        self._wake_waiters()
+
+    def record_retry(self, error: t.Optional[BaseException] = None) -> None:
+        """Record a retried call. Safe to call from worker threads."""
+        with self._lock:
+            self._retries += 1
+            self._round_errors += 1
+            if error is not None and is_rate_limit_error(error):
+                self._throttled += 1
+                self._decrease("rate limit retry")
+
+    def _end_round(self) -> None:
+        p95 = self._p95()
+        error_rate = self._round_errors / max(self._round_completed, 1)
+        if error_rate > self.error_rate_threshold:
+            self._decrease(f"error rate {error_rate:.2f}")
+        elif (
+            p95 is not None
+            and self._baseline_p95 is not None
+            and p95 > self.latency_tolerance * self._baseline_p95
+        ):
+            self._decrease(f"p95 latency {p95:.2f}s")
+        else:
+            if p95 is not None:
+                # drop to faster observations at once, drift up slowly otherwise
+                self._baseline_p95 = (
+                    p95
+                    if self._baseline_p95 is None
+                    else min(p95, 0.9 * self._baseline_p95 + 0.1 * p95)
+                )
+            if self._round_saturated and self._limit < self.max_limit:
+                self._limit = min(self._limit + self.increase_step, self.max_limit)
+                self._peak_limit = max(self._peak_limit, self._limit)
+                self._increases += 1
+        self._reset_round()
+
+    def _decrease(self, reason: str) -> None:
+        if self._round_decreased:
+            return
+        new_limit = max(self.min_limit, int(self._limit * self.decrease_factor))
+        if new_limit < self._limit:
+            logger.debug(
+                "Reducing concurrency from %d to %d (%s)",
+                self._limit,
+                new_limit,
+                reason,
+            )
+            self._limit = new_limit
+            self._decreases += 1
+        # latencies observed at the old limit say nothing about the new one
+        self._latencies.clear()
+        self._reset_round()
+        self._round_decreased = True
+
+    def _reset_round(self) -> None:
+        self._round_completed = 0
+        self._round_errors = 0
+        self._round_saturated = False
+        self._round_decreased = False
+
+    def _p95(self) -> t.Optional[float]:
+        if not self._latencies:
+            return None
+        ordered = sorted(self._latencies)
+        return ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))]
+
+    def _wake_waiters(self) -> None:
+        free = self._limit - self._in_flight
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.get_loop().call_soon_threadsafe(_set_waiter_result, waiter)
+                free -= 1
+
+
+def _set_waiter_result(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+def get_current_limiter() -> t.Optional[AdaptiveConcurrencyLimiter]:
+    """Return the limiter the current job runs under, if any."""
+    return _current_limiter.get()
+
+
+def report_failure(error: BaseException) -> None:
+    """
+    Report that the current job failed although it returns normally (e.g. its
+    error is turned into a NaN result), so the limiter counts it as an error.
+    """
+    failures = _job_failures.get()
+    if failures is not None:
+        failures.append(error)
+
+
+def report_retry(error: t.Optional[BaseException] = None) -> None:
+    """Report a retried call to the limiter the current job runs under, if any."""
+    limiter = _current_limiter.get()
+    if limiter is not None:
+        limiter.record_retry(error)
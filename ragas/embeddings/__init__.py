@@ -8,11 +8,13 @@ from ragas.embeddings.base import (
     LlamaIndexEmbeddingsWrapper as _LlamaIndexEmbeddingsWrapper,
     embedding_factory as _embedding_factory,
 )
+from ragas.embeddings.batching import BatchingEmbeddings
 from ragas.embeddings.google_provider import GoogleEmbeddings
 from ragas.embeddings.haystack_wrapper import HaystackEmbeddingsWrapper
 from ragas.embeddings.huggingface_provider import HuggingFaceEmbeddings
 from ragas.embeddings.litellm_provider import LiteLLMEmbeddings
 from ragas.embeddings.openai_provider import OpenAIEmbeddings
+from ragas.embeddings.store import EmbeddingStore, StoredEmbeddings
 
 # Utilities
 from ragas.embeddings.utils import batch_texts, get_optimal_batch_size, validate_texts
@@ -66,6 +68,9 @@ __all__ = [
     "GoogleEmbeddings",
     "LiteLLMEmbeddings",
     "HuggingFaceEmbeddings",
+    "BatchingEmbeddings",
+    "EmbeddingStore",
+    "StoredEmbeddings",
     # Utilities
     "validate_texts",
     "batch_texts",
@@ -12,9 +12,14 @@ from langchain_openai.embeddings import OpenAIEmbeddings
 from pydantic.dataclasses import dataclass
 from pydantic_core import CoreSchema, core_schema
 
+from ragas import rate_limit
 from ragas._analytics import EmbeddingUsageEvent, track
-from ragas.cache import CacheInterface, cacher
-from ragas.embeddings.utils import run_async_in_current_loop, validate_texts
+from ragas.cache import CacheInterface, cacher, register_cache_key
+from ragas.embeddings.utils import (
+    run_async_in_current_loop,
+    run_in_encode_pool,
+    validate_texts,
+)
 from ragas.run_config import RunConfig, add_async_retry, add_retry
 
 if t.TYPE_CHECKING:
@@ -243,6 +248,35 @@ class BaseRagasEmbeddings(Embeddings, ABC):
         )
 
 
+def _unwrap_embeddings(embedding: t.Any) -> t.Any:
+    """The innermost embeddings behind (possibly nested) wrappers."""
+    target = embedding
+    seen = {id(target)}
+    inner = getattr(target, "embeddings", None)
+    while inner is not None and id(inner) not in seen:
+        seen.add(id(inner))
+        target = inner
+        inner = getattr(target, "embeddings", None)
+    return target
+
+
+def _embedding_cache_key(
+    embedding: t.Union[BaseRagasEmbedding, BaseRagasEmbeddings],
+) -> t.Tuple[str, t.Optional[str], t.Optional[bool]]:
+    # wrappers are identified by the embeddings they wrap, not by their clients
+    target = _unwrap_embeddings(embedding)
+    model = getattr(target, "model_name", None) or getattr(target, "model", None)
+    return (
+        type(target).__qualname__,
+        model if isinstance(model, str) else None,
+        getattr(target, "normalize_embeddings", None),
+    )
+
+
+register_cache_key(BaseRagasEmbedding, _embedding_cache_key)
+register_cache_key(BaseRagasEmbeddings, _embedding_cache_key)
+
+
 class LangchainEmbeddingsWrapper(BaseRagasEmbeddings):
     """
     Wrapper for any embeddings from langchain.
@@ -286,6 +320,9 @@ class LangchainEmbeddingsWrapper(BaseRagasEmbeddings):
         """
         Embed a single query text.
         """
+        rate_limit.acquire_sync(
+            "langchain", getattr(self.embeddings, "model", None), text
+        )
         result = self.embeddings.embed_query(text)
 
         # Track usage
@@ -304,6 +341,9 @@ class LangchainEmbeddingsWrapper(BaseRagasEmbeddings):
         """
         Embed multiple documents.
         """
+        rate_limit.acquire_sync(
+            "langchain", getattr(self.embeddings, "model", None), texts
+        )
         result = self.embeddings.embed_documents(texts)
 
         # Track usage
@@ -322,6 +362,9 @@ class LangchainEmbeddingsWrapper(BaseRagasEmbeddings):
         """
         Asynchronously embed a single query text.
         """
+        await rate_limit.acquire(
+            "langchain", getattr(self.embeddings, "model", None), text
+        )
         result = await self.embeddings.aembed_query(text)
 
         # Track usage
@@ -340,6 +383,9 @@ class LangchainEmbeddingsWrapper(BaseRagasEmbeddings):
         """
         Asynchronously embed multiple documents.
         """
+        await rate_limit.acquire(
+            "langchain", getattr(self.embeddings, "model", None), texts
+        )
         result = await self.embeddings.aembed_documents(texts)
 
         # Track usage
@@ -492,6 +538,18 @@ class HuggingfaceEmbeddings(BaseRagasEmbeddings):
         assert isinstance(embeddings, Tensor)
         return embeddings.tolist()
 
+    async def aembed_query(self, text: str) -> t.List[float]:
+        """
+        Embed a single query text on the encode thread pool.
+        """
+        return await run_in_encode_pool(self.embed_query, text)
+
+    async def aembed_documents(self, texts: t.List[str]) -> t.List[t.List[float]]:
+        """
+        Embed multiple documents on the encode thread pool.
+        """
+        return await run_in_encode_pool(self.embed_documents, texts)
+
     def predict(self, texts: t.List[t.List[str]]) -> t.List[t.List[float]]:
         """
         Make predictions using a cross-encoder model.
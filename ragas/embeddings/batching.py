@@ -0,0 +1,151 @@
+"""Coalesce concurrent single-text embedding calls into batch requests."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import typing as t
+from dataclasses import dataclass, field
+
+from ragas.embeddings.base import BaseRagasEmbedding
+from ragas.embeddings.utils import aembed_texts_any
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _PendingBatch:
+    loop: asyncio.AbstractEventLoop
+    # text -> futures of the callers waiting for its embedding
+    waiters: t.Dict[str, t.List[asyncio.Future]] = field(default_factory=dict)
+    timer: t.Optional[asyncio.TimerHandle] = None
+
+
+class BatchingEmbeddings(BaseRagasEmbedding):
+    """
+    Dispatcher that turns concurrent `aembed_text` calls into `aembed_texts` batches.
+
+    Single-text requests are collected for up to ``max_wait_ms`` milliseconds, or
+    until ``batch_size`` distinct texts are waiting, and sent to the wrapped
+    embeddings as one `aembed_texts` call. Each caller then receives its own
+    embedding, so metrics and extractors that embed one text at a time get batch
+    throughput without any change. Identical texts in a batch are embedded once,
+    and a failed batch request fails every caller in it.
+
+    Calls with extra keyword arguments and the sync and batch methods go straight
+    to the wrapped embeddings. Embeddings with a sync client are sent the batches
+    through `embed_texts` in a worker thread.
+
+    Parameters
+    ----------
+    embeddings : BaseRagasEmbedding
+        The embeddings to send the batches to.
+    batch_size : int
+        Maximum number of texts per batch request.
+    max_wait_ms : float
+        How long a request waits for others to join its batch.
+
+    Examples
+    --------
+    >>> from ragas.embeddings import BatchingEmbeddings, HuggingFaceEmbeddings
+    >>> embeddings = BatchingEmbeddings(HuggingFaceEmbeddings(), batch_size=128)
+    >>> EmbeddingExtractor(embedding_model=embeddings)
+    """
+
+    is_async = True
+
+    def __init__(
+        self,
+        embeddings: BaseRagasEmbedding,
+        batch_size: int = 64,
+        max_wait_ms: float = 5.0,
+    ):
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if max_wait_ms < 0:
+            raise ValueError("max_wait_ms must not be negative")
+        self.embeddings = embeddings
+        self.batch_size = batch_size
+        self.max_wait_ms = max_wait_ms
+        self._pending: t.Optional[_PendingBatch] = None
+        self._in_flight: t.Set[asyncio.Task] = set()
+        self.requests = 0
+        self.batches = 0
+
+    def embed_text(self, text: str, **kwargs: t.Any) -> t.List[float]:
+        return self.embeddings.embed_text(text, **kwargs)
+
+    def embed_texts(self, texts: t.List[str], **kwargs: t.Any) -> t.List[t.List[float]]:
+        return self.embeddings.embed_texts(texts, **kwargs)
+
+    async def aembed_texts(
+        self, texts: t.List[str], **kwargs: t.Any
+    ) -> t.List[t.List[float]]:
+        return await aembed_texts_any(self.embeddings, texts, **kwargs)
+
+    async def aembed_text(self, text: str, **kwargs: t.Any) -> t.List[float]:
+        if kwargs:
+            return (await aembed_texts_any(self.embeddings, [text], **kwargs))[0]
+
+        loop = asyncio.get_running_loop()
+        pending = self._pending
+        if pending is None or pending.loop is not loop:
+            # batches never span event loops (e.g. successive `asyncio.run` calls)
+            pending = self._pending = _PendingBatch(loop)
+
+        future = loop.create_future()
+        pending.waiters.setdefault(text, []).append(future)
+        self.requests += 1
+        if len(pending.waiters) >= self.batch_size:
+            self._flush(pending)
+        elif pending.timer is None:
+            pending.timer = loop.call_later(
+                self.max_wait_ms / 1000.0, self._flush, pending
+            )
+        return await future
+
+    def _flush(self, pending: _PendingBatch) -> None:
+        if pending.timer is not None:
+            pending.timer.cancel()
+            pending.timer = None
+        if self._pending is pending:
+            self._pending = None
+        if not pending.waiters:
+            return
+        self.batches += 1
+        task = pending.loop.create_task(self._send(pending.waiters))
+        # keep a reference so the task is not garbage collected mid-flight
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+
+    async def _send(self, waiters: t.Dict[str, t.List[asyncio.Future]]) -> None:
+        texts = list(waiters)
+        try:
+            embeddings = await aembed_texts_any(self.embeddings, texts)
+            if len(embeddings) != len(texts):
+                raise ValueError(
+                    f"Expected {len(texts)} embeddings from the batch request, "
+                    f"got {len(embeddings)}"
+                )
+        except BaseException as e:
+            logger.debug("Embedding batch of %d texts failed: %s", len(texts), e)
+            for futures in waiters.values():
+                for future in futures:
+                    if not future.done():
+                        if isinstance(e, asyncio.CancelledError):
+                            future.cancel()
+                        else:
+                            future.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+            return
+        for text, embedding in zip(texts, embeddings):
+            for future in waiters[text]:
+                if not future.done():
+                    future.set_result(embedding)
+
+    def __repr__(self) -> str:
+        return (
+            f"BatchingEmbeddings(embeddings={self.embeddings!r}, "
+            f"batch_size={self.batch_size}, max_wait_ms={self.max_wait_ms})"
+        )
@@ -3,6 +3,8 @@
 import sys
 import typing as t
 
+from ragas import rate_limit
+
 from .base import BaseRagasEmbedding
 from .utils import run_sync_in_async, validate_texts
 
@@ -159,12 +161,14 @@ class GoogleEmbeddings(BaseRagasEmbedding):
 
         model = TextEmbeddingModel.from_pretrained(self.model)
         merged_kwargs = {**self.kwargs, **kwargs}
+        rate_limit.acquire_sync(self.PROVIDER_NAME, self.model, text)
         embeddings = model.get_embeddings([text], **merged_kwargs)
         return embeddings[0].values
 
     def _embed_text_genai(self, text: str, **kwargs: t.Any) -> t.List[float]:
         """Embed text using Google AI (Gemini)."""
         merged_kwargs = {**self.kwargs, **kwargs}
+        rate_limit.acquire_sync(self.PROVIDER_NAME, self.model, text)
         result = self.client.embed_content(
             model=f"models/{self.model}", content=text, **merged_kwargs
         )
@@ -202,6 +206,7 @@ class GoogleEmbeddings(BaseRagasEmbedding):
 
         model = TextEmbeddingModel.from_pretrained(self.model)
         merged_kwargs = {**self.kwargs, **kwargs}
+        rate_limit.acquire_sync(self.PROVIDER_NAME, self.model, texts)
         embeddings = model.get_embeddings(texts, **merged_kwargs)
         return [emb.values for emb in embeddings]
 
@@ -1,9 +1,17 @@
 """HuggingFace embeddings implementation supporting both local and API-based models."""
 
+import asyncio
+import threading
 import typing as t
+import weakref
+
+import numpy as np
+
+from ragas import rate_limit
+from ragas.async_utils import gather_bounded
 
 from .base import BaseRagasEmbedding
-from .utils import batch_texts, run_sync_in_async, validate_texts
+from .utils import batch_texts, run_in_encode_pool, validate_texts
 
 
 class HuggingFaceEmbeddings(BaseRagasEmbedding):
@@ -11,6 +19,17 @@ class HuggingFaceEmbeddings(BaseRagasEmbedding):
 
     Supports sentence-transformers for local models and HuggingFace API for
     hosted models. Provides efficient batch processing and caching.
+
+    On multi-core CPU hosts, set ``num_workers`` to 2 or more to encode large
+    local batches with a pool of worker processes; texts are sorted by length
+    before they are split across the workers so each chunk pads as little as
+    possible. Call `close` to stop the pool early (it is stopped at exit
+    otherwise). Set
+    ``return_numpy`` to get float32 NumPy arrays instead of lists of floats.
+
+    In API mode each batch of ``batch_size`` texts is sent as one request. The
+    async methods use an `AsyncInferenceClient` kept per event loop and send up
+    to ``max_concurrency`` batches at a time.
     """
 
     PROVIDER_NAME = "huggingface"
@@ -24,15 +43,30 @@ class HuggingFaceEmbeddings(BaseRagasEmbedding):
         device: t.Optional[str] = None,
         normalize_embeddings: bool = True,
         batch_size: int = 32,
+        num_workers: int = 0,
+        return_numpy: bool = False,
+        max_concurrency: int = 4,
         **model_kwargs: t.Any,
     ):
+        if num_workers == 1 or num_workers < 0:
+            raise ValueError(
+                "num_workers must be 0 (no worker pool) or at least 2, "
+                f"got {num_workers}"
+            )
         self.model = model
         self.use_api = use_api
         self.api_key = api_key
         self.device = device
         self.normalize_embeddings = normalize_embeddings
         self.batch_size = batch_size
+        self.num_workers = num_workers
+        self.return_numpy = return_numpy
+        self.max_concurrency = max_concurrency
         self.model_kwargs = model_kwargs
+        self._pool: t.Optional[t.Dict[str, t.Any]] = None
+        self._pool_finalizer: t.Optional[weakref.finalize] = None
+        # a pool serves one encode at a time: results come back on a shared queue
+        self._pool_lock = threading.Lock()
 
         if use_api:
             self._setup_api_client()
@@ -53,6 +87,36 @@ class HuggingFaceEmbeddings(BaseRagasEmbedding):
             model=self.model,
             token=self.api_key,
         )
+        # async clients are bound to the event loop they are used on
+        self._async_clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, t.Any
+        ] = weakref.WeakKeyDictionary()
+
+    def _get_async_client(self) -> t.Any:
+        """Return the async API client of the running event loop."""
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            from huggingface_hub import AsyncInferenceClient
+
+            client = self._async_clients[loop] = AsyncInferenceClient(
+                model=self.model,
+                token=self.api_key,
+            )
+        return client
+
+    @staticmethod
+    def _parse_api_response(response: t.Any, n_texts: int) -> np.ndarray:
+        """Turn a feature-extraction response into one row per input text."""
+        embeddings = np.asarray(response, dtype=np.float32)
+        if embeddings.ndim == 1:
+            embeddings = embeddings[None, :]
+        if embeddings.ndim != 2 or embeddings.shape[0] != n_texts:
+            raise ValueError(
+                f"Expected {n_texts} pooled embeddings from the HuggingFace API, "
+                f"got an array of shape {embeddings.shape}"
+            )
+        return embeddings
 
     def _setup_local_model(self):
         """Setup local sentence-transformers model."""
@@ -77,30 +141,47 @@ class HuggingFaceEmbeddings(BaseRagasEmbedding):
 
     def _embed_text_api(self, text: str, **kwargs: t.Any) -> t.List[float]:
         """Embed text using HuggingFace API."""
-        response = self.client.feature_extraction(text, **kwargs)
-        # HuggingFace API returns nested list for single text
-        if isinstance(response[0], list):
-            return list(response[0])
-        return list(response)
+        return self._to_output(self._embed_batch_api([text], **kwargs)[0])
+
+    def _embed_batch_api(self, texts: t.List[str], **kwargs: t.Any) -> np.ndarray:
+        """Embed a batch of texts with one API request."""
+        rate_limit.acquire_sync(self.PROVIDER_NAME, self.model, texts)
+        response = self.client.feature_extraction(texts, **kwargs)
+        return self._parse_api_response(response, len(texts))
+
+    async def _aembed_batch_api(
+        self, texts: t.List[str], **kwargs: t.Any
+    ) -> np.ndarray:
+        """Asynchronously embed a batch of texts with one API request."""
+        await rate_limit.acquire(self.PROVIDER_NAME, self.model, texts)
+        response = await self._get_async_client().feature_extraction(texts, **kwargs)
+        return self._parse_api_response(response, len(texts))
 
     def _embed_text_local(self, text: str, **kwargs: t.Any) -> t.List[float]:
         """Embed text using local sentence-transformers model."""
         embedding = self.model_instance.encode(
             text, normalize_embeddings=self.normalize_embeddings, **kwargs
         )
-        return embedding.tolist()
+        return self._to_output(embedding)
+
+    def _to_output(self, embeddings: t.Any) -> t.Any:
+        """Return embeddings as float32 arrays or as lists of floats."""
+        if self.return_numpy:
+            return np.asarray(embeddings, dtype=np.float32)
+        if isinstance(embeddings, np.ndarray):
+            return embeddings.tolist()
+        return embeddings
 
     async def aembed_text(self, text: str, **kwargs: t.Any) -> t.List[float]:
         """Asynchronously embed a single text using HuggingFace."""
         if self.use_api:
             return await self._aembed_text_api(text, **kwargs)
         else:
-            return await run_sync_in_async(self._embed_text_local, text, **kwargs)
+            return await run_in_encode_pool(self._embed_text_local, text, **kwargs)
 
     async def _aembed_text_api(self, text: str, **kwargs: t.Any) -> t.List[float]:
         """Asynchronously embed text using HuggingFace API."""
-        # HuggingFace hub doesn't have native async support
-        return await run_sync_in_async(self._embed_text_api, text, **kwargs)
+        return self._to_output((await self._aembed_batch_api([text], **kwargs))[0])
 
     def embed_texts(self, texts: t.List[str], **kwargs: t.Any) -> t.List[t.List[float]]:
         """Embed multiple texts using HuggingFace with batching."""
@@ -116,34 +197,75 @@ class HuggingFaceEmbeddings(BaseRagasEmbedding):
     def _embed_texts_api(
         self, texts: t.List[str], **kwargs: t.Any
     ) -> t.List[t.List[float]]:
-        """Embed multiple texts using HuggingFace API with batching."""
-        embeddings = []
-        batches = batch_texts(texts, self.batch_size)
-
-        for batch in batches:
-            # HuggingFace API can handle batch processing
-            batch_embeddings = []
-            for text in batch:
-                response = self.client.feature_extraction(text, **kwargs)
-                if isinstance(response[0], list):
-                    batch_embeddings.append(list(response[0]))
-                else:
-                    batch_embeddings.append(list(response))
-            embeddings.extend(batch_embeddings)
-
-        return embeddings
+        """Embed multiple texts using HuggingFace API, one request per batch."""
+        embeddings = [
+            self._embed_batch_api(batch, **kwargs)
+            for batch in batch_texts(texts, self.batch_size)
+        ]
+        return self._to_output(np.concatenate(embeddings))
+
+    async def _aembed_texts_api(
+        self, texts: t.List[str], **kwargs: t.Any
+    ) -> t.List[t.List[float]]:
+        """Asynchronously embed texts using HuggingFace API, batches concurrently."""
+        embeddings = await gather_bounded(
+            (
+                self._aembed_batch_api(batch, **kwargs)
+                for batch in batch_texts(texts, self.batch_size)
+            ),
+            max_concurrency=self.max_concurrency,
+        )
+        return self._to_output(np.concatenate(embeddings))
 
     def _embed_texts_local(
         self, texts: t.List[str], **kwargs: t.Any
     ) -> t.List[t.List[float]]:
         """Embed multiple texts using local sentence-transformers model."""
+        if self.num_workers > 1 and not kwargs and len(texts) > self.batch_size:
+            return self._to_output(self._encode_multi_process(texts))
         embeddings = self.model_instance.encode(
             texts,
             normalize_embeddings=self.normalize_embeddings,
             batch_size=self.batch_size,
             **kwargs,
         )
-        return embeddings.tolist()
+        return self._to_output(embeddings)
+
+    def _encode_multi_process(self, texts: t.List[str]) -> np.ndarray:
+        """Encode texts with the worker process pool, in their original order."""
+        # encode() sorts by length only within the chunk each worker receives;
+        # sorting up front gives every chunk texts of similar length
+        order = np.argsort([len(text) for text in texts], kind="stable")
+        with self._pool_lock:
+            encoded = self.model_instance.encode_multi_process(
+                [texts[i] for i in order],
+                self._get_pool(),
+                batch_size=self.batch_size,
+                normalize_embeddings=self.normalize_embeddings,
+            )
+        embeddings = np.empty_like(encoded)
+        embeddings[order] = encoded
+        return embeddings
+
+    def _get_pool(self) -> t.Dict[str, t.Any]:
+        if self._pool is None:
+            from sentence_transformers import SentenceTransformer
+
+            self._pool = self.model_instance.start_multi_process_pool(
+                target_devices=[self.device or "cpu"] * self.num_workers
+            )
+            self._pool_finalizer = weakref.finalize(
+                self, SentenceTransformer.stop_multi_process_pool, self._pool
+            )
+        return self._pool
+
+    def close(self) -> None:
+        """Stop the encode worker processes, if they were started."""
+        with self._pool_lock:
+            if self._pool_finalizer is not None:
+                self._pool_finalizer()
+            self._pool = None
+            self._pool_finalizer = None
 
     async def aembed_texts(
         self, texts: t.List[str], **kwargs: t.Any
@@ -154,9 +276,9 @@ class HuggingFaceEmbeddings(BaseRagasEmbedding):
             return []
 
         if self.use_api:
-            return await run_sync_in_async(self._embed_texts_api, texts, **kwargs)
+            return await self._aembed_texts_api(texts, **kwargs)
         else:
-            return await run_sync_in_async(self._embed_texts_local, texts, **kwargs)
+            return await run_in_encode_pool(self._embed_texts_local, texts, **kwargs)
 
     def _get_client_info(self) -> str:
         """Get client type information."""
@@ -179,6 +301,12 @@ class HuggingFaceEmbeddings(BaseRagasEmbedding):
 
         if self.batch_size != 32:  # Only show if different from default
             config_parts.append(f"batch_size={self.batch_size}")
+        if self.num_workers:
+            config_parts.append(f"num_workers={self.num_workers}")
+        if self.return_numpy:
+            config_parts.append("return_numpy=True")
+        if self.use_api and self.max_concurrency != 4:
+            config_parts.append(f"max_concurrency={self.max_concurrency}")
 
         # Show count of other model kwargs if there are any
         if self.model_kwargs:
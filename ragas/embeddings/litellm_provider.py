@@ -2,6 +2,8 @@
 
 import typing as t
 
+from ragas import rate_limit
+
 from .base import BaseRagasEmbedding
 from .utils import batch_texts, get_optimal_batch_size, safe_import, validate_texts
 
@@ -59,12 +61,14 @@ class LiteLLMEmbeddings(BaseRagasEmbedding):
     def embed_text(self, text: str, **kwargs: t.Any) -> t.List[float]:
         """Embed a single text using LiteLLM."""
         call_kwargs = self._prepare_kwargs(**kwargs)
+        rate_limit.acquire_sync(self.PROVIDER_NAME, self.model, text)
         response = self.litellm.embedding(input=[text], **call_kwargs)
         return response.data[0]["embedding"]
 
     async def aembed_text(self, text: str, **kwargs: t.Any) -> t.List[float]:
         """Asynchronously embed a single text using LiteLLM."""
         call_kwargs = self._prepare_kwargs(**kwargs)
+        await rate_limit.acquire(self.PROVIDER_NAME, self.model, text)
         response = await self.litellm.aembedding(input=[text], **call_kwargs)
         return response.data[0]["embedding"]
 
@@ -79,6 +83,7 @@ class LiteLLMEmbeddings(BaseRagasEmbedding):
 
         for batch in batches:
             call_kwargs = self._prepare_kwargs(**kwargs)
+            rate_limit.acquire_sync(self.PROVIDER_NAME, self.model, batch)
             response = self.litellm.embedding(input=batch, **call_kwargs)
             embeddings.extend([item["embedding"] for item in response.data])
 
@@ -97,6 +102,7 @@ class LiteLLMEmbeddings(BaseRagasEmbedding):
 
         for batch in batches:
             call_kwargs = self._prepare_kwargs(**kwargs)
+            await rate_limit.acquire(self.PROVIDER_NAME, self.model, batch)
             response = await self.litellm.aembedding(input=batch, **call_kwargs)
             embeddings.extend([item["embedding"] for item in response.data])
 
@@ -1,5 +1,6 @@
 import typing as t
 
+from ragas import rate_limit
 from ragas._analytics import EmbeddingUsageEvent, track
 
 from .base import BaseRagasEmbedding
@@ -30,6 +31,7 @@ class OpenAIEmbeddings(BaseRagasEmbedding):
         if self.is_async:
             result = self._run_async_in_current_loop(self.aembed_text(text, **kwargs))
         else:
+            rate_limit.acquire_sync("openai", self.model, text)
             response = self.client.embeddings.create(
                 input=text, model=self.model, **kwargs
             )
@@ -54,6 +56,7 @@ class OpenAIEmbeddings(BaseRagasEmbedding):
                 "Cannot use aembed_text() with a synchronous client. Use embed_text() instead."
             )
 
+        await rate_limit.acquire("openai", self.model, text)
         response = await self.client.embeddings.create(
             input=text, model=self.model, **kwargs
         )
@@ -81,6 +84,7 @@ class OpenAIEmbeddings(BaseRagasEmbedding):
             result = self._run_async_in_current_loop(self.aembed_texts(texts, **kwargs))
         else:
             # OpenAI supports batch embedding natively
+            rate_limit.acquire_sync("openai", self.model, texts)
             response = self.client.embeddings.create(
                 input=texts, model=self.model, **kwargs
             )
@@ -111,6 +115,7 @@ class OpenAIEmbeddings(BaseRagasEmbedding):
                 "Cannot use aembed_texts() with a synchronous client. Use embed_texts() instead."
             )
 
+        await rate_limit.acquire("openai", self.model, texts)
         response = await self.client.embeddings.create(
             input=texts, model=self.model, **kwargs
         )
@@ -0,0 +1,309 @@
+"""Persistent, content-addressed store for embedding vectors."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import typing as t
+from pathlib import Path
+
+import numpy as np
+
+from ragas.cache import _CacheKeyBuilder
+from ragas.embeddings.base import (
+    BaseRagasEmbedding,
+    _embedding_cache_key,
+    _unwrap_embeddings,
+)
+from ragas.embeddings.utils import aembed_texts_any
+
+DIGEST_SIZE = 16
+
+
+def text_digest(text: str) -> bytes:
+    """Content address of a text."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=DIGEST_SIZE).digest()
+
+
+class _Namespace:
+    """
+    Vectors of one embedding model.
+
+    On disk a namespace is three files sharing a prefix:
+
+    - ``<ns>.json``: the model key and the vector dimension.
+    - ``<ns>.index``: the text digests, ``DIGEST_SIZE`` bytes each, in row order.
+    - ``<ns>.f32``: the float32 matrix, one row per digest, opened memory-mapped.
+
+    Both data files are append-only. A row exists once both its digest and its
+    vector are written; a half-written row is dropped on load.
+    """
+
+    def __init__(self, name: str, model_key: t.Any, path: t.Optional[Path]):
+        self.name = name
+        self.model_key = model_key
+        self.path = path
+        self.dim: t.Optional[int] = None
+        self.rows: t.Dict[bytes, int] = {}
+        self.n_rows = 0
+        self._matrix: t.Optional[np.ndarray] = None
+        # rows added since the matrix was last (re)opened
+        self._pending: t.List[np.ndarray] = []
+        if path is not None:
+            self._load()
+
+    def _file(self, suffix: str) -> Path:
+        assert self.path is not None
+        return self.path / f"{self.name}{suffix}"
+
+    def _load(self) -> None:
+        meta_file = self._file(".json")
+        if not meta_file.exists():
+            return
+        self.dim = int(json.loads(meta_file.read_text())["dim"])
+        # the data files are missing if the first write was interrupted
+        index_file, vector_file = self._file(".index"), self._file(".f32")
+        digests = index_file.read_bytes() if index_file.exists() else b""
+        vector_bytes = vector_file.stat().st_size if vector_file.exists() else 0
+        n_rows = min(len(digests) // DIGEST_SIZE, vector_bytes // (4 * self.dim))
+        for row in range(n_rows):
+            digest = digests[row * DIGEST_SIZE : (row + 1) * DIGEST_SIZE]
+            self.rows.setdefault(digest, row)
+        # drop a row left half-written by an interrupted write, so that new
+        # rows stay aligned between the two files
+        for suffix, size in ((".index", DIGEST_SIZE), (".f32", 4 * self.dim)):
+            with open(self._file(suffix), "ab") as f:
+                f.truncate(n_rows * size)
+        self.n_rows = n_rows
+        self._open_matrix(n_rows)
+
+    def _open_matrix(self, n_rows: int) -> None:
+        if self.path is None or n_rows == 0 or self.dim is None:
+            return
+        self._matrix = np.memmap(
+            self._file(".f32"), dtype=np.float32, mode="r", shape=(n_rows, self.dim)
+        )
+        self._pending = []
+
+    def _row(self, row: int) -> np.ndarray:
+        n_matrix = 0 if self._matrix is None else self._matrix.shape[0]
+        if row < n_matrix:
+            return self._matrix[row]  # type: ignore[index]
+        return self._pending[row - n_matrix]
+
+    def get(self, digest: bytes) -> t.Optional[np.ndarray]:
+        row = self.rows.get(digest)
+        return None if row is None else self._row(row)
+
+    def add(self, digests: t.List[bytes], vectors: np.ndarray) -> None:
+        if self.dim is None:
+            self.dim = int(vectors.shape[1])
+            if self.path is not None:
+                self._file(".json").write_text(
+                    json.dumps({"model": repr(self.model_key), "dim": self.dim})
+                )
+        elif vectors.shape[1] != self.dim:
+            raise ValueError(
+                f"Expected embeddings of dimension {self.dim}, got {vectors.shape[1]}"
+            )
+        new_digests, new_vectors = [], []
+        for digest, vector in zip(digests, vectors):
+            if digest not in self.rows:
+                self.rows[digest] = self.n_rows + len(new_digests)
+                new_digests.append(digest)
+                new_vectors.append(vector)
+        if not new_digests:
+            return
+        if self.path is not None:
+            with open(self._file(".f32"), "ab") as f:
+                f.write(np.asarray(new_vectors, dtype=np.float32).tobytes())
+            with open(self._file(".index"), "ab") as f:
+                f.write(b"".join(new_digests))
+        self._pending.extend(np.asarray(new_vectors, dtype=np.float32))
+        self.n_rows += len(new_digests)
+
+    def compact(self) -> None:
+        """Re-open the memory map so it covers every row written so far."""
+        if self._pending:
+            self._open_matrix(self.n_rows)
+
+
+class EmbeddingStore:
+    """
+    Content-addressed store of embedding vectors, optionally persisted to disk.
+
+    Vectors are keyed by the embedding model (provider, model name and
+    normalisation, as used for cache keys) and a hash of the text. They are
+    stored as float32 rows of an append-only matrix per model, opened
+    memory-mapped when the store is loaded, so large corpora cost no memory
+    until their vectors are read. Use it through `StoredEmbeddings`.
+
+    Parameters
+    ----------
+    path : str or Path, optional
+        Directory holding the store. Created if missing. Without a path the
+        store lives in memory only.
+
+    Examples
+    --------
+    >>> from ragas.embeddings import EmbeddingStore, StoredEmbeddings
+    >>> store = EmbeddingStore("~/.cache/ragas/embeddings")
+    >>> embeddings = StoredEmbeddings(embeddings, store)
+    """
+
+    def __init__(self, path: t.Optional[t.Union[str, Path]] = None):
+        self.path = Path(path).expanduser() if path is not None else None
+        if self.path is not None:
+            self.path.mkdir(parents=True, exist_ok=True)
+        self._namespaces: t.Dict[str, _Namespace] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _namespace(self, model_key: t.Any) -> _Namespace:
+        builder = _CacheKeyBuilder()
+        builder.update(model_key)
+        name = builder.hexdigest()
+        namespace = self._namespaces.get(name)
+        if namespace is None:
+            namespace = self._namespaces[name] = _Namespace(name, model_key, self.path)
+        return namespace
+
+    def get_many(
+        self, model_key: t.Any, texts: t.Sequence[str]
+    ) -> t.List[t.Optional[np.ndarray]]:
+        """Look up the vectors of ``texts``; missing ones are None."""
+        with self._lock:
+            namespace = self._namespace(model_key)
+            vectors = [namespace.get(text_digest(text)) for text in texts]
+            found = sum(vector is not None for vector in vectors)
+            self.hits += found
+            self.misses += len(texts) - found
+            return vectors
+
+    def put_many(
+        self,
+        model_key: t.Any,
+        texts: t.Sequence[str],
+        vectors: t.Union[np.ndarray, t.Sequence[t.Sequence[float]]],
+    ) -> None:
+        """Store the vectors of ``texts``. Texts already stored are kept as is."""
+        if not texts:
+            return
+        matrix = np.asarray(vectors, dtype=np.float32)
+        if matrix.ndim != 2 or matrix.shape[0] != len(texts):
+            raise ValueError("Expected one embedding vector per text")
+        with self._lock:
+            self._namespace(model_key).add(
+                [text_digest(text) for text in texts], matrix
+            )
+
+    def compact(self) -> None:
+        """Memory-map vectors written since the store was opened."""
+        with self._lock:
+            for namespace in self._namespaces.values():
+                namespace.compact()
+
+    def __len__(self) -> int:
+        return sum(len(namespace.rows) for namespace in self._namespaces.values())
+
+    def __repr__(self) -> str:
+        return (
+            f"EmbeddingStore(path={str(self.path) if self.path else None!r}, "
+            f"hits={self.hits}, misses={self.misses})"
+        )
+
+
+class StoredEmbeddings(BaseRagasEmbedding):
+    """
+    Embeddings that look texts up in an `EmbeddingStore` before embedding them.
+
+    Texts missing from the store are embedded with one batch request to the
+    wrapped embeddings (duplicates once) and added to it. Wrap the embeddings
+    once and pass the result to the graph extractors, few-shot example stores
+    and metrics, so each text is embedded once across all of them; with a
+    persistent store, re-running on a stable corpus makes no embedding calls.
+    Vectors are returned as float32 values, whether they were stored or not,
+    and as a 2-D float32 array when the wrapped embeddings set ``return_numpy``.
+    Misses of embeddings with a sync client are embedded in a worker thread.
+
+    Parameters
+    ----------
+    embeddings : BaseRagasEmbedding
+        The embeddings used for texts missing from the store.
+    store : EmbeddingStore, optional
+        The store to use. Defaults to a new in-memory store.
+    """
+
+    is_async = True
+
+    def __init__(
+        self,
+        embeddings: BaseRagasEmbedding,
+        store: t.Optional[EmbeddingStore] = None,
+    ):
+        self.embeddings = embeddings
+        self.store = store if store is not None else EmbeddingStore()
+        self.model_key = _embedding_cache_key(embeddings)
+        self.return_numpy = bool(
+            getattr(_unwrap_embeddings(embeddings), "return_numpy", False)
+        )
+
+    def _split(
+        self, texts: t.List[str]
+    ) -> t.Tuple[t.List[t.Optional[np.ndarray]], t.List[str]]:
+        vectors = self.store.get_many(self.model_key, texts)
+        missing = list(
+            dict.fromkeys(text for text, v in zip(texts, vectors) if v is None)
+        )
+        return vectors, missing
+
+    def _merge(
+        self,
+        texts: t.List[str],
+        vectors: t.List[t.Optional[np.ndarray]],
+        missing: t.List[str],
+        computed: t.Sequence[t.Sequence[float]],
+    ) -> t.List[t.List[float]]:
+        if missing:
+            if len(computed) != len(missing):
+                raise ValueError(
+                    f"Expected {len(missing)} embeddings, got {len(computed)}"
+                )
+            self.store.put_many(self.model_key, missing, computed)
+            new = dict(zip(missing, np.asarray(computed, dtype=np.float32)))
+            vectors = [new[text] if v is None else v for text, v in zip(texts, vectors)]
+        if self.return_numpy:
+            matrix = (
+                np.stack(t.cast(t.List[np.ndarray], vectors))
+                if vectors
+                else np.empty((0, 0), dtype=np.float32)
+            )
+            return t.cast(t.List[t.List[float]], matrix)
+        return [t.cast(np.ndarray, v).tolist() for v in vectors]
+
+    def embed_text(self, text: str, **kwargs: t.Any) -> t.List[float]:
+        return self.embed_texts([text], **kwargs)[0]
+
+    async def aembed_text(self, text: str, **kwargs: t.Any) -> t.List[float]:
+        return (await self.aembed_texts([text], **kwargs))[0]
+
+    def embed_texts(self, texts: t.List[str], **kwargs: t.Any) -> t.List[t.List[float]]:
+        if kwargs:
+            return self.embeddings.embed_texts(texts, **kwargs)
+        vectors, missing = self._split(texts)
+        computed = self.embeddings.embed_texts(missing) if missing else []
+        return self._merge(texts, vectors, missing, computed)
+
+    async def aembed_texts(
+        self, texts: t.List[str], **kwargs: t.Any
+    ) -> t.List[t.List[float]]:
+        if kwargs:
+            return await aembed_texts_any(self.embeddings, texts, **kwargs)
+        vectors, missing = self._split(texts)
+        computed = await aembed_texts_any(self.embeddings, missing) if missing else []
+        return self._merge(texts, vectors, missing, computed)
+
+    def __repr__(self) -> str:
+        return f"StoredEmbeddings(embeddings={self.embeddings!r}, store={self.store!r})"
@@ -1,6 +1,7 @@
 """Shared utilities for embedding implementations."""
 
 import asyncio
+import functools
 import threading
 import typing as t
 from concurrent.futures import ThreadPoolExecutor
@@ -81,9 +82,66 @@ async def run_sync_in_async(func: t.Callable, *args, **kwargs) -> t.Any:
     Returns:
         The result of the function
     """
-    loop = asyncio.get_event_loop()
-    with ThreadPoolExecutor() as executor:
-        return await loop.run_in_executor(executor, lambda: func(*args, **kwargs))
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+
+
+_encode_executor: t.Optional[ThreadPoolExecutor] = None
+_encode_executor_lock = threading.Lock()
+
+
+def get_encode_executor() -> ThreadPoolExecutor:
+    """Thread pool dedicated to CPU-bound local model encoding.
+
+    A single worker runs one encode at a time: the model already parallelises
+    a batch across cores, and keeping encodes off the default executor leaves
+    it free for network-bound calls.
+    """
+    global _encode_executor
+    with _encode_executor_lock:
+        if _encode_executor is None:
+            _encode_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="ragas-encode"
+            )
+        return _encode_executor
+
+
+async def run_in_encode_pool(func: t.Callable, *args, **kwargs) -> t.Any:
+    """Run a CPU-bound encode function on the dedicated encode thread pool.
+
+    Args:
+        func: The sync function to run
+        *args: Arguments to pass to the function
+        **kwargs: Keyword arguments to pass to the function
+
+    Returns:
+        The result of the function
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_encode_executor(), functools.partial(func, *args, **kwargs)
+    )
+
+
+async def aembed_texts_any(
+    embeddings: t.Any, texts: t.List[str], **kwargs: t.Any
+) -> t.List[t.List[float]]:
+    """Embed texts from async code, whether the embeddings client is async or not.
+
+    Embeddings with ``is_async`` set to False (e.g. a sync OpenAI client) are
+    called through `embed_texts` in a worker thread.
+
+    Args:
+        embeddings: The embeddings to use
+        texts: The texts to embed
+        **kwargs: Keyword arguments to pass to the embeddings
+
+    Returns:
+        The embeddings of the texts
+    """
+    if getattr(embeddings, "is_async", True):
+        return await embeddings.aembed_texts(texts, **kwargs)
+    return await run_sync_in_async(embeddings.embed_texts, texts, **kwargs)
 
 
 def batch_texts(texts: t.List[str], batch_size: int) -> t.List[t.List[str]]:
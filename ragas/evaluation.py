@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import logging
 import typing as t
 from uuid import UUID
 
@@ -10,6 +11,7 @@ from langchain_core.language_models import BaseLanguageModel as LangchainLLM
 from tqdm.auto import tqdm
 
 from ragas._analytics import track_was_completed  # type: ignore
+from ragas.artifacts import ArtifactStore, use_artifact_store
 from ragas.callbacks import ChainType, RagasTracer, new_group
 from ragas.dataset_schema import (
     EvaluationDataset,
@@ -39,6 +41,7 @@ from ragas.metrics.base import (
     MultiTurnMetric,
     SingleTurnMetric,
 )
+from ragas.planner import EvaluationPlanner
 from ragas.run_config import RunConfig
 from ragas.utils import convert_v1_to_v2_dataset
 from ragas.validation import (
@@ -52,6 +55,8 @@ if t.TYPE_CHECKING:
 
     from ragas.cost import CostCallbackHandler, TokenUsageParser
 
+logger = logging.getLogger(__name__)
+
 RAGAS_EVALUATION_CHAIN_NAME = "ragas evaluation"
 
 
@@ -73,6 +78,7 @@ async def aevaluate(
     _run_id: t.Optional[UUID] = None,
     _pbar: t.Optional[tqdm] = None,
     return_executor: bool = False,
+    artifact_store: t.Optional[ArtifactStore] = None,
 ) -> t.Union[EvaluationResult, Executor]:
     """
     Async version of evaluate that performs evaluation without applying nest_asyncio.
@@ -233,6 +239,8 @@ async def aevaluate(
         metadata={"type": ChainType.EVALUATION},
     )
 
+    # jobs of the same sample send identical LLM requests only once
+    planner = EvaluationPlanner()
     sample_type = dataset.get_sample_type()
     for i, sample in enumerate(dataset):
         row = t.cast(t.Dict[str, t.Any], sample.model_dump())
@@ -246,7 +254,7 @@ async def aevaluate(
         if sample_type == SingleTurnSample:
             _ = [
                 executor.submit(
-                    metric.single_turn_ascore,
+                    planner.wrap(metric.single_turn_ascore, i),
                     sample,
                     row_group_cm,
                     name=f"{metric.name}-{i}",
@@ -258,7 +266,7 @@ async def aevaluate(
         elif sample_type == MultiTurnSample:
             _ = [
                 executor.submit(
-                    metric.multi_turn_ascore,
+                    planner.wrap(metric.multi_turn_ascore, i),
                     sample,
                     row_group_cm,
                     name=f"{metric.name}-{i}",
@@ -276,8 +284,16 @@ async def aevaluate(
 
     scores: t.List[t.Dict[str, t.Any]] = []
     try:
-        # get the results using async method
-        results = await executor.aresults()
+        # get the results using async method; metrics share intermediate
+        # artefacts (e.g. statement decompositions) for the duration of the run
+        with use_artifact_store(artifact_store):
+            results = await executor.aresults()
+        logger.debug(
+            "Evaluation sent %d of %d LLM requests, %d shared across metrics",
+            planner.stats.issued,
+            planner.stats.requests,
+            planner.stats.shared,
+        )
         if results == []:
             raise ExceptionInRunner()
 
@@ -358,6 +374,7 @@ def evaluate(
     _pbar: t.Optional[tqdm] = None,
     return_executor: bool = False,
     allow_nest_asyncio: bool = True,
+    artifact_store: t.Optional[ArtifactStore] = None,
 ) -> t.Union[EvaluationResult, Executor]:
     """
     Perform the evaluation on the dataset with different metrics
@@ -405,6 +422,11 @@ def evaluate(
     allow_nest_asyncio : bool, optional
         Whether to allow nest_asyncio patching for Jupyter compatibility.
         Set to False in production async applications to avoid event loop conflicts. Default is True.
+    artifact_store : ArtifactStore, optional
+        Store for intermediate results shared between metrics, such as the statements
+        a response is decomposed into. If not provided, a fresh in-memory store is used
+        for this call; pass one backed by a `DiskCacheBackend` to reuse them across runs.
+        Not used when `return_executor` is True.
 
     Returns
     -------
@@ -456,6 +478,7 @@ def evaluate(
             _run_id=_run_id,
             _pbar=_pbar,
             return_executor=return_executor,
+            artifact_store=artifact_store,
         )
 
     if not allow_nest_asyncio:
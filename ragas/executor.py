@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import threading
 import typing as t
@@ -8,7 +9,15 @@ from dataclasses import dataclass, field
 import numpy as np
 from tqdm.auto import tqdm
 
-from ragas.async_utils import apply_nest_asyncio, as_completed, process_futures, run
+from ragas.async_utils import (
+    apply_nest_asyncio,
+    as_completed,
+    as_ordered,
+    is_event_loop_running,
+    process_futures,
+    run,
+)
+from ragas.concurrency import AdaptiveConcurrencyLimiter, report_failure
 from ragas.run_config import RunConfig
 from ragas.utils import ProgressBarManager, batched
 
@@ -36,6 +45,13 @@ class Executor:
         Whether to batch (large) lists of tasks
     run_config : RunConfig
         Configuration for the run
+    stream_lookahead : int
+        Number of jobs that may be started or buffered ahead of the oldest
+        unfinished job when streaming results with `stream_results`
+    concurrency_limiter : AdaptiveConcurrencyLimiter, optional
+        Adaptive limiter used instead of a fixed `max_workers`. Created from the
+        run config when `RunConfig.adaptive_concurrency` is enabled; after a run,
+        its `limit` is the concurrency the executor settled on
     _nest_asyncio_applied : bool
         Whether nest_asyncio has been applied
     _cancel_event : threading.Event
@@ -50,6 +66,10 @@ class Executor:
     batch_size: t.Optional[int] = None
     run_config: t.Optional[RunConfig] = field(default=None, repr=False)
     pbar: t.Optional[tqdm] = None
+    stream_lookahead: int = 4
+    concurrency_limiter: t.Optional[AdaptiveConcurrencyLimiter] = field(
+        default=None, repr=False
+    )
     _jobs_processed: int = field(default=0, repr=False)
     _cancel_event: threading.Event = field(default_factory=threading.Event, repr=False)
 
@@ -72,6 +92,8 @@ class Executor:
                 if self.raise_exceptions:
                     raise e
                 else:
+                    # the job still returns, so tell the limiter it failed
+                    report_failure(e)
                     exec_name = type(e).__name__
                     exec_message = str(e)
                     logger.error(
@@ -107,6 +129,34 @@ class Executor:
         self.jobs.clear()
         self._jobs_processed = 0
 
+    def _get_max_workers(self) -> int:
+        return (
+            self.run_config.max_workers
+            if self.run_config and hasattr(self.run_config, "max_workers")
+            else -1
+        )
+
+    def _get_concurrency_limiter(self) -> t.Optional[AdaptiveConcurrencyLimiter]:
+        if self.concurrency_limiter is None and getattr(
+            self.run_config, "adaptive_concurrency", False
+        ):
+            self.concurrency_limiter = AdaptiveConcurrencyLimiter.from_run_config(
+                t.cast(RunConfig, self.run_config)
+            )
+        return self.concurrency_limiter
+
+    def _log_concurrency(self) -> None:
+        if self.concurrency_limiter is not None:
+            stats = self.concurrency_limiter.stats()
+            logger.info(
+                "%s: adaptive concurrency settled at %d workers (peak %d, %d throttled, %d retries)",
+                self.desc,
+                stats.limit,
+                stats.peak_limit,
+                stats.throttled,
+                stats.retries,
+            )
+
     async def _process_jobs(self) -> t.List[t.Any]:
         """Execute jobs with optional progress tracking."""
         if not self.jobs:
@@ -116,11 +166,7 @@ class Executor:
         jobs_to_process = self.jobs.copy()
         self.jobs.clear()
 
-        max_workers = (
-            self.run_config.max_workers
-            if self.run_config and hasattr(self.run_config, "max_workers")
-            else -1
-        )
+        max_workers = self._get_max_workers()
         results = []
         pbm = ProgressBarManager(self.desc, self.show_progress)
 
@@ -166,7 +212,10 @@ class Executor:
 
                 async for result in process_futures(
                     as_completed(
-                        coroutines, max_workers, cancel_check=self.is_cancelled
+                        coroutines,
+                        max_workers,
+                        cancel_check=self.is_cancelled,
+                        limiter=self._get_concurrency_limiter(),
                     )
                 ):
                     # If jobs are configured to raise exceptions, propagate immediately
@@ -182,7 +231,12 @@ class Executor:
         coroutines = [afunc(*args, **kwargs) for afunc, args, kwargs, _ in jobs]
 
         async for result in process_futures(
-            as_completed(coroutines, max_workers, cancel_check=self.is_cancelled)
+            as_completed(
+                coroutines,
+                max_workers,
+                cancel_check=self.is_cancelled,
+                limiter=self._get_concurrency_limiter(),
+            )
         ):
             # If jobs are configured to raise exceptions, propagate immediately
             if isinstance(result, Exception) and self.raise_exceptions:
@@ -198,6 +252,7 @@ class Executor:
         This is the async entry point for executing async jobs when already in an async context.
         """
         results = await self._process_jobs()
+        self._log_concurrency()
         sorted_results = sorted(results, key=lambda x: x[0])
         return [r[1] for r in sorted_results]
 
@@ -214,6 +269,110 @@ class Executor:
         apply_nest_asyncio()
         return run(_async_wrapper)
 
+    async def astream_results(
+        self, jobs: t.Optional[t.Iterable[t.Any]] = None
+    ) -> t.AsyncGenerator[t.Any, None]:
+        """
+        Execute jobs and yield their results in submission order as they become available.
+
+        Unlike `aresults`, jobs are started lazily: at most ``max_workers`` run at
+        once and at most ``max_workers + stream_lookahead`` are alive at any time,
+        so memory stays bounded regardless of the number of jobs.
+
+        Parameters
+        ----------
+        jobs : Iterable, optional
+            Lazy iterable of jobs. Each item is either an async callable taking no
+            arguments or a ``(callable, args, kwargs)`` tuple. If not given, the
+            jobs added with `submit` are used.
+        """
+        if jobs is None:
+            total: t.Optional[int] = len(self.jobs)
+            job_iter: t.Iterable[t.Any] = self.jobs.copy()
+            self.jobs.clear()
+        else:
+            total = len(jobs) if isinstance(jobs, t.Sized) else None
+            job_iter = self._index_jobs(jobs)
+
+        def _as_thunk(job):
+            afunc, args, kwargs, _ = job
+            return lambda: afunc(*args, **kwargs)
+
+        pbar = self.pbar
+        owns_pbar = pbar is None
+        if pbar is None:
+            pbm = ProgressBarManager(self.desc, self.show_progress)
+            pbar = pbm.create_single_bar(total)  # type: ignore[arg-type]
+
+        def _on_done(task: asyncio.Task) -> None:
+            if not task.cancelled():
+                pbar.update(1)
+
+        try:
+            async for _, result in as_ordered(
+                (_as_thunk(job) for job in job_iter),
+                self._get_max_workers(),
+                self.stream_lookahead,
+                cancel_check=self.is_cancelled,
+                on_done=_on_done,
+                limiter=self._get_concurrency_limiter(),
+            ):
+                yield result
+        finally:
+            if owns_pbar:
+                pbar.close()
+            self._log_concurrency()
+
+    def _index_jobs(self, jobs: t.Iterable[t.Any]) -> t.Iterator[t.Tuple]:
+        for job in jobs:
+            if callable(job):
+                afunc, args, kwargs = job, (), {}
+            else:
+                afunc, *rest = job
+                args = rest[0] if len(rest) > 0 else ()
+                kwargs = rest[1] if len(rest) > 1 else {}
+            yield (
+                self.wrap_callable_with_index(afunc, self._jobs_processed),
+                args,
+                kwargs,
+                None,
+            )
+            self._jobs_processed += 1
+
+    def stream_results(
+        self, jobs: t.Optional[t.Iterable[t.Any]] = None
+    ) -> t.Iterator[t.Any]:
+        """
+        Execute jobs and yield their results in submission order. See `astream_results`.
+
+        This is the sync entry point for streaming results, e.g. to write scores
+        to disk as they arrive.
+        """
+        if apply_nest_asyncio():
+            loop = asyncio.get_event_loop()
+            owns_loop = False
+        elif is_event_loop_running():
+            raise RuntimeError(
+                "Cannot stream results from inside a running event loop that does "
+                "not support nesting. Use `astream_results` instead."
+            )
+        else:
+            loop = asyncio.new_event_loop()
+            owns_loop = True
+
+        agen = self.astream_results(jobs)
+        try:
+            while True:
+                try:
+                    yield loop.run_until_complete(agen.__anext__())
+                except StopAsyncIteration:
+                    break
+        finally:
+            loop.run_until_complete(agen.aclose())
+            if owns_loop:
+                loop.run_until_complete(loop.shutdown_asyncgens())
+                loop.close()
+
 
 def run_async_batch(
     desc: str,
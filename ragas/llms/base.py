@@ -18,8 +18,9 @@ from langchain_openai.llms import AzureOpenAI, OpenAI
 from langchain_openai.llms.base import BaseOpenAI
 from pydantic import BaseModel
 
+from ragas import rate_limit
 from ragas._analytics import LLMUsageEvent, track
-from ragas.cache import CacheInterface, cacher
+from ragas.cache import CacheInterface, cacher, register_cache_key
 from ragas.exceptions import LLMDidNotFinishException
 from ragas.run_config import RunConfig, add_async_retry
 
@@ -230,6 +231,8 @@ class LangchainLLMWrapper(BaseRagasLLM):
             old_temperature = self.langchain_llm.temperature  # type: ignore
             self.langchain_llm.temperature = temperature  # type: ignore
 
+        provider, model = self._rate_limit_key()
+        rate_limit.acquire_sync(provider, model, prompt.to_string())
         if is_multiple_completion_supported(self.langchain_llm) and not self.bypass_n:
             result = self.langchain_llm.generate_prompt(
                 prompts=[prompt],
@@ -282,6 +285,9 @@ class LangchainLLMWrapper(BaseRagasLLM):
             old_temperature = self.langchain_llm.temperature  # type: ignore
             self.langchain_llm.temperature = temperature  # type: ignore
 
+        provider, model = self._rate_limit_key()
+        await rate_limit.acquire(provider, model, prompt.to_string())
+
         # handle n
         if hasattr(self.langchain_llm, "n") and not self.bypass_n:
             self.langchain_llm.n = n  # type: ignore
@@ -319,6 +325,20 @@ class LangchainLLMWrapper(BaseRagasLLM):
 
         return result
 
+    def _rate_limit_key(self) -> t.Tuple[t.Optional[str], t.Optional[str]]:
+        """Provider and model used to look up the shared rate limiter."""
+        provider = None
+        get_ls_params = getattr(self.langchain_llm, "_get_ls_params", None)
+        if get_ls_params is not None:
+            try:
+                provider = get_ls_params().get("ls_provider")
+            except Exception:
+                provider = None
+        model = getattr(self.langchain_llm, "model_name", None) or getattr(
+            self.langchain_llm, "model", None
+        )
+        return provider or "langchain", model
+
     def set_run_config(self, run_config: RunConfig):
         self.run_config = run_config
 
@@ -339,6 +359,15 @@ class LangchainLLMWrapper(BaseRagasLLM):
         return f"{self.__class__.__name__}(langchain_llm={self.langchain_llm.__class__.__name__}(...))"
 
 
+def _ragas_llm_cache_key(llm: BaseRagasLLM) -> t.Tuple[str, t.Optional[str]]:
+    inner = getattr(llm, "langchain_llm", None) or getattr(llm, "llm", None)
+    model = getattr(inner, "model_name", None) or getattr(inner, "model", None)
+    return type(inner).__qualname__, model if isinstance(model, str) else None
+
+
+register_cache_key(BaseRagasLLM, _ragas_llm_cache_key)
+
+
 class LlamaIndexLLMWrapper(BaseRagasLLM):
     """
     A Adaptor for LlamaIndex LLMs
@@ -660,6 +689,16 @@ class InstructorBaseRagasLLM(ABC):
         """Asynchronously generate a response using the configured LLM."""
 
 
+register_cache_key(
+    InstructorBaseRagasLLM,
+    lambda llm: (
+        getattr(llm, "provider", None),
+        getattr(llm, "model", None),
+        getattr(llm, "model_args", None),
+    ),
+)
+
+
 class InstructorLLM(InstructorBaseRagasLLM):
     """LLM wrapper using the Instructor library for structured outputs."""
 
@@ -947,6 +986,9 @@ class InstructorLLM(InstructorBaseRagasLLM):
         else:
             # Map parameters based on provider requirements
             provider_kwargs = self._map_provider_params()
+            rate_limit.acquire_sync(
+                self.provider, self.model, prompt, self._max_output_tokens()
+            )
 
             if self.provider.lower() == "google":
                 result = self.client.create(
@@ -991,6 +1033,9 @@ class InstructorLLM(InstructorBaseRagasLLM):
 
         # Map parameters based on provider requirements
         provider_kwargs = self._map_provider_params()
+        await rate_limit.acquire(
+            self.provider, self.model, prompt, self._max_output_tokens()
+        )
 
         if self.provider.lower() == "google":
             result = await self.client.create(
@@ -1019,6 +1064,14 @@ class InstructorLLM(InstructorBaseRagasLLM):
         )
         return result
 
+    def _max_output_tokens(self) -> int:
+        """Completion budget counted against tokens-per-minute limits."""
+        return int(
+            self.model_args.get("max_tokens")
+            or self.model_args.get("max_completion_tokens")
+            or 0
+        )
+
     def _get_client_info(self) -> str:
         """Get client type and async status information."""
         client_type = self.client.__class__.__name__
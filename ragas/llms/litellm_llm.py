@@ -4,6 +4,7 @@ import logging
 import threading
 import typing as t
 
+from ragas import rate_limit
 from ragas._analytics import LLMUsageEvent, track
 from ragas.llms.base import InstructorBaseRagasLLM, InstructorTypeVar
 
@@ -183,6 +184,9 @@ class LiteLLMStructuredLLM(InstructorBaseRagasLLM):
                 self.agenerate(prompt, response_model)
             )
         else:
+            rate_limit.acquire_sync(
+                self.provider, self.model, prompt, self.model_args.get("max_tokens", 0)
+            )
             # Call LiteLLM with structured output
             result = self.client.chat.completions.create(
                 model=self.model,
@@ -225,6 +229,9 @@ class LiteLLMStructuredLLM(InstructorBaseRagasLLM):
                 "Cannot use agenerate() with a synchronous client. Use generate() instead."
             )
 
+        await rate_limit.acquire(
+            self.provider, self.model, prompt, self.model_args.get("max_tokens", 0)
+        )
         # Call LiteLLM async with structured output
         result = await self.client.chat.completions.create(
             model=self.model,
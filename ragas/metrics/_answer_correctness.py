@@ -7,6 +7,7 @@ from dataclasses import dataclass, field
 import numpy as np
 from pydantic import BaseModel
 
+from ragas.artifacts import shared_artifact
 from ragas.dataset_schema import SingleTurnSample
 from ragas.metrics._answer_similarity import AnswerSimilarity
 from ragas.metrics._faithfulness import (
@@ -205,10 +206,14 @@ class AnswerCorrectness(MetricWithLLM, MetricWithEmbeddings, SingleTurnMetric):
         assert self.llm is not None, "llm is not set"
 
         prompt_input = StatementGeneratorInput(question=question, answer=text)
-        statements = await self.statement_generator_prompt.generate(
-            llm=self.llm,
-            data=prompt_input,
-            callbacks=callbacks,
+        statements = await shared_artifact(
+            "statements",
+            (self.statement_generator_prompt, prompt_input, self.llm),
+            lambda: self.statement_generator_prompt.generate(
+                llm=self.llm,
+                data=prompt_input,
+                callbacks=callbacks,
+            ),
         )
 
         return statements
@@ -82,14 +82,17 @@ class SemanticSimilarity(MetricWithEmbeddings, SingleTurnMetric):
             )
         else:
             # Handle both modern (BaseRagasEmbedding) and legacy (BaseRagasEmbeddings) interfaces
-            if hasattr(self.embeddings, "aembed_text"):
+            # both texts go in one async request
+            if hasattr(self.embeddings, "aembed_texts"):
                 # Modern interface (BaseRagasEmbedding)
-                embedding_1 = np.array(await self.embeddings.aembed_text(ground_truth))  # type: ignore[attr-defined]
-                embedding_2 = np.array(await self.embeddings.aembed_text(answer))  # type: ignore[attr-defined]
+                embedding_1, embedding_2 = np.array(
+                    await self.embeddings.aembed_texts([ground_truth, answer])  # type: ignore[attr-defined]
+                )
             else:
                 # Legacy interface (BaseRagasEmbeddings)
-                embedding_1 = np.array(await self.embeddings.embed_text(ground_truth))  # type: ignore[misc]
-                embedding_2 = np.array(await self.embeddings.embed_text(answer))  # type: ignore[misc]
+                embedding_1, embedding_2 = np.array(
+                    await self.embeddings.embed_texts([ground_truth, answer])  # type: ignore[misc]
+                )
             # Normalization factors of the above embeddings
             norms_1 = np.linalg.norm(embedding_1, keepdims=True)
             norms_2 = np.linalg.norm(embedding_2, keepdims=True)
@@ -9,6 +9,7 @@ from enum import Enum
 import numpy as np
 from pydantic import BaseModel, Field
 
+from ragas.artifacts import shared_artifact
 from ragas.metrics._faithfulness import NLIStatementInput, NLIStatementPrompt
 from ragas.metrics.base import (
     MetricOutputType,
@@ -228,8 +229,12 @@ class FactualCorrectness(MetricWithLLM, SingleTurnMetric):
         assert self.llm is not None, "LLM must be set"
 
         prompt_input = ClaimDecompositionInput(response=response)
-        result = await self.claim_decomposition_prompt.generate(
-            data=prompt_input, llm=self.llm, callbacks=callbacks
+        result = await shared_artifact(
+            "claims",
+            (self.claim_decomposition_prompt, prompt_input, self.llm),
+            lambda: self.claim_decomposition_prompt.generate(
+                data=prompt_input, llm=self.llm, callbacks=callbacks
+            ),
         )
         return result.claims
 
@@ -7,6 +7,7 @@ from dataclasses import dataclass, field
 import numpy as np
 from pydantic import BaseModel, Field
 
+from ragas.artifacts import shared_artifact
 from ragas.dataset_schema import SingleTurnSample
 from ragas.metrics.base import (
     MetricOutputType,
@@ -171,10 +172,14 @@ class Faithfulness(MetricWithLLM, SingleTurnMetric):
         text, question = row["response"], row["user_input"]
 
         prompt_input = StatementGeneratorInput(question=question, answer=text)
-        statements = await self.statement_generator_prompt.generate(
-            llm=self.llm,
-            data=prompt_input,
-            callbacks=callbacks,
+        statements = await shared_artifact(
+            "statements",
+            (self.statement_generator_prompt, prompt_input, self.llm),
+            lambda: self.statement_generator_prompt.generate(
+                llm=self.llm,
+                data=prompt_input,
+                callbacks=callbacks,
+            ),
         )
 
         return statements
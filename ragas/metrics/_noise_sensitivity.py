@@ -6,6 +6,7 @@ from dataclasses import dataclass, field
 
 import numpy as np
 
+from ragas.artifacts import shared_artifact
 from ragas.dataset_schema import SingleTurnSample
 from ragas.metrics._faithfulness import (
     NLIStatementInput,
@@ -76,10 +77,15 @@ class NoiseSensitivity(MetricWithLLM, SingleTurnMetric):
     ) -> t.List[str]:
         assert self.llm is not None, "LLM is not set"
 
-        statements = await self.statement_generator_prompt.generate(
-            llm=self.llm,
-            data=StatementGeneratorInput(question=question, answer=text),
-            callbacks=callbacks,
+        prompt_input = StatementGeneratorInput(question=question, answer=text)
+        statements = await shared_artifact(
+            "statements",
+            (self.statement_generator_prompt, prompt_input, self.llm),
+            lambda: self.statement_generator_prompt.generate(
+                llm=self.llm,
+                data=prompt_input,
+                callbacks=callbacks,
+            ),
         )
         statements = statements.statements
         return statements
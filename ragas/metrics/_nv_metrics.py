@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import typing as t
 from dataclasses import dataclass, field
@@ -8,6 +9,7 @@ import numpy as np
 from langchain_core.callbacks import Callbacks
 from langchain_core.prompt_values import StringPromptValue
 
+from ragas.async_utils import first_valid
 from ragas.dataset_schema import SingleTurnSample
 from ragas.llms.base import BaseRagasLLM
 from ragas.metrics.base import MetricType, MetricWithLLM, SingleTurnMetric
@@ -41,6 +43,12 @@ class AnswerAccuracy(MetricWithLLM, SingleTurnMetric):
 
     answer_accuracy:
         The AnswerAccuracy object
+
+    parallel_retries: bool
+        Retry a judge's invalid rating with its remaining retries in parallel and
+        keep the first valid one, instead of retrying one after another. Judges
+        that disagree are deliberately not asked again, so scores are computed
+        exactly as in the default mode.
     """
 
     name: str = field(default="nv_accuracy", repr=True)  # type: ignore
@@ -81,6 +89,7 @@ class AnswerAccuracy(MetricWithLLM, SingleTurnMetric):
         "Rating: "
     )
     retry = 5  # Number of retries if rating is not in the first 8 tokens.
+    parallel_retries: bool = False
 
     def process_score(self, response):
         for i in range(5):
@@ -96,6 +105,53 @@ class AnswerAccuracy(MetricWithLLM, SingleTurnMetric):
             score = max(score0, score1)
         return score
 
+    async def _judge(self, judge: int, sample: SingleTurnSample) -> float:
+        """Rate the sample once with judge 0 or the swapped judge 1."""
+        if judge == 0:
+            text = self.template_accuracy1.format(
+                query=sample.user_input,
+                answer0="User Answer",
+                answer1="Reference Answer",
+                sentence_inference=sample.response,
+                sentence_true=sample.reference,
+            )
+        else:
+            text = self.template_accuracy2.format(
+                query=sample.user_input,
+                answer0="Reference Answer",
+                answer1="User Answer",
+                sentence_inference=sample.reference,
+                sentence_true=sample.response,
+            )
+        resp = await t.cast(BaseRagasLLM, self.llm).agenerate_text(
+            StringPromptValue(text=text),
+            n=1,
+            temperature=0.10,
+        )
+        return self.process_score(resp.generations[0][0].text)
+
+    async def _judge_with_retries(self, judge: int, sample: SingleTurnSample) -> float:
+        score = np.nan
+        for retry in range(self.retry):
+            score = await self._judge(judge, sample)
+            if score == score:
+                break
+            else:
+                logger.warning(f"Retry: {retry}")
+        return score
+
+    async def _settle_judge(
+        self, judge: int, sample: SingleTurnSample, score: float
+    ) -> float:
+        if score == score:
+            return score
+        # the remaining retries race each other, the first valid rating wins
+        return await first_valid(
+            [self._judge(judge, sample) for _ in range(self.retry - 1)],
+            lambda s: s == s,
+            default=np.nan,
+        )
+
     async def _single_turn_ascore(
         self, sample: SingleTurnSample, callbacks: Callbacks
     ) -> float:
@@ -105,52 +161,21 @@ class AnswerAccuracy(MetricWithLLM, SingleTurnMetric):
         assert sample.reference is not None, "Reference is not set"
 
         try:
-            score_ref_gen = score_gen_ref = np.nan
-            for retry in range(self.retry):
-                formatted_prompt = StringPromptValue(
-                    text=self.template_accuracy1.format(
-                        query=sample.user_input,
-                        answer0="User Answer",
-                        answer1="Reference Answer",
-                        sentence_inference=sample.response,
-                        sentence_true=sample.reference,
-                    )
+            if self.parallel_retries:
+                # one rating per judge; stop when both are valid, otherwise
+                # settle the invalid ones with parallel retries
+                scores = await asyncio.gather(
+                    self._judge(0, sample), self._judge(1, sample)
                 )
-                req0 = t.cast(BaseRagasLLM, self.llm).agenerate_text(
-                    formatted_prompt,
-                    n=1,
-                    temperature=0.10,
+                score_ref_gen, score_gen_ref = await asyncio.gather(
+                    self._settle_judge(0, sample, scores[0]),
+                    self._settle_judge(1, sample, scores[1]),
                 )
-                resp0 = await req0
-                score_ref_gen = resp0.generations[0][0].text
-                score_ref_gen = self.process_score(score_ref_gen)
-                if score_ref_gen == score_ref_gen:
-                    break
-                else:
-                    logger.warning(f"Retry: {retry}")
-
-            for retry in range(self.retry):
-                formatted_prompt = StringPromptValue(
-                    text=self.template_accuracy2.format(
-                        query=sample.user_input,
-                        answer0="Reference Answer",
-                        answer1="User Answer",
-                        sentence_inference=sample.reference,
-                        sentence_true=sample.response,
-                    )
-                )
-                req1 = t.cast(BaseRagasLLM, self.llm).agenerate_text(
-                    formatted_prompt,
-                    n=1,
-                    temperature=0.10,
+            else:
+                score_ref_gen, score_gen_ref = await asyncio.gather(
+                    self._judge_with_retries(0, sample),
+                    self._judge_with_retries(1, sample),
                 )
-                resp1 = await req1
-                score_gen_ref = resp1.generations[0][0].text
-                score_gen_ref = self.process_score(score_gen_ref)
-                if score_gen_ref == score_gen_ref:
-                    break
-                else:
-                    logger.warning(f"Retry: {retry}")
 
             score = self.average_scores(score_ref_gen, score_gen_ref)
 
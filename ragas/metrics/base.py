@@ -12,7 +12,7 @@ from pydantic import ValidationError
 from tqdm import tqdm
 
 from ragas._analytics import EvaluationEvent, _analytics_batcher
-from ragas.async_utils import apply_nest_asyncio, run
+from ragas.async_utils import apply_nest_asyncio, run, watch_loop_blocking
 from ragas.callbacks import ChainType, new_group
 from ragas.dataset_schema import MetricAnnotation, MultiTurnSample, SingleTurnSample
 from ragas.llms import BaseRagasLLM
@@ -20,7 +20,7 @@ from ragas.losses import BinaryMetricLoss, MSELoss
 from ragas.metrics.validators import AllowedValuesType
 from ragas.prompt import FewShotPydanticPrompt, PromptMixin
 from ragas.run_config import RunConfig
-from ragas.utils import camel_to_snake, get_metric_language
+from ragas.utils import camel_to_snake, get_debug_mode, get_metric_language
 
 if t.TYPE_CHECKING:
     from langchain_core.callbacks import Callbacks
@@ -477,11 +477,11 @@ class SingleTurnMetric(Metric):
             callbacks=callbacks,
             metadata={"type": ChainType.METRIC},
         )
+        coro = self._single_turn_ascore(sample=sample, callbacks=group_cm)
+        if get_debug_mode():
+            coro = watch_loop_blocking(coro, f"{self.name} metric")
         try:
-            score = await asyncio.wait_for(
-                self._single_turn_ascore(sample=sample, callbacks=group_cm),
-                timeout=timeout,
-            )
+            score = await asyncio.wait_for(coro, timeout=timeout)
         except Exception as e:
             if not group_cm.ended:
                 rm.on_chain_error(e)
@@ -601,11 +601,11 @@ class MultiTurnMetric(Metric):
             callbacks=callbacks,
             metadata={"type": ChainType.METRIC},
         )
+        coro = self._multi_turn_ascore(sample=sample, callbacks=group_cm)
+        if get_debug_mode():
+            coro = watch_loop_blocking(coro, f"{self.name} metric")
         try:
-            score = await asyncio.wait_for(
-                self._multi_turn_ascore(sample=sample, callbacks=group_cm),
-                timeout=timeout,
-            )
+            score = await asyncio.wait_for(coro, timeout=timeout)
         except Exception as e:
             if not group_cm.ended:
                 rm.on_chain_error(e)
@@ -4,6 +4,7 @@ import typing as t
 
 import numpy as np
 
+from ragas.embeddings.utils import run_sync_in_async
 from ragas.metrics.collections.base import BaseMetric
 from ragas.metrics.result import MetricResult
 
@@ -45,7 +46,7 @@ class SemanticSimilarity(BaseMetric):
         ... ])
 
     Attributes:
-        embeddings: Modern embeddings model with embed_text() method
+        embeddings: Modern embeddings model with aembed_texts() method
         name: The metric name
         threshold: Optional threshold for binary classification
         allowed_values: Score range (0.0 to 1.0)
@@ -82,8 +83,13 @@ class SemanticSimilarity(BaseMetric):
         reference = reference or " "
         response = response or " "
 
-        embedding_1 = np.array(self.embeddings.embed_text(reference))
-        embedding_2 = np.array(self.embeddings.embed_text(response))
+        # one request for both texts, off the event loop for sync clients
+        texts = [reference, response]
+        if getattr(self.embeddings, "is_async", True):
+            embeddings = await self.embeddings.aembed_texts(texts)
+        else:
+            embeddings = await run_sync_in_async(self.embeddings.embed_texts, texts)
+        embedding_1, embedding_2 = np.array(embeddings)
 
         norms_1 = np.linalg.norm(embedding_1, keepdims=True)
         norms_2 = np.linalg.norm(embedding_2, keepdims=True)
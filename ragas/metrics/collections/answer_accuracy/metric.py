@@ -1,9 +1,11 @@
 """Answer Accuracy metric v2 - Modern implementation with dual-judge evaluation."""
 
+import asyncio
 import typing as t
 
 import numpy as np
 
+from ragas.async_utils import first_valid
 from ragas.metrics.collections.base import BaseMetric
 from ragas.metrics.result import MetricResult
 
@@ -59,6 +61,7 @@ class AnswerAccuracy(BaseMetric):
         name: The metric name
         allowed_values: Score range (0.0 to 1.0, higher is better)
         max_retries: Maximum retry attempts for invalid ratings
+        parallel_retries: Run the retries of an invalid rating in parallel
     """
 
     # Type hints for linter (attributes are set in __init__)
@@ -69,6 +72,7 @@ class AnswerAccuracy(BaseMetric):
         llm: "InstructorBaseRagasLLM",
         name: str = "answer_accuracy",
         max_retries: int = 5,
+        parallel_retries: bool = False,
         **kwargs,
     ):
         """
@@ -78,10 +82,16 @@ class AnswerAccuracy(BaseMetric):
             llm: Modern instructor-based LLM for dual-judge evaluation
             name: The metric name
             max_retries: Maximum retry attempts for invalid ratings
+            parallel_retries: Retry a judge's invalid rating with its remaining
+                retries in parallel and keep the first valid one, instead of
+                retrying one after another. Judges that disagree are deliberately
+                not asked again, so scores are computed exactly as in the default
+                mode.
         """
         # Set attributes explicitly before calling super()
         self.llm = llm
         self.max_retries = max_retries
+        self.parallel_retries = parallel_retries
         self.judge1_prompt = AnswerAccuracyJudge1Prompt()
         self.judge2_prompt = AnswerAccuracyJudge2Prompt()
 
@@ -116,52 +126,72 @@ class AnswerAccuracy(BaseMetric):
                 "reference is missing. Please add reference to the test sample."
             )
 
-        # Get ratings from both judges
-        judge1_rating = await self._get_judge_rating(
-            self.judge1_prompt, user_input, response, reference
-        )
-        judge2_rating = await self._get_judge_rating(
-            self.judge2_prompt, user_input, reference, response
-        )  # Note: swapped order for judge 2
+        judges = [
+            (self.judge1_prompt, user_input, response, reference),
+            # Note: swapped order for judge 2
+            (self.judge2_prompt, user_input, reference, response),
+        ]
+        if self.parallel_retries:
+            ratings = await asyncio.gather(*(self._judge(*judge) for judge in judges))
+            judge1_rating, judge2_rating = await asyncio.gather(
+                *(
+                    self._settle_judge(judge, rating)
+                    for judge, rating in zip(judges, ratings)
+                )
+            )
+        else:
+            # Get ratings from both judges concurrently
+            judge1_rating, judge2_rating = await asyncio.gather(
+                *(self._get_judge_rating(*judge) for judge in judges)
+            )
 
         # Average the scores (convert from 0,2,4 scale to 0.0-1.0)
         score = self._average_scores(judge1_rating / 4.0, judge2_rating / 4.0)
 
         return MetricResult(value=float(score))
 
+    async def _judge(
+        self, prompt_obj, query: str, user_answer: str, reference_answer: str
+    ) -> float:
+        """Get one rating from a judge, NaN if it fails or is invalid."""
+        try:
+            input_data = AnswerAccuracyInput(
+                query=query,
+                user_answer=user_answer,
+                reference_answer=reference_answer,
+            )
+            prompt_str = prompt_obj.to_string(input_data)
+            result = await self.llm.agenerate(prompt_str, AnswerAccuracyOutput)
+            rating = result.rating
+        except Exception:
+            return float("nan")
+
+        # Validate rating is in expected range
+        return float(rating) if rating in [0, 2, 4] else float("nan")
+
     async def _get_judge_rating(
         self, prompt_obj, query: str, user_answer: str, reference_answer: str
     ) -> float:
         """Get rating from judge with retry logic."""
-        for retry in range(self.max_retries):
-            try:
-                input_data = AnswerAccuracyInput(
-                    query=query,
-                    user_answer=user_answer,
-                    reference_answer=reference_answer,
-                )
-                prompt_str = prompt_obj.to_string(input_data)
-                result = await self.llm.agenerate(prompt_str, AnswerAccuracyOutput)
-                rating = result.rating
-
-                # Validate rating is in expected range
-                if rating in [0, 2, 4]:
-                    return float(rating)
-                else:
-                    # Invalid rating - retry or return NaN
-                    if retry < self.max_retries - 1:
-                        continue  # Retry if invalid rating
-                    else:
-                        return float("nan")
-
-            except Exception:
-                if retry < self.max_retries - 1:
-                    continue  # Retry on exception
-                else:
-                    return float("nan")
-
+        for _ in range(self.max_retries):
+            rating = await self._judge(prompt_obj, query, user_answer, reference_answer)
+            if not np.isnan(rating):
+                return rating
         return float("nan")
 
+    async def _settle_judge(
+        self, judge: t.Tuple[t.Any, str, str, str], rating: float
+    ) -> float:
+        """Resolve a judge's first rating, racing the retries if it is invalid."""
+        if not np.isnan(rating):
+            return rating
+        # the remaining retries race each other, the first valid rating wins
+        return await first_valid(
+            [self._judge(*judge) for _ in range(self.max_retries - 1)],
+            lambda r: not np.isnan(r),
+            default=float("nan"),
+        )
+
     def _average_scores(self, score1: float, score2: float) -> float:
         """Average two judge scores, handling NaN values."""
         if not np.isnan(score1) and not np.isnan(score2):
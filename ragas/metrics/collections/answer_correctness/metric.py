@@ -5,6 +5,7 @@ from typing import List
 
 import numpy as np
 
+from ragas.artifacts import shared_artifact
 from ragas.metrics.collections.base import BaseMetric
 from ragas.metrics.result import MetricResult
 
@@ -199,7 +200,11 @@ class AnswerCorrectness(BaseMetric):
         """Generate atomic statements from text using the statement generator prompt."""
         input_data = StatementGeneratorInput(question=question, answer=text)
         prompt_str = self.statement_generator_prompt.to_string(input_data)
-        result = await self.llm.agenerate(prompt_str, StatementGeneratorOutput)
+        result = await shared_artifact(
+            "statements",
+            (prompt_str, self.llm),
+            lambda: self.llm.agenerate(prompt_str, StatementGeneratorOutput),
+        )
         return result.statements
 
     async def _classify_statements(
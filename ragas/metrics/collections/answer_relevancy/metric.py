@@ -4,11 +4,15 @@ import typing as t
 
 import numpy as np
 
+from ragas.async_utils import gather_bounded
 from ragas.metrics.collections.base import BaseMetric
 from ragas.metrics.result import MetricResult
 
 from .util import (
     AnswerRelevanceInput,
+    AnswerRelevanceMultiInput,
+    AnswerRelevanceMultiOutput,
+    AnswerRelevanceMultiPrompt,
     AnswerRelevanceOutput,
     AnswerRelevancePrompt,
 )
@@ -56,6 +60,7 @@ class AnswerRelevancy(BaseMetric):
         embeddings: Modern embeddings model for semantic comparison
         name: The metric name
         strictness: Number of questions to generate (default: 3)
+        single_call: Generate all questions in one LLM call (default: False)
         allowed_values: Score range (0.0 to 1.0, higher is better)
     """
 
@@ -69,6 +74,7 @@ class AnswerRelevancy(BaseMetric):
         embeddings: "BaseRagasEmbedding",
         name: str = "answer_relevancy",
         strictness: int = 3,
+        single_call: bool = False,
         **kwargs,
     ):
         """
@@ -79,13 +85,18 @@ class AnswerRelevancy(BaseMetric):
             embeddings: Modern embeddings model for semantic comparison
             name: The metric name (default: "answer_relevancy")
             strictness: Number of questions to generate (default: 3)
+            single_call: Ask for all ``strictness`` questions in one structured
+                output call instead of one concurrent call per question. Faster
+                and cheaper, but the questions are not independent samples.
             **kwargs: Additional arguments passed to BaseMetric
         """
         # Set attributes explicitly before calling super()
         self.llm = llm
         self.embeddings = embeddings
         self.strictness = strictness
+        self.single_call = single_call
         self.prompt = AnswerRelevancePrompt()  # Initialize prompt class once
+        self.multi_prompt = AnswerRelevanceMultiPrompt()
 
         # Call super() for validation
         super().__init__(name=name, **kwargs)
@@ -110,18 +121,9 @@ class AnswerRelevancy(BaseMetric):
             raise ValueError("response cannot be empty")
 
         # Generate multiple questions from response
-        generated_questions = []
-        noncommittal_flags = []
-
-        for _ in range(self.strictness):
-            # Create input data and generate prompt
-            input_data = AnswerRelevanceInput(response=response)
-            prompt_string = self.prompt.to_string(input_data)
-            result = await self.llm.agenerate(prompt_string, AnswerRelevanceOutput)
-
-            if result.question:
-                generated_questions.append(result.question)
-                noncommittal_flags.append(result.noncommittal)
+        results = await self._generate_questions(response)
+        generated_questions = [r.question for r in results if r.question]
+        noncommittal_flags = [r.noncommittal for r in results if r.question]
 
         if not generated_questions:
             return MetricResult(value=0.0)
@@ -129,15 +131,12 @@ class AnswerRelevancy(BaseMetric):
         # Check if all responses are noncommittal
         all_noncommittal = np.all(noncommittal_flags)
 
-        # Embed the original question
-        question_vec = np.asarray(
-            await self.embeddings.aembed_text(user_input)
-        ).reshape(1, -1)
-
-        # Embed the generated questions
-        gen_question_vec = np.asarray(
-            await self.embeddings.aembed_texts(generated_questions)
-        ).reshape(len(generated_questions), -1)
+        # Embed the original question and the generated ones in one request
+        vectors = np.asarray(
+            await self.embeddings.aembed_texts([user_input] + generated_questions)
+        ).reshape(len(generated_questions) + 1, -1)
+        question_vec = vectors[:1]
+        gen_question_vec = vectors[1:]
 
         # Calculate cosine similarity
         norm = np.linalg.norm(gen_question_vec, axis=1) * np.linalg.norm(
@@ -154,3 +153,18 @@ class AnswerRelevancy(BaseMetric):
         score = cosine_sim.mean() * int(not all_noncommittal)
 
         return MetricResult(value=float(score))
+
+    async def _generate_questions(self, response: str) -> t.List[AnswerRelevanceOutput]:
+        """Generate ``strictness`` questions from the response."""
+        if self.single_call and self.strictness > 1:
+            input_data = AnswerRelevanceMultiInput(response=response, n=self.strictness)
+            result = await self.llm.agenerate(
+                self.multi_prompt.to_string(input_data), AnswerRelevanceMultiOutput
+            )
+            return result.questions[: self.strictness]
+
+        prompt_string = self.prompt.to_string(AnswerRelevanceInput(response=response))
+        return await gather_bounded(
+            self.llm.agenerate(prompt_string, AnswerRelevanceOutput)
+            for _ in range(self.strictness)
+        )
@@ -1,5 +1,7 @@
 """Answer Relevancy prompt classes and models."""
 
+import typing as t
+
 from pydantic import BaseModel, Field
 
 from ragas.prompt.metrics.base_prompt import BasePrompt
@@ -62,3 +64,70 @@ Examples of noncommittal answers: "I don't know", "I'm not sure", "It depends"."
             ),
         ),
     ]
+
+
+class AnswerRelevanceMultiInput(BaseModel):
+    """Input model for generating several questions in one call."""
+
+    response: str = Field(
+        ..., description="The response/answer to generate questions from"
+    )
+    n: int = Field(..., description="Number of questions to generate")
+
+
+class AnswerRelevanceMultiOutput(BaseModel):
+    """Structured output with several generated questions."""
+
+    questions: t.List[AnswerRelevanceOutput] = Field(
+        ..., description="The generated questions with their noncommittal flags"
+    )
+
+
+class AnswerRelevanceMultiPrompt(
+    BasePrompt[AnswerRelevanceMultiInput, AnswerRelevanceMultiOutput]
+):
+    """Answer relevance prompt generating ``n`` questions in a single call."""
+
+    input_model = AnswerRelevanceMultiInput
+    output_model = AnswerRelevanceMultiOutput
+
+    instruction = """Generate n different questions for the given answer, each phrased independently, and for each identify if the answer is noncommittal.
+Give noncommittal as 1 if the answer is noncommittal (evasive, vague, or ambiguous) and 0 if the answer is substantive.
+Examples of noncommittal answers: "I don't know", "I'm not sure", "It depends"."""
+
+    examples = [
+        (
+            AnswerRelevanceMultiInput(
+                response="Albert Einstein was born in Germany.", n=2
+            ),
+            AnswerRelevanceMultiOutput(
+                questions=[
+                    AnswerRelevanceOutput(
+                        question="Where was Albert Einstein born?", noncommittal=0
+                    ),
+                    AnswerRelevanceOutput(
+                        question="In which country was Albert Einstein born?",
+                        noncommittal=0,
+                    ),
+                ]
+            ),
+        ),
+        (
+            AnswerRelevanceMultiInput(
+                response="I don't know about the groundbreaking feature of the smartphone invented in 2023 as I am unaware of information beyond 2022.",
+                n=2,
+            ),
+            AnswerRelevanceMultiOutput(
+                questions=[
+                    AnswerRelevanceOutput(
+                        question="What was the groundbreaking feature of the smartphone invented in 2023?",
+                        noncommittal=1,
+                    ),
+                    AnswerRelevanceOutput(
+                        question="Which new feature did the 2023 smartphone introduce?",
+                        noncommittal=1,
+                    ),
+                ]
+            ),
+        ),
+    ]
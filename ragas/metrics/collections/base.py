@@ -1,13 +1,29 @@
 """Base class for collections metrics with modern component validation."""
 
 import asyncio
+import functools
 import typing as t
 
+from ragas.async_utils import watch_loop_blocking
 from ragas.embeddings.base import BaseRagasEmbedding
 from ragas.llms.base import InstructorBaseRagasLLM
 from ragas.metrics.base import SimpleBaseMetric
 from ragas.metrics.result import MetricResult
 from ragas.metrics.validators import NumericValidator
+from ragas.utils import get_debug_mode
+
+
+def _watch_ascore(ascore: t.Callable[..., t.Awaitable[MetricResult]]):
+    """Report event loop blocking in ``ascore`` when debug mode is on."""
+
+    @functools.wraps(ascore)
+    async def wrapper(self, *args, **kwargs) -> MetricResult:
+        coro = ascore(self, *args, **kwargs)
+        if get_debug_mode():
+            return await watch_loop_blocking(coro, f"{self.name} metric")
+        return await coro
+
+    return wrapper
 
 
 class BaseMetric(SimpleBaseMetric, NumericValidator):
@@ -29,6 +45,12 @@ class BaseMetric(SimpleBaseMetric, NumericValidator):
     The base classes handle all the core metric functionality - we just add modern component validation.
     """
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # with RAGAS_DEBUG=true, ascore() warns when it blocks the event loop
+        if "ascore" in cls.__dict__:
+            cls.ascore = _watch_ascore(cls.__dict__["ascore"])  # type: ignore[method-assign]
+
     def __init__(
         self,
         name: str = "base_metric",
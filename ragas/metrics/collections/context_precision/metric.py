@@ -1,14 +1,19 @@
 """Context Precision metrics v2 - Modern implementation with function-based prompts."""
 
+import logging
 import typing as t
 from typing import List
 
 import numpy as np
 
+from ragas.async_utils import gather_bounded
 from ragas.metrics.collections.base import BaseMetric
 from ragas.metrics.result import MetricResult
 
 from .util import (
+    ContextPrecisionBatchInput,
+    ContextPrecisionBatchOutput,
+    ContextPrecisionBatchPrompt,
     ContextPrecisionInput,
     ContextPrecisionOutput,
     ContextPrecisionPrompt,
@@ -17,6 +22,66 @@ from .util import (
 if t.TYPE_CHECKING:
     from ragas.llms.base import InstructorBaseRagasLLM
 
+logger = logging.getLogger(__name__)
+
+
+async def _judge_contexts(
+    llm: "InstructorBaseRagasLLM",
+    prompt: ContextPrecisionPrompt,
+    batch_prompt: ContextPrecisionBatchPrompt,
+    question: str,
+    answer: str,
+    contexts: List[str],
+    max_concurrency: int,
+    batch_size: t.Optional[int],
+) -> List[int]:
+    """
+    Usefulness verdicts for each context, in the order of ``contexts``.
+
+    Calls run concurrently (at most ``max_concurrency`` at once) and the first
+    failure cancels the rest. With ``batch_size`` > 1 each call judges that many
+    contexts; a batch whose answer has the wrong number of verdicts is judged
+    again one context at a time.
+    """
+
+    async def judge_one(context: str) -> List[int]:
+        input_data = ContextPrecisionInput(
+            question=question, context=context, answer=answer
+        )
+        result = await llm.agenerate(
+            prompt.to_string(input_data), ContextPrecisionOutput
+        )
+        return [result.verdict]
+
+    async def judge_batch(batch: List[str]) -> List[int]:
+        if len(batch) == 1:
+            return await judge_one(batch[0])
+        input_data = ContextPrecisionBatchInput(
+            question=question, contexts=batch, answer=answer
+        )
+        result = await llm.agenerate(
+            batch_prompt.to_string(input_data), ContextPrecisionBatchOutput
+        )
+        if len(result.verdicts) == len(batch):
+            return [verdict.verdict for verdict in result.verdicts]
+        logger.warning(
+            "Expected %d context precision verdicts, got %d. "
+            "Judging the contexts one by one.",
+            len(batch),
+            len(result.verdicts),
+        )
+        verdicts = await gather_bounded(
+            (judge_one(context) for context in batch), max_concurrency
+        )
+        return [v for batch_verdicts in verdicts for v in batch_verdicts]
+
+    size = batch_size if batch_size and batch_size > 1 else 1
+    batches = [contexts[i : i + size] for i in range(0, len(contexts), size)]
+    verdicts = await gather_bounded(
+        (judge_batch(batch) for batch in batches), max_concurrency
+    )
+    return [v for batch_verdicts in verdicts for v in batch_verdicts]
+
 
 class ContextPrecisionWithReference(BaseMetric):
     """
@@ -52,6 +117,8 @@ class ContextPrecisionWithReference(BaseMetric):
     Attributes:
         llm: Modern instructor-based LLM for context evaluation
         name: The metric name
+        max_concurrency: Maximum number of concurrent LLM calls per sample
+        batch_size: Number of contexts judged per LLM call (None for one)
         allowed_values: Score range (0.0 to 1.0, higher is better)
     """
 
@@ -62,6 +129,8 @@ class ContextPrecisionWithReference(BaseMetric):
         self,
         llm: "InstructorBaseRagasLLM",
         name: str = "context_precision_with_reference",
+        max_concurrency: int = 10,
+        batch_size: t.Optional[int] = None,
         **kwargs,
     ):
         """
@@ -70,10 +139,17 @@ class ContextPrecisionWithReference(BaseMetric):
         Args:
             llm: Modern instructor-based LLM for context evaluation
             name: The metric name
+            max_concurrency: Maximum number of concurrent LLM calls per sample
+                (1 judges the contexts one after another)
+            batch_size: Number of contexts judged per LLM call; None or 1 asks
+                for one verdict per call
         """
         # Set attributes explicitly before calling super()
         self.llm = llm
         self.prompt = ContextPrecisionPrompt()  # Initialize prompt class once
+        self.batch_prompt = ContextPrecisionBatchPrompt()
+        self.max_concurrency = max_concurrency
+        self.batch_size = batch_size
 
         # Call super() for validation (without passing llm in kwargs)
         super().__init__(name=name, **kwargs)
@@ -100,16 +176,17 @@ class ContextPrecisionWithReference(BaseMetric):
         if not retrieved_contexts:
             raise ValueError("retrieved_contexts cannot be empty")
 
-        # Evaluate each retrieved context
-        verdicts = []
-        for context in retrieved_contexts:
-            # Create input data and generate prompt
-            input_data = ContextPrecisionInput(
-                question=user_input, context=context, answer=reference
-            )
-            prompt_string = self.prompt.to_string(input_data)
-            result = await self.llm.agenerate(prompt_string, ContextPrecisionOutput)
-            verdicts.append(result.verdict)
+        # Evaluate the retrieved contexts
+        verdicts = await _judge_contexts(
+            self.llm,
+            self.prompt,
+            self.batch_prompt,
+            question=user_input,
+            answer=reference,
+            contexts=retrieved_contexts,
+            max_concurrency=self.max_concurrency,
+            batch_size=self.batch_size,
+        )
 
         # Calculate average precision
         score = self._calculate_average_precision(verdicts)
@@ -172,6 +249,8 @@ class ContextPrecisionWithoutReference(BaseMetric):
     Attributes:
         llm: Modern instructor-based LLM for context evaluation
         name: The metric name
+        max_concurrency: Maximum number of concurrent LLM calls per sample
+        batch_size: Number of contexts judged per LLM call (None for one)
         allowed_values: Score range (0.0 to 1.0, higher is better)
     """
 
@@ -182,6 +261,8 @@ class ContextPrecisionWithoutReference(BaseMetric):
         self,
         llm: "InstructorBaseRagasLLM",
         name: str = "context_precision_without_reference",
+        max_concurrency: int = 10,
+        batch_size: t.Optional[int] = None,
         **kwargs,
     ):
         """
@@ -190,10 +271,17 @@ class ContextPrecisionWithoutReference(BaseMetric):
         Args:
             llm: Modern instructor-based LLM for context evaluation
             name: The metric name
+            max_concurrency: Maximum number of concurrent LLM calls per sample
+                (1 judges the contexts one after another)
+            batch_size: Number of contexts judged per LLM call; None or 1 asks
+                for one verdict per call
         """
         # Set attributes explicitly before calling super()
         self.llm = llm
         self.prompt = ContextPrecisionPrompt()  # Initialize prompt class once
+        self.batch_prompt = ContextPrecisionBatchPrompt()
+        self.max_concurrency = max_concurrency
+        self.batch_size = batch_size
 
         # Call super() for validation (without passing llm in kwargs)
         super().__init__(name=name, **kwargs)
@@ -220,16 +308,17 @@ class ContextPrecisionWithoutReference(BaseMetric):
         if not retrieved_contexts:
             raise ValueError("retrieved_contexts cannot be empty")
 
-        # Evaluate each retrieved context
-        verdicts = []
-        for context in retrieved_contexts:
-            # Create input data and generate prompt
-            input_data = ContextPrecisionInput(
-                question=user_input, context=context, answer=response
-            )
-            prompt_string = self.prompt.to_string(input_data)
-            result = await self.llm.agenerate(prompt_string, ContextPrecisionOutput)
-            verdicts.append(result.verdict)
+        # Evaluate the retrieved contexts
+        verdicts = await _judge_contexts(
+            self.llm,
+            self.prompt,
+            self.batch_prompt,
+            question=user_input,
+            answer=response,
+            contexts=retrieved_contexts,
+            max_concurrency=self.max_concurrency,
+            batch_size=self.batch_size,
+        )
 
         # Calculate average precision
         score = self._calculate_average_precision(verdicts)
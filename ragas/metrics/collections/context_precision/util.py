@@ -1,5 +1,7 @@
 """Context Precision prompt classes and models."""
 
+import typing as t
+
 from pydantic import BaseModel, Field
 
 from ragas.prompt.metrics.base_prompt import BasePrompt
@@ -65,3 +67,56 @@ class ContextPrecisionPrompt(BasePrompt[ContextPrecisionInput, ContextPrecisionO
             ),
         ),
     ]
+
+
+class ContextPrecisionBatchInput(BaseModel):
+    """Input model for judging several contexts in one call."""
+
+    question: str = Field(..., description="The question being asked")
+    contexts: t.List[str] = Field(
+        ..., description="The contexts to evaluate for usefulness, in order"
+    )
+    answer: str = Field(
+        ..., description="The answer/reference/response to compare against"
+    )
+
+
+class ContextPrecisionBatchOutput(BaseModel):
+    """Structured output with one verdict per context."""
+
+    verdicts: t.List[ContextPrecisionOutput] = Field(
+        ..., description="One verdict per context, in the order of the contexts"
+    )
+
+
+class ContextPrecisionBatchPrompt(
+    BasePrompt[ContextPrecisionBatchInput, ContextPrecisionBatchOutput]
+):
+    """Context precision prompt returning verdicts for several contexts at once."""
+
+    input_model = ContextPrecisionBatchInput
+    output_model = ContextPrecisionBatchOutput
+
+    instruction = 'Given question, answer and a list of contexts verify, for each context independently, if it was useful in arriving at the given answer. Give verdict as "1" if useful and "0" if not. Return exactly one verdict per context, in the same order as the contexts, with json output.'
+
+    examples = [
+        (
+            ContextPrecisionBatchInput(
+                question=ContextPrecisionPrompt.examples[0][0].question,
+                contexts=[
+                    ContextPrecisionPrompt.examples[0][0].context,
+                    "The Andes is the longest continental mountain range in the world, located in South America.",
+                ],
+                answer=ContextPrecisionPrompt.examples[0][0].answer,
+            ),
+            ContextPrecisionBatchOutput(
+                verdicts=[
+                    ContextPrecisionPrompt.examples[0][1],
+                    ContextPrecisionOutput(
+                        reason="The context is about the Andes mountain range and says nothing about Albert Einstein.",
+                        verdict=0,
+                    ),
+                ]
+            ),
+        ),
+    ]
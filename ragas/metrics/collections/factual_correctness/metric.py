@@ -6,6 +6,7 @@ from typing import List
 import numpy as np
 from pydantic import BaseModel
 
+from ragas.artifacts import shared_artifact
 from ragas.metrics.collections.base import BaseMetric
 from ragas.metrics.result import MetricResult
 from ragas.metrics.utils import fbeta_score
@@ -182,7 +183,11 @@ class FactualCorrectness(BaseMetric):
             response=text, atomicity=self.atomicity, coverage=self.coverage
         )
         prompt_str = self.prompt.to_string(input_data)
-        result = await self.llm.agenerate(prompt_str, ClaimDecompositionOutput)
+        result = await shared_artifact(
+            "claims",
+            (prompt_str, self.llm),
+            lambda: self.llm.agenerate(prompt_str, ClaimDecompositionOutput),
+        )
         return result.claims
 
     async def _verify_claims(
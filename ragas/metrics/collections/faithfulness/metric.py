@@ -3,13 +3,17 @@
 import typing as t
 from typing import List
 
+from ragas.artifacts import shared_artifact
+from ragas.async_utils import gather_bounded
 from ragas.metrics.collections.base import BaseMetric
 from ragas.metrics.result import MetricResult
+from ragas.utils import pack_texts
 
 from .util import (
     NLIStatementInput,
     NLIStatementOutput,
     NLIStatementPrompt,
+    StatementFaithfulnessAnswer,
     StatementGeneratorInput,
     StatementGeneratorOutput,
     StatementGeneratorPrompt,
@@ -58,6 +62,9 @@ class Faithfulness(BaseMetric):
     Attributes:
         llm: Modern instructor-based LLM for statement generation and NLI evaluation
         name: The metric name
+        context_token_budget: Token budget of the context of one NLI call (None
+            joins all retrieved contexts into a single call)
+        max_concurrency: Maximum number of concurrent NLI calls per sample
         allowed_values: Score range (0.0 to 1.0, higher is better)
     """
 
@@ -68,6 +75,8 @@ class Faithfulness(BaseMetric):
         self,
         llm: "InstructorBaseRagasLLM",
         name: str = "faithfulness",
+        context_token_budget: t.Optional[int] = None,
+        max_concurrency: int = 10,
         **kwargs,
     ):
         """
@@ -76,9 +85,15 @@ class Faithfulness(BaseMetric):
         Args:
             llm: Modern instructor-based LLM for statement generation and NLI evaluation
             name: The metric name
+            context_token_budget: If set, the retrieved contexts are split into
+                chunks of at most this many tokens, each judged in its own NLI
+                call; a statement is faithful if any chunk supports it
+            max_concurrency: Maximum number of concurrent NLI calls per sample
         """
         # Set attributes explicitly before calling super()
         self.llm = llm
+        self.context_token_budget = context_token_budget
+        self.max_concurrency = max_concurrency
         self.statement_generator_prompt = StatementGeneratorPrompt()
         self.nli_statement_prompt = NLIStatementPrompt()
 
@@ -121,8 +136,13 @@ class Faithfulness(BaseMetric):
             return MetricResult(value=float("nan"))
 
         # Step 2: Join all contexts and evaluate statements against them
-        context_str = "\n".join(retrieved_contexts)
-        verdicts = await self._create_verdicts(statements, context_str)
+        if self.context_token_budget:
+            verdicts = await self._create_chunked_verdicts(
+                statements, retrieved_contexts, self.context_token_budget
+            )
+        else:
+            context_str = "\n".join(retrieved_contexts)
+            verdicts = await self._create_verdicts(statements, context_str)
 
         # Step 3: Compute faithfulness score
         score = self._compute_score(verdicts)
@@ -133,7 +153,11 @@ class Faithfulness(BaseMetric):
         """Break response into atomic statements using statement generator."""
         input_data = StatementGeneratorInput(question=question, answer=response)
         prompt_str = self.statement_generator_prompt.to_string(input_data)
-        result = await self.llm.agenerate(prompt_str, StatementGeneratorOutput)
+        result = await shared_artifact(
+            "statements",
+            (prompt_str, self.llm),
+            lambda: self.llm.agenerate(prompt_str, StatementGeneratorOutput),
+        )
         return result.statements
 
     async def _create_verdicts(
@@ -145,6 +169,51 @@ class Faithfulness(BaseMetric):
         result = await self.llm.agenerate(prompt_str, NLIStatementOutput)
         return result
 
+    async def _create_chunked_verdicts(
+        self, statements: List[str], contexts: List[str], max_tokens: int
+    ) -> NLIStatementOutput:
+        """
+        Evaluate the statements against chunks of at most ``max_tokens`` tokens of
+        the contexts concurrently and keep, for each statement, a supporting
+        verdict if any chunk gave one.
+        """
+        packs = pack_texts(contexts, max_tokens)
+        results = await gather_bounded(
+            (
+                self._create_verdicts(statements, "\n".join(contexts[i] for i in pack))
+                for pack in packs
+            ),
+            self.max_concurrency,
+        )
+
+        merged: t.List[t.Optional[StatementFaithfulnessAnswer]] = [None] * len(
+            statements
+        )
+        positions = {statement: i for i, statement in enumerate(statements)}
+        for result in results:
+            for j, answer in enumerate(result.statements):
+                # answers normally come back in order; match by text otherwise
+                if len(result.statements) == len(statements):
+                    i = j
+                elif answer.statement in positions:
+                    i = positions[answer.statement]
+                else:
+                    continue
+                if merged[i] is None or (answer.verdict and not merged[i].verdict):
+                    merged[i] = answer
+        return NLIStatementOutput(
+            statements=[
+                answer
+                if answer is not None
+                else StatementFaithfulnessAnswer(
+                    statement=statement,
+                    reason="No verdict was returned for this statement.",
+                    verdict=0,
+                )
+                for statement, answer in zip(statements, merged)
+            ]
+        )
+
     def _compute_score(self, verdicts: NLIStatementOutput) -> float:
         """Compute faithfulness score as ratio of faithful statements."""
         if not verdicts.statements:
@@ -1,14 +1,21 @@
 """Noise Sensitivity metrics v2 - Modern implementation with function-based prompts."""
 
+import logging
 import typing as t
 from typing import Dict, List, Literal
 
 import numpy as np
 
+from ragas.artifacts import shared_artifact
+from ragas.async_utils import gather_bounded
 from ragas.metrics.collections.base import BaseMetric
 from ragas.metrics.result import MetricResult
+from ragas.utils import pack_texts
 
 from .util import (
+    MultiContextFaithfulnessInput,
+    MultiContextFaithfulnessOutput,
+    MultiContextFaithfulnessPrompt,
     StatementFaithfulnessInput,
     StatementFaithfulnessOutput,
     StatementFaithfulnessPrompt,
@@ -20,6 +27,8 @@ from .util import (
 if t.TYPE_CHECKING:
     from ragas.llms.base import InstructorBaseRagasLLM
 
+logger = logging.getLogger(__name__)
+
 
 class NoiseSensitivity(BaseMetric):
     """
@@ -65,6 +74,9 @@ class NoiseSensitivity(BaseMetric):
         llm: Modern instructor-based LLM for statement generation and NLI evaluation
         name: The metric name
         mode: Either "relevant" or "irrelevant" context sensitivity
+        max_concurrency: Maximum number of concurrent LLM calls per sample
+        context_token_budget: Token budget for packing several contexts into one
+            NLI call (None judges every context in its own call)
         allowed_values: Score range (0.0 to 1.0, lower is better)
     """
 
@@ -76,6 +88,8 @@ class NoiseSensitivity(BaseMetric):
         llm: "InstructorBaseRagasLLM",
         name: str = "noise_sensitivity",
         mode: Literal["relevant", "irrelevant"] = "relevant",
+        max_concurrency: int = 10,
+        context_token_budget: t.Optional[int] = None,
         **kwargs,
     ):
         """
@@ -85,12 +99,19 @@ class NoiseSensitivity(BaseMetric):
             llm: Modern instructor-based LLM for statement generation and NLI evaluation
             name: The metric name
             mode: Either "relevant" or "irrelevant" context sensitivity mode
+            max_concurrency: Maximum number of concurrent LLM calls per sample
+                (1 makes the calls one after another)
+            context_token_budget: If set, consecutive contexts are packed into
+                one NLI call as long as they fit in this many tokens
         """
         # Set attributes explicitly before calling super()
         self.llm = llm
         self.mode = mode
+        self.max_concurrency = max_concurrency
+        self.context_token_budget = context_token_budget
         self.statement_prompt = StatementGeneratorPrompt()
         self.faithfulness_prompt = StatementFaithfulnessPrompt()
+        self.multi_context_prompt = MultiContextFaithfulnessPrompt()
 
         # Validate mode
         if mode not in {"relevant", "irrelevant"}:
@@ -139,40 +160,39 @@ class NoiseSensitivity(BaseMetric):
             )
 
         # Step 1: Decompose reference and response into statements
-        gt_statements = await self._decompose_answer_into_statements(
-            reference, user_input
-        )
-        ans_statements = await self._decompose_answer_into_statements(
-            response, user_input
+        gt_statements, ans_statements = await gather_bounded(
+            [
+                self._decompose_answer_into_statements(reference, user_input),
+                self._decompose_answer_into_statements(response, user_input),
+            ],
+            self.max_concurrency,
         )
 
-        # Step 2: Evaluate statement faithfulness against each retrieved context
-        gt_verdictslist = []
-        ans_verdictslist = []
-
-        for ctx in retrieved_contexts:
-            # Evaluate ground truth statements against this context
-            gt_verdicts = await self._evaluate_statement_faithfulness(
-                gt_statements, ctx
-            )
-            gt_verdictslist.append(np.array(gt_verdicts))
-
-            # Evaluate answer statements against this context
-            ans_verdicts = await self._evaluate_statement_faithfulness(
-                ans_statements, ctx
-            )
-            ans_verdictslist.append(np.array(ans_verdicts))
+        # Step 2: Evaluate statement faithfulness against each retrieved context,
+        # and the answer statements against the reference, all concurrently
+        if self.context_token_budget:
+            packs = pack_texts(retrieved_contexts, self.context_token_budget)
+        else:
+            packs = [[i] for i in range(len(retrieved_contexts))]
+        jobs = [
+            self._evaluate_contexts(statements, [retrieved_contexts[i] for i in pack])
+            for statements in (gt_statements, ans_statements)
+            for pack in packs
+        ]
+        jobs.append(self._evaluate_contexts(ans_statements, [reference]))
+        results = await gather_bounded(jobs, self.max_concurrency)
+        gt_verdictslist = [np.array(v) for pack in results[: len(packs)] for v in pack]
+        ans_verdictslist = [
+            np.array(v) for pack in results[len(packs) : -1] for v in pack
+        ]
 
         # Step 3: Build matrices for computation (exact legacy shape handling)
         answers = {}
         answers["retrieved2ground_truth"] = np.array(gt_verdictslist).T
         answers["retrieved2answer"] = np.array(ans_verdictslist).T
 
-        # Evaluate answer statements against reference (ground truth)
-        gt_to_ans_verdicts = await self._evaluate_statement_faithfulness(
-            ans_statements, reference
-        )
-        answers["ground_truth2answer"] = np.array(gt_to_ans_verdicts)
+        # Answer statements against reference (ground truth)
+        answers["ground_truth2answer"] = np.array(results[-1][0])
         # Wrap in another array to match legacy shape handling
         answers["ground_truth2answer"] = np.array([answers["ground_truth2answer"]])
 
@@ -190,7 +210,11 @@ class NoiseSensitivity(BaseMetric):
         """Decompose answer text into atomic statements."""
         input_data = StatementGeneratorInput(question=question, text=text)
         prompt_str = self.statement_prompt.to_string(input_data)
-        result = await self.llm.agenerate(prompt_str, StatementGeneratorOutput)
+        result = await shared_artifact(
+            "statements",
+            (prompt_str, self.llm),
+            lambda: self.llm.agenerate(prompt_str, StatementGeneratorOutput),
+        )
         return result.statements
 
     async def _evaluate_statement_faithfulness(
@@ -206,6 +230,46 @@ class NoiseSensitivity(BaseMetric):
         ]
         return verdict_list
 
+    async def _evaluate_contexts(
+        self, statements: List[str], contexts: List[str]
+    ) -> List[List[int]]:
+        """
+        Evaluate the statements against each of ``contexts`` in a single NLI call.
+
+        Falls back to one call per context if the answer does not hold a verdict
+        for every statement and context.
+        """
+        if len(contexts) == 1:
+            return [
+                await self._evaluate_statement_faithfulness(statements, contexts[0])
+            ]
+
+        input_data = MultiContextFaithfulnessInput(
+            contexts=contexts, statements=statements
+        )
+        prompt_str = self.multi_context_prompt.to_string(input_data)
+        result = await self.llm.agenerate(prompt_str, MultiContextFaithfulnessOutput)
+        if len(result.contexts) == len(contexts) and all(
+            len(verdicts.statements) == len(statements) for verdicts in result.contexts
+        ):
+            return [
+                [1 if statement.verdict else 0 for statement in verdicts.statements]
+                for verdicts in result.contexts
+            ]
+
+        logger.warning(
+            "Packed NLI call returned verdicts of the wrong shape. "
+            "Evaluating the %d contexts one by one.",
+            len(contexts),
+        )
+        return await gather_bounded(
+            (
+                self._evaluate_statement_faithfulness(statements, context)
+                for context in contexts
+            ),
+            self.max_concurrency,
+        )
+
     def _compute_score(self, answers: Dict) -> float:
         """Compute noise sensitivity score from faithfulness matrices."""
         incorrect = ~answers["ground_truth2answer"]
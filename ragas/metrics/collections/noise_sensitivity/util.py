@@ -66,3 +66,80 @@ class StatementFaithfulnessPrompt(
     def to_string(self, input_data: StatementFaithfulnessInput) -> str:
         """Generate prompt string."""
         return nli_statement_prompt(input_data.context, input_data.statements)
+
+
+class MultiContextFaithfulnessInput(BaseModel):
+    """Input for judging statements against several contexts in one call."""
+
+    contexts: List[str] = Field(..., description="The contexts to verify against")
+    statements: List[str] = Field(..., description="The statements to verify")
+
+
+class ContextFaithfulnessVerdicts(BaseModel):
+    """Verdicts of all statements against one context."""
+
+    statements: List[StatementFaithfulnessAnswer]
+
+
+class MultiContextFaithfulnessOutput(BaseModel):
+    """Output with one set of verdicts per context."""
+
+    contexts: List[ContextFaithfulnessVerdicts]
+
+
+class MultiContextFaithfulnessPrompt(
+    BasePrompt[MultiContextFaithfulnessInput, MultiContextFaithfulnessOutput]
+):
+    """Prompt verifying the statements against each of several contexts."""
+
+    input_model = MultiContextFaithfulnessInput
+    output_model = MultiContextFaithfulnessOutput
+
+    instruction = "Your task is to judge the faithfulness of a series of statements against each of the given contexts separately. For every context, in order, and every statement, in order, return verdict as 1 if the statement can be directly inferred based on that context alone or 0 if it can not be directly inferred based on that context."
+
+    examples = [
+        (
+            MultiContextFaithfulnessInput(
+                contexts=[
+                    "John is a student at XYZ University. He is pursuing a degree in Computer Science.",
+                    "John works part-time at a bookstore on weekends.",
+                ],
+                statements=[
+                    "John is majoring in Computer Science.",
+                    "John has a part-time job.",
+                ],
+            ),
+            MultiContextFaithfulnessOutput(
+                contexts=[
+                    ContextFaithfulnessVerdicts(
+                        statements=[
+                            StatementFaithfulnessAnswer(
+                                statement="John is majoring in Computer Science.",
+                                reason="The context states that John is pursuing a degree in Computer Science.",
+                                verdict=1,
+                            ),
+                            StatementFaithfulnessAnswer(
+                                statement="John has a part-time job.",
+                                reason="The context does not mention any job.",
+                                verdict=0,
+                            ),
+                        ]
+                    ),
+                    ContextFaithfulnessVerdicts(
+                        statements=[
+                            StatementFaithfulnessAnswer(
+                                statement="John is majoring in Computer Science.",
+                                reason="The context does not mention what John studies.",
+                                verdict=0,
+                            ),
+                            StatementFaithfulnessAnswer(
+                                statement="John has a part-time job.",
+                                reason="The context states that John works part-time at a bookstore.",
+                                verdict=1,
+                            ),
+                        ]
+                    ),
+                ]
+            ),
+        ),
+    ]
@@ -0,0 +1,147 @@
+"""Per-sample planning of the LLM requests issued by the metrics of an evaluation."""
+
+from __future__ import annotations
+
+import contextvars
+import typing as t
+from collections import Counter
+from dataclasses import dataclass, field
+
+from ragas.cache import SingleFlight, _CacheKeyBuilder
+
+T = t.TypeVar("T")
+
+_current_job: contextvars.ContextVar[t.Optional["_JobScope"]] = contextvars.ContextVar(
+    "ragas_planner_job", default=None
+)
+
+
+@dataclass
+class PlannerStats:
+    """Request counts of an `EvaluationPlanner`."""
+
+    requests: int = 0
+    shared: int = 0
+
+    @property
+    def issued(self) -> int:
+        """Requests actually sent to an LLM."""
+        return self.requests - self.shared
+
+
+class SamplePlan:
+    """
+    Requests issued for one sample, shared by all the metrics scoring it.
+
+    A request is identified by the LLM, the rendered prompt and the generation
+    parameters. Each metric job counts its own occurrences of a request, and the
+    k-th occurrence in one metric is served by the k-th occurrence in any other.
+    A metric asking for the same prompt several times (e.g. to sample different
+    generations) therefore still gets independent responses, while a prompt
+    asked by several metrics is sent once. A request that is still running is
+    awaited, so dependent steps in other metrics start as soon as it returns.
+    """
+
+    def __init__(self, index: int, stats: PlannerStats):
+        self.index = index
+        self.pending_jobs = 0
+        self._stats = stats
+        self._results: t.Dict[t.Tuple[str, int], t.Any] = {}
+        self._single_flight = SingleFlight()
+
+    async def request(
+        self, key: str, occurrence: int, compute: t.Callable[[], t.Awaitable[T]]
+    ) -> T:
+        self._stats.requests += 1
+        slot = (key, occurrence)
+        if slot in self._results:
+            self._stats.shared += 1
+            return self._results[slot]
+
+        computed = False
+
+        async def run():
+            nonlocal computed
+            computed = True
+            result = await compute()
+            self._results[slot] = result
+            return result
+
+        result = await self._single_flight.do(f"{key}:{occurrence}", run)
+        if not computed:
+            self._stats.shared += 1
+        return result
+
+    def release(self) -> None:
+        self._results.clear()
+
+
+@dataclass
+class _JobScope:
+    plan: SamplePlan
+    occurrences: t.Counter[str] = field(default_factory=Counter)
+
+
+class EvaluationPlanner:
+    """
+    Groups the jobs of an evaluation by sample and deduplicates their LLM requests.
+
+    `evaluate` wraps every (sample, metric) job with `wrap`. Jobs of the same sample
+    share a `SamplePlan`, which is dropped once all of them have finished, so
+    memory stays bounded by the samples in flight. Metrics are unchanged: each one
+    receives exactly the responses it would have received had it sent its own
+    requests, only identical requests across metrics are sent once.
+    """
+
+    def __init__(self):
+        self.stats = PlannerStats()
+        self._plans: t.Dict[int, SamplePlan] = {}
+
+    def wrap(
+        self, func: t.Callable[..., t.Awaitable[T]], sample_index: int
+    ) -> t.Callable[..., t.Awaitable[T]]:
+        """Return ``func`` running as a job of sample ``sample_index``."""
+        plan = self._plans.get(sample_index)
+        if plan is None:
+            plan = self._plans[sample_index] = SamplePlan(sample_index, self.stats)
+        plan.pending_jobs += 1
+
+        async def planned(*args, **kwargs) -> T:
+            token = _current_job.set(_JobScope(plan))
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                _current_job.reset(token)
+                plan.pending_jobs -= 1
+                if plan.pending_jobs == 0:
+                    plan.release()
+                    self._plans.pop(sample_index, None)
+
+        return planned
+
+    def __repr__(self) -> str:
+        return (
+            f"EvaluationPlanner(requests={self.stats.requests}, "
+            f"shared={self.stats.shared})"
+        )
+
+
+def request_key(llm: t.Any, *parts: t.Any) -> str:
+    """Key of a request to ``llm``; the LLM is matched by identity."""
+    builder = _CacheKeyBuilder()
+    builder.update(list(parts))
+    return f"{id(llm)}:{builder.hexdigest()}"
+
+
+async def planned_request(key: str, compute: t.Callable[[], t.Awaitable[T]]) -> T:
+    """
+    Send a request through the plan of the current sample, if there is one.
+
+    Outside of a planned job (e.g. a metric scored directly) the request is
+    computed as is.
+    """
+    scope = _current_job.get()
+    if scope is None:
+        return await compute()
+    scope.occurrences[key] += 1
+    return await scope.plan.request(key, scope.occurrences[key], compute)
@@ -52,7 +52,10 @@ class SimpleInMemoryExampleStore(SimpleExampleStore):
 
         # Serialize the dictionary to text
         text = "\n".join([f"{k}: {v}" for k, v in data.items()])
-        return self.embedding_model.embed_query(text)
+        if hasattr(self.embedding_model, "embed_query"):
+            return self.embedding_model.embed_query(text)
+        # modern embeddings (BaseRagasEmbedding), e.g. `StoredEmbeddings`
+        return self.embedding_model.embed_text(text)
 
     def add_example(self, input: t.Dict, output: t.Dict) -> None:
         """Add an example to the store with its embedding."""
@@ -15,8 +15,10 @@ from pydantic import BaseModel
 
 from ragas._analytics import PromptUsageEvent, track
 from ragas._version import __version__
+from ragas.cache import register_cache_key
 from ragas.callbacks import ChainType, new_group
 from ragas.exceptions import RagasOutputParserException
+from ragas.planner import planned_request, request_key
 
 from .base import BasePrompt, StringIO
 from .utils import extract_json, get_all_strings, update_strings
@@ -236,51 +238,58 @@ class PydanticPrompt(BasePrompt, t.Generic[InputModel, OutputModel]):
         )
         prompt_value = PromptValue(text=self.to_string(processed_data))
 
-        # Handle different LLM types with different interfaces
-        # 1. LangChain LLMs have agenerate_prompt() for async with specific signature
-        # 2. BaseRagasLLM have generate() with n, temperature, stop, callbacks
-        # 3. InstructorLLM has generate()/agenerate() with only prompt and response_model
-        if is_langchain_llm(llm):
-            # This is a LangChain LLM - use agenerate_prompt() with batch for multiple generations
-            langchain_llm = t.cast(BaseLanguageModel, llm)
-            # LangChain doesn't support n parameter directly, so we batch multiple prompts
-            prompts = t.cast(t.List[t.Any], [prompt_value for _ in range(n)])
-            resp = await langchain_llm.agenerate_prompt(
-                prompts,
-                stop=stop,
-                callbacks=prompt_cb,
-            )
-        elif isinstance(llm, InstructorBaseRagasLLM):
-            # This is an InstructorLLM - use its generate()/agenerate() method
-            # InstructorLLM.generate()/agenerate() only takes prompt and response_model parameters
-            from ragas.llms.base import InstructorLLM
-
-            instructor_llm = t.cast(InstructorLLM, llm)
-            if instructor_llm.is_async:
-                result = await llm.agenerate(
-                    prompt=prompt_value.text,
-                    response_model=self.output_model,
+        async def call_llm():
+            # Handle different LLM types with different interfaces
+            # 1. LangChain LLMs have agenerate_prompt() for async with specific signature
+            # 2. BaseRagasLLM have generate() with n, temperature, stop, callbacks
+            # 3. InstructorLLM has generate()/agenerate() with only prompt and response_model
+            if is_langchain_llm(llm):
+                # This is a LangChain LLM - use agenerate_prompt() with batch for multiple generations
+                langchain_llm = t.cast(BaseLanguageModel, llm)
+                # LangChain doesn't support n parameter directly, so we batch multiple prompts
+                prompts = t.cast(t.List[t.Any], [prompt_value for _ in range(n)])
+                return await langchain_llm.agenerate_prompt(
+                    prompts,
+                    stop=stop,
+                    callbacks=prompt_cb,
                 )
+            elif isinstance(llm, InstructorBaseRagasLLM):
+                # This is an InstructorLLM - use its generate()/agenerate() method
+                # InstructorLLM.generate()/agenerate() only takes prompt and response_model parameters
+                from ragas.llms.base import InstructorLLM
+
+                instructor_llm = t.cast(InstructorLLM, llm)
+                if instructor_llm.is_async:
+                    result = await llm.agenerate(
+                        prompt=prompt_value.text,
+                        response_model=self.output_model,
+                    )
+                else:
+                    result = llm.generate(
+                        prompt=prompt_value.text,
+                        response_model=self.output_model,
+                    )
+                # Wrap the single response in an LLMResult-like structure for consistency
+                from langchain_core.outputs import Generation, LLMResult
+
+                generation = Generation(text=result.model_dump_json())
+                return LLMResult(generations=[[generation]])
             else:
-                result = llm.generate(
-                    prompt=prompt_value.text,
-                    response_model=self.output_model,
+                # This is a standard BaseRagasLLM - use generate()
+                ragas_llm = t.cast(BaseRagasLLM, llm)
+                return await ragas_llm.generate(
+                    prompt_value,
+                    n=n,
+                    temperature=temperature,
+                    stop=stop,
+                    callbacks=prompt_cb,
                 )
-            # Wrap the single response in an LLMResult-like structure for consistency
-            from langchain_core.outputs import Generation, LLMResult
 
-            generation = Generation(text=result.model_dump_json())
-            resp = LLMResult(generations=[[generation]])
-        else:
-            # This is a standard BaseRagasLLM - use generate()
-            ragas_llm = t.cast(BaseRagasLLM, llm)
-            resp = await ragas_llm.generate(
-                prompt_value,
-                n=n,
-                temperature=temperature,
-                stop=stop,
-                callbacks=prompt_cb,
-            )
+        # identical requests issued by other metrics for the same sample during
+        # `evaluate` are sent once
+        resp = await planned_request(
+            request_key(llm, prompt_value.text, n, temperature, stop), call_llm
+        )
 
         output_models = []
         parser = RagasOutputParser(pydantic_object=self.output_model)
@@ -507,6 +516,19 @@ class PydanticPrompt(BasePrompt, t.Generic[InputModel, OutputModel]):
         return prompt
 
 
+register_cache_key(
+    PydanticPrompt,
+    lambda prompt: (
+        prompt.name,
+        prompt.input_model.__qualname__,
+        prompt.output_model.__qualname__,
+        prompt.instruction,
+        prompt.examples,
+        prompt.language,
+    ),
+)
+
+
 # Ragas Output Parser
 class OutputStringAndPrompt(BaseModel):
     output_string: str
@@ -0,0 +1,211 @@
+"""Process-wide request and token rate limits for LLM and embedding calls."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+import typing as t
+
+logger = logging.getLogger(__name__)
+
+Texts = t.Union[str, t.Sequence[str], None]
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket that refills continuously at ``rate`` units per second.
+
+    The bucket holds no event-loop-bound state, so the same instance can be shared
+    by async callers on any loop and by sync callers on worker threads.
+    """
+
+    def __init__(self, capacity: float, rate: float):
+        if capacity <= 0 or rate <= 0:
+            raise ValueError("capacity and rate must be positive")
+        self.capacity = float(capacity)
+        self.rate = float(rate)
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, amount: float) -> float:
+        """Take ``amount`` from the bucket and return how long to wait for it."""
+        # requests larger than the bucket would never be served; let them through
+        # once the bucket is full instead
+        amount = min(amount, self.capacity)
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= amount
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    async def acquire(self, amount: float = 1.0) -> None:
+        delay = self._reserve(amount)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def acquire_sync(self, amount: float = 1.0) -> None:
+        delay = self._reserve(amount)
+        if delay > 0:
+            time.sleep(delay)
+
+
+class RateLimiter:
+    """
+    Requests-per-minute and tokens-per-minute limits for one provider/model.
+
+    Parameters
+    ----------
+    requests_per_minute : int, optional
+        Maximum number of requests per minute.
+    tokens_per_minute : int, optional
+        Maximum number of (estimated) tokens per minute, counting the prompt and
+        the requested completion budget.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: t.Optional[int] = None,
+        tokens_per_minute: t.Optional[int] = None,
+    ):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._requests = (
+            TokenBucket(requests_per_minute, requests_per_minute / 60.0)
+            if requests_per_minute
+            else None
+        )
+        self._tokens = (
+            TokenBucket(tokens_per_minute, tokens_per_minute / 60.0)
+            if tokens_per_minute
+            else None
+        )
+
+    @property
+    def limits_tokens(self) -> bool:
+        return self._tokens is not None
+
+    async def acquire(self, tokens: int = 0) -> None:
+        if self._requests is not None:
+            await self._requests.acquire(1)
+        if self._tokens is not None and tokens > 0:
+            await self._tokens.acquire(tokens)
+
+    def acquire_sync(self, tokens: int = 0) -> None:
+        if self._requests is not None:
+            self._requests.acquire_sync(1)
+        if self._tokens is not None and tokens > 0:
+            self._tokens.acquire_sync(tokens)
+
+    def __repr__(self) -> str:
+        return (
+            f"RateLimiter(requests_per_minute={self.requests_per_minute}, "
+            f"tokens_per_minute={self.tokens_per_minute})"
+        )
+
+
+_rate_limiters: t.Dict[t.Tuple[str, str], RateLimiter] = {}
+_registry_lock = threading.Lock()
+
+
+def set_rate_limit(
+    provider: str,
+    model: str = "*",
+    requests_per_minute: t.Optional[int] = None,
+    tokens_per_minute: t.Optional[int] = None,
+) -> RateLimiter:
+    """
+    Set the process-wide rate limit for a provider and model.
+
+    All LLM and embedding wrappers for that provider/model acquire from the same
+    limiter before sending a request. Use ``model="*"`` to apply the limit to every
+    model of a provider that has no limit of its own.
+
+    Examples
+    --------
+    >>> from ragas.rate_limit import set_rate_limit
+    >>> set_rate_limit("openai", "gpt-4o-mini", requests_per_minute=500, tokens_per_minute=200_000)
+    """
+    limiter = RateLimiter(requests_per_minute, tokens_per_minute)
+    with _registry_lock:
+        _rate_limiters[(provider.lower(), model)] = limiter
+    return limiter
+
+
+def remove_rate_limit(provider: str, model: str = "*") -> None:
+    """Remove the rate limit set for a provider and model, if any."""
+    with _registry_lock:
+        _rate_limiters.pop((provider.lower(), model), None)
+
+
+def clear_rate_limits() -> None:
+    """Remove all rate limits."""
+    with _registry_lock:
+        _rate_limiters.clear()
+
+
+def get_rate_limiter(
+    provider: t.Optional[str], model: t.Optional[str]
+) -> t.Optional[RateLimiter]:
+    """Return the limiter for a provider/model, falling back to the provider-wide one."""
+    if not _rate_limiters or not provider:
+        return None
+    provider = provider.lower()
+    if model:
+        limiter = _rate_limiters.get((provider, model))
+        if limiter is not None:
+            return limiter
+    return _rate_limiters.get((provider, "*"))
+
+
+def estimate_tokens(texts: Texts) -> int:
+    """Estimate the number of tokens in one or more texts."""
+    if not texts:
+        return 0
+    if isinstance(texts, str):
+        texts = [texts]
+    from ragas.utils import num_tokens_from_string
+
+    total = 0
+    for text in texts:
+        try:
+            total += num_tokens_from_string(text)
+        except Exception:
+            # tokenizer unavailable (e.g. offline); use the usual 4 chars/token rule
+            total += len(text) // 4 + 1
+    return total
+
+
+async def acquire(
+    provider: t.Optional[str],
+    model: t.Optional[str],
+    texts: Texts = None,
+    max_output_tokens: int = 0,
+) -> None:
+    """Wait until a request for ``provider``/``model`` fits the configured limits."""
+    limiter = get_rate_limiter(provider, model)
+    if limiter is None:
+        return
+    tokens = estimate_tokens(texts) + max_output_tokens if limiter.limits_tokens else 0
+    await limiter.acquire(tokens)
+
+
+def acquire_sync(
+    provider: t.Optional[str],
+    model: t.Optional[str],
+    texts: Texts = None,
+    max_output_tokens: int = 0,
+) -> None:
+    """Blocking version of `acquire` for sync call paths."""
+    limiter = get_rate_limiter(provider, model)
+    if limiter is None:
+        return
+    tokens = estimate_tokens(texts) + max_output_tokens if limiter.limits_tokens else 0
+    limiter.acquire_sync(tokens)
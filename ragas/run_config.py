@@ -5,6 +5,7 @@ from dataclasses import dataclass
 import numpy as np
 from tenacity import (
     AsyncRetrying,
+    RetryCallState,
     Retrying,
     WrappedFn,
     after_log,
@@ -14,6 +15,8 @@ from tenacity import (
 )
 from tenacity.after import after_nothing
 
+from ragas.concurrency import report_retry
+
 
 @dataclass
 class RunConfig:
@@ -36,6 +39,15 @@ class RunConfig:
         Whether to log retry attempts using tenacity, by default False.
     seed : int, optional
         Random seed for reproducibility, by default 42.
+    adaptive_concurrency : bool, optional
+        Whether to adapt the number of concurrent workers to observed latency
+        and rate-limit errors (AIMD), starting from `max_workers`, by default False.
+    min_workers : int, optional
+        Lower bound for the number of workers when `adaptive_concurrency` is
+        enabled, by default 1.
+    adaptive_max_workers : int, optional
+        Upper bound for the number of workers when `adaptive_concurrency` is
+        enabled, by default 4 times `max_workers`.
 
     Attributes
     ----------
@@ -58,11 +70,19 @@ class RunConfig:
     ] = (Exception,)
     log_tenacity: bool = False
     seed: int = 42
+    adaptive_concurrency: bool = False
+    min_workers: int = 1
+    adaptive_max_workers: t.Optional[int] = None
 
     def __post_init__(self):
         self.rng = np.random.default_rng(seed=self.seed)
 
 
+def _report_retry_to_limiter(retry_state: RetryCallState) -> None:
+    outcome = retry_state.outcome
+    report_retry(outcome.exception() if outcome is not None else None)
+
+
 def add_retry(fn: WrappedFn, run_config: RunConfig) -> WrappedFn:
     """
     Adds retry functionality to a given function using the provided RunConfig.
@@ -90,6 +110,7 @@ def add_retry(fn: WrappedFn, run_config: RunConfig) -> WrappedFn:
         retry=retry_if_exception_type(run_config.exception_types),
         reraise=True,
         after=tenacity_logger,
+        before_sleep=_report_retry_to_limiter,
     )
     return r.wraps(fn)
 
@@ -111,5 +132,6 @@ def add_async_retry(fn: WrappedFn, run_config: RunConfig) -> WrappedFn:
         retry=retry_if_exception_type(run_config.exception_types),
         reraise=True,
         after=tenacity_logger,
+        before_sleep=_report_retry_to_limiter,
     )
     return r.wraps(fn)
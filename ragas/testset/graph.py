@@ -9,17 +9,37 @@ from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 
+import numpy as np
 from pydantic import BaseModel, Field, field_serializer
 from tqdm.auto import tqdm
 
+from ragas.testset.graph_io import (
+    LazyProperties,
+    is_binary_graph,
+    load_binary,
+    save_binary,
+)
+
 
 class UUIDEncoder(json.JSONEncoder):
     def default(self, o):
         if isinstance(o, uuid.UUID):
             return str(o)
+        # embeddings of graphs loaded from the binary format are numpy arrays
+        if isinstance(o, np.ndarray):
+            return o.tolist()
+        if isinstance(o, np.generic):
+            return o.item()
         return super().default(o)
 
 
+def _serialize_properties(properties: dict) -> dict:
+    # lazily loaded properties must be materialised before pydantic reads them
+    if isinstance(properties, LazyProperties):
+        return properties.copy()
+    return properties
+
+
 class NodeType(str, Enum):
     """
     Enumeration of node types in the knowledge graph.
@@ -88,6 +108,10 @@ class Node(BaseModel):
             return self.id == other.id
         return False
 
+    @field_serializer("properties")
+    def serialize_properties(self, properties: dict):
+        return _serialize_properties(properties)
+
 
 class Relationship(BaseModel):
     """
@@ -141,12 +165,27 @@ class Relationship(BaseModel):
     def serialize_node(self, node: Node):
         return node.id
 
+    @field_serializer("properties")
+    def serialize_properties(self, properties: dict):
+        return _serialize_properties(properties)
+
+
+# node id -> relationship type -> relationships; the None key holds all types
+_AdjacencyIndex = t.Dict[uuid.UUID, t.Dict[t.Optional[str], t.List[Relationship]]]
+
 
 @dataclass
 class KnowledgeGraph:
     """
     Represents a knowledge graph containing nodes and relationships.
 
+    The graph maintains indexes from node id to node, from node type to nodes and
+    from node to its outgoing and incoming relationships by type, used by
+    `get_node_by_id`, `get_nodes_by_type`, `get_outgoing_relationships` and
+    `get_incoming_relationships`. Items appended to `nodes` or `relationships`
+    (directly or through `add`) are indexed on the next lookup; call `reindex`
+    after removing or replacing items in those lists directly.
+
     Attributes
     ----------
     nodes : List[Node]
@@ -158,6 +197,30 @@ class KnowledgeGraph:
     nodes: t.List[Node] = field(default_factory=list)
     relationships: t.List[Relationship] = field(default_factory=list)
 
+    _node_index: t.Dict[uuid.UUID, Node] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _nodes_by_type: t.Dict[NodeType, t.List[Node]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _outgoing: _AdjacencyIndex = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _incoming: _AdjacencyIndex = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # the lists and prefix lengths the indexes currently cover
+    _indexed_nodes: t.Optional[t.List[Node]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _indexed_relationships: t.Optional[t.List[Relationship]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _n_indexed_nodes: int = field(default=0, init=False, repr=False, compare=False)
+    _n_indexed_relationships: int = field(
+        default=0, init=False, repr=False, compare=False
+    )
+
     def add(self, item: t.Union[Node, Relationship]):
         """
         Adds a node or relationship to the knowledge graph.
@@ -176,26 +239,93 @@ class KnowledgeGraph:
 
     def _add_node(self, node: Node):
         self.nodes.append(node)
+        if self._indexed_nodes is self.nodes:
+            self._sync_node_index()
 
     def _add_relationship(self, relationship: Relationship):
         self.relationships.append(relationship)
-
-    def save(self, path: t.Union[str, Path]):
-        """Saves the knowledge graph to a JSON file.
+        if self._indexed_relationships is self.relationships:
+            self._sync_relationship_index()
+
+    def reindex(self):
+        """Rebuilds the node and relationship indexes from scratch."""
+        self._indexed_nodes = None
+        self._indexed_relationships = None
+        self._sync_index()
+
+    def _sync_index(self):
+        self._sync_node_index()
+        self._sync_relationship_index()
+
+    def _sync_node_index(self):
+        nodes = self.nodes
+        if self._indexed_nodes is not nodes or len(nodes) < self._n_indexed_nodes:
+            # the list was replaced or shrunk; start over
+            self._node_index = {}
+            self._nodes_by_type = {}
+            self._indexed_nodes = nodes
+            self._n_indexed_nodes = 0
+        for node in nodes[self._n_indexed_nodes :]:
+            self._node_index[node.id] = node
+            self._nodes_by_type.setdefault(node.type, []).append(node)
+        self._n_indexed_nodes = len(nodes)
+
+    def _sync_relationship_index(self):
+        relationships = self.relationships
+        if (
+            self._indexed_relationships is not relationships
+            or len(relationships) < self._n_indexed_relationships
+        ):
+            self._outgoing = {}
+            self._incoming = {}
+            self._indexed_relationships = relationships
+            self._n_indexed_relationships = 0
+        for rel in relationships[self._n_indexed_relationships :]:
+            outgoing = self._outgoing.setdefault(rel.source.id, {})
+            outgoing.setdefault(rel.type, []).append(rel)
+            outgoing.setdefault(None, []).append(rel)
+            incoming = self._incoming.setdefault(rel.target.id, {})
+            incoming.setdefault(rel.type, []).append(rel)
+            incoming.setdefault(None, []).append(rel)
+        self._n_indexed_relationships = len(relationships)
+
+    def save(
+        self,
+        path: t.Union[str, Path],
+        format: t.Literal["json", "binary"] = "json",
+        embedding_properties: t.Optional[t.Collection[str]] = None,
+    ):
+        """Saves the knowledge graph to a JSON file or in the binary format.
 
         Parameters
         ----------
         path : Union[str, Path]
-            Path where the JSON file should be saved.
+            Path where the JSON file should be saved, or the directory for the
+            binary format.
+        format : str, optional
+            ``"json"`` (default) writes a single, portable JSON file. ``"binary"``
+            writes Arrow tables for the nodes and relationships and ``.npy``
+            matrices for embedding properties, which is much smaller and faster
+            to load for large graphs.
+        embedding_properties : Collection[str], optional
+            For the binary format, names of the node properties stored as
+            embedding matrices. Defaults to the properties whose name ends with
+            ``embedding``.
 
         Notes
         -----
-        The file is saved using UTF-8 encoding to ensure proper handling of Unicode characters
-        across different platforms.
+        The JSON file is saved using UTF-8 encoding to ensure proper handling of
+        Unicode characters across different platforms.
         """
         if isinstance(path, str):
             path = Path(path)
 
+        if format == "binary":
+            save_binary(self, path, embedding_properties=embedding_properties)
+            return
+        if format != "json":
+            raise ValueError(f"Unknown format {format!r}. Expected 'json' or 'binary'.")
+
         data = {
             "nodes": [node.model_dump() for node in self.nodes],
             "relationships": [rel.model_dump() for rel in self.relationships],
@@ -204,13 +334,19 @@ class KnowledgeGraph:
             json.dump(data, f, cls=UUIDEncoder, indent=2, ensure_ascii=False)
 
     @classmethod
-    def load(cls, path: t.Union[str, Path]) -> "KnowledgeGraph":
+    def load(cls, path: t.Union[str, Path], mmap: bool = True) -> "KnowledgeGraph":
         """Loads a knowledge graph from a path.
 
         Parameters
         ----------
         path : Union[str, Path]
-            Path to the JSON file containing the knowledge graph.
+            Path to the JSON file containing the knowledge graph, or to a directory
+            written with ``save(path, format="binary")``.
+        mmap : bool, optional
+            For the binary format, whether embeddings are memory-mapped instead of
+            read into memory. Node and relationship properties of binary graphs
+            are decoded on first access either way, and embedding properties are
+            numpy arrays.
 
         Returns
         -------
@@ -219,12 +355,20 @@ class KnowledgeGraph:
 
         Notes
         -----
-        The file is read using UTF-8 encoding to ensure proper handling of Unicode characters
-        across different platforms.
+        The JSON file is read using UTF-8 encoding to ensure proper handling of
+        Unicode characters across different platforms.
         """
         if isinstance(path, str):
             path = Path(path)
 
+        if is_binary_graph(path):
+            nodes, relationships = load_binary(path, mmap=mmap)
+            kg = cls()
+            kg.nodes.extend(nodes)
+            kg.relationships.extend(relationships)
+            kg.reindex()
+            return kg
+
         with open(path, "r", encoding="utf-8") as f:
             data = json.load(f)
 
@@ -246,6 +390,7 @@ class KnowledgeGraph:
         kg = cls()
         kg.nodes.extend(nodes)
         kg.relationships.extend(relationships)
+        kg.reindex()
         return kg
 
     def __repr__(self) -> str:
@@ -271,7 +416,78 @@ class KnowledgeGraph:
         if isinstance(node_id, str):
             node_id = uuid.UUID(node_id)
 
-        return next(filter(lambda n: n.id == node_id, self.nodes), None)
+        self._sync_node_index()
+        return self._node_index.get(node_id)
+
+    def get_nodes_by_type(self, node_type: NodeType) -> t.List[Node]:
+        """
+        Retrieves all nodes of a given type, in insertion order.
+
+        Parameters
+        ----------
+        node_type : NodeType
+            The type of the nodes to retrieve.
+
+        Returns
+        -------
+        List[Node]
+            The nodes of the specified type.
+        """
+        self._sync_node_index()
+        return list(self._nodes_by_type.get(node_type, []))
+
+    def get_outgoing_relationships(
+        self, node: Node, relationship_type: t.Optional[str] = None
+    ) -> t.List[Relationship]:
+        """
+        Retrieves the relationships whose source is ``node``, in insertion order.
+
+        Parameters
+        ----------
+        node : Node
+            The source node.
+        relationship_type : str, optional
+            Only return relationships of this type.
+
+        Returns
+        -------
+        List[Relationship]
+            The outgoing relationships of the node.
+        """
+        self._sync_relationship_index()
+        return self._get_adjacent(self._outgoing, node, relationship_type)
+
+    def get_incoming_relationships(
+        self, node: Node, relationship_type: t.Optional[str] = None
+    ) -> t.List[Relationship]:
+        """
+        Retrieves the relationships whose target is ``node``, in insertion order.
+
+        Parameters
+        ----------
+        node : Node
+            The target node.
+        relationship_type : str, optional
+            Only return relationships of this type.
+
+        Returns
+        -------
+        List[Relationship]
+            The incoming relationships of the node.
+        """
+        self._sync_relationship_index()
+        return self._get_adjacent(self._incoming, node, relationship_type)
+
+    def _get_adjacent(
+        self,
+        index: _AdjacencyIndex,
+        node: Node,
+        relationship_type: t.Optional[str],
+    ) -> t.List[Relationship]:
+        by_type = index.get(node.id)
+        if not by_type:
+            return []
+        return list(by_type.get(relationship_type, []))
 
     def find_indirect_clusters(
         self,
@@ -669,28 +885,53 @@ class KnowledgeGraph:
         ValueError
             If the node is not present in the knowledge graph.
         """
-        if node not in self.nodes:
+        self._sync_index()
+        if node.id not in self._node_index:
             raise ValueError("Node is not present in the knowledge graph.")
 
         if inplace:
             # Modify the current instance
-            self.nodes.remove(node)
-            self.relationships = [
-                rel
-                for rel in self.relationships
-                if rel.source != node and rel.target != node
-            ]
+            self._remove_node(node)
         else:
             # Create a deep copy and modify it
             new_graph = deepcopy(self)
-            new_graph.nodes.remove(node)
-            new_graph.relationships = [
-                rel
-                for rel in new_graph.relationships
-                if rel.source != node and rel.target != node
-            ]
+            new_graph._remove_node(node)
             return new_graph
 
+    def _remove_node(self, node: Node):
+        self.nodes.remove(node)
+        self.relationships = [
+            rel
+            for rel in self.relationships
+            if rel.source != node and rel.target != node
+        ]
+
+        # update the indexes in place instead of rebuilding them
+        self._node_index.pop(node.id, None)
+        same_type = self._nodes_by_type.get(node.type, [])
+        if node in same_type:
+            same_type.remove(node)
+        for rel in self._outgoing.pop(node.id, {}).get(None, []):
+            if rel.target != node:
+                self._unindex_relationship(self._incoming, rel.target.id, rel)
+        for rel in self._incoming.pop(node.id, {}).get(None, []):
+            if rel.source != node:
+                self._unindex_relationship(self._outgoing, rel.source.id, rel)
+        self._indexed_nodes = self.nodes
+        self._n_indexed_nodes = len(self.nodes)
+        self._indexed_relationships = self.relationships
+        self._n_indexed_relationships = len(self.relationships)
+
+    @staticmethod
+    def _unindex_relationship(
+        index: _AdjacencyIndex, node_id: uuid.UUID, rel: Relationship
+    ):
+        by_type = index.get(node_id, {})
+        for key in (rel.type, None):
+            rels = by_type.get(key)
+            if rels and rel in rels:
+                rels.remove(rel)
+
     def find_two_nodes_single_rel(
         self, relationship_condition: t.Callable[[Relationship], bool] = lambda _: True
     ) -> t.List[t.Tuple[Node, Relationship, Node]]:
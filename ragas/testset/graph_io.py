@@ -0,0 +1,360 @@
+"""
+Binary on-disk format for `KnowledgeGraph`.
+
+A graph is saved to a directory holding:
+
+- ``nodes.arrow``: Arrow IPC table with one row per node (id, type, the JSON of its
+  non-embedding properties and the location of its embeddings).
+- ``relationships.arrow``: Arrow IPC table with one row per relationship.
+- ``embeddings_<dim>.npy``: one matrix per embedding dimension holding the
+  embedding properties (by default those named ``*embedding``), opened
+  memory-mapped on load.
+
+Node and relationship properties are decoded lazily, on first access.
+"""
+
+from __future__ import annotations
+
+import json
+import typing as t
+import uuid
+from functools import partial
+from pathlib import Path
+
+import numpy as np
+
+if t.TYPE_CHECKING:
+    from ragas.testset.graph import KnowledgeGraph
+
+FORMAT_NAME = "ragas-knowledge-graph"
+FORMAT_VERSION = "1"
+NODES_FILE = "nodes.arrow"
+RELATIONSHIPS_FILE = "relationships.arrow"
+
+
+class LazyProperties(dict):
+    """
+    A property dict whose contents are produced by ``load`` on first access.
+
+    All reads and writes materialise it first, so it behaves like the plain dict
+    it replaces.
+    """
+
+    __slots__ = ("_load",)
+
+    def __init__(self, load: t.Callable[[], t.Dict[str, t.Any]]):
+        super().__init__()
+        self._load: t.Optional[t.Callable[[], t.Dict[str, t.Any]]] = load
+
+    @property
+    def loaded(self) -> bool:
+        return self._load is None
+
+    def _materialize(self) -> None:
+        load = self._load
+        if load is not None:
+            self._load = None
+            dict.update(self, load())
+
+    def __getitem__(self, key):
+        self._materialize()
+        return dict.__getitem__(self, key)
+
+    def __setitem__(self, key, value):
+        self._materialize()
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key):
+        self._materialize()
+        dict.__delitem__(self, key)
+
+    def __contains__(self, key):
+        self._materialize()
+        return dict.__contains__(self, key)
+
+    def __iter__(self):
+        self._materialize()
+        return dict.__iter__(self)
+
+    def __len__(self):
+        self._materialize()
+        return dict.__len__(self)
+
+    def __eq__(self, other):
+        self._materialize()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self):
+        self._materialize()
+        return dict.__repr__(self)
+
+    def __reduce__(self):
+        self._materialize()
+        return (dict, (dict(self.items()),))
+
+    def __copy__(self):
+        return self.copy()
+
+    def __deepcopy__(self, memo):
+        from copy import deepcopy
+
+        return deepcopy(self.copy(), memo)
+
+    def get(self, key, default=None):
+        self._materialize()
+        return dict.get(self, key, default)
+
+    def keys(self):
+        self._materialize()
+        return dict.keys(self)
+
+    def values(self):
+        self._materialize()
+        return dict.values(self)
+
+    def items(self):
+        self._materialize()
+        return dict.items(self)
+
+    def copy(self):
+        self._materialize()
+        return dict(dict.items(self))
+
+    def pop(self, key, *default):
+        self._materialize()
+        return dict.pop(self, key, *default)
+
+    def popitem(self):
+        self._materialize()
+        return dict.popitem(self)
+
+    def setdefault(self, key, default=None):
+        self._materialize()
+        return dict.setdefault(self, key, default)
+
+    def update(self, *args, **kwargs):
+        self._materialize()
+        dict.update(self, *args, **kwargs)
+
+    def clear(self):
+        self._load = None
+        dict.clear(self)
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow as pa
+        import pyarrow.ipc  # noqa: F401
+    except ImportError:
+        raise ImportError(
+            "pyarrow is required for the binary knowledge graph format. "
+            "Please install it using `pip install pyarrow`"
+        )
+    return pa
+
+
+def is_embedding(value: t.Any) -> bool:
+    if isinstance(value, np.ndarray):
+        return value.ndim == 1 and value.size > 0 and value.dtype.kind == "f"
+    return (
+        isinstance(value, (list, tuple))
+        and len(value) > 1
+        and isinstance(value[0], float)
+        and np.asarray(value).dtype.kind == "f"
+    )
+
+
+def _is_default_embedding_property(key: str) -> bool:
+    """Whether a property is an embedding by name (e.g. ``summary_embedding``)."""
+    return key.endswith("embedding")
+
+
+def save_binary(
+    kg: "KnowledgeGraph",
+    path: t.Union[str, Path],
+    embedding_dtype: t.Union[str, np.dtype] = "float32",
+    embedding_properties: t.Optional[t.Collection[str]] = None,
+) -> None:
+    """
+    Saves a knowledge graph in the binary format.
+
+    Parameters
+    ----------
+    kg : KnowledgeGraph
+        The graph to save.
+    path : Union[str, Path]
+        Directory to write to; created if it does not exist.
+    embedding_dtype : str or np.dtype
+        Floating point type the embeddings are stored as.
+    embedding_properties : Collection[str], optional
+        Names of the node properties stored in the embedding matrices. Defaults
+        to the properties whose name ends with ``embedding``. Other properties,
+        including other lists of floats, are stored as JSON and keep their type.
+    """
+    from ragas.testset.graph import UUIDEncoder
+
+    pa = _require_pyarrow()
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+    encoder = UUIDEncoder(ensure_ascii=False)
+    if embedding_properties is None:
+        is_embedding_property = _is_default_embedding_property
+    else:
+        is_embedding_property = set(embedding_properties).__contains__
+
+    # embedding dimension -> rows of the matrix for that dimension
+    vectors: t.Dict[int, t.List[t.Any]] = {}
+    ids, types, properties, embeddings = [], [], [], []
+    for node in kg.nodes:
+        plain, refs = {}, {}
+        for position, (key, value) in enumerate(node.properties.items()):
+            if is_embedding_property(key) and is_embedding(value):
+                rows = vectors.setdefault(len(value), [])
+                refs[key] = [len(value), len(rows), position]
+                rows.append(value)
+            else:
+                plain[key] = value
+        ids.append(node.id.bytes)
+        types.append(node.type.value)
+        properties.append(encoder.encode(plain))
+        embeddings.append(encoder.encode(refs) if refs else None)
+
+    metadata = {"format": FORMAT_NAME, "version": FORMAT_VERSION}
+    nodes_table = pa.table(
+        {
+            "id": pa.array(ids, type=pa.binary(16)),
+            "type": pa.array(types, type=pa.string()),
+            "properties": pa.array(properties, type=pa.large_string()),
+            "embeddings": pa.array(embeddings, type=pa.string()),
+        }
+    ).replace_schema_metadata(metadata)
+    relationships_table = pa.table(
+        {
+            "id": pa.array(
+                [rel.id.bytes for rel in kg.relationships], type=pa.binary(16)
+            ),
+            "type": pa.array([rel.type for rel in kg.relationships], type=pa.string()),
+            "source": pa.array(
+                [rel.source.id.bytes for rel in kg.relationships], type=pa.binary(16)
+            ),
+            "target": pa.array(
+                [rel.target.id.bytes for rel in kg.relationships], type=pa.binary(16)
+            ),
+            "bidirectional": pa.array(
+                [rel.bidirectional for rel in kg.relationships], type=pa.bool_()
+            ),
+            "properties": pa.array(
+                [encoder.encode(rel.properties) for rel in kg.relationships],
+                type=pa.large_string(),
+            ),
+        }
+    ).replace_schema_metadata(metadata)
+
+    for file_name, table in (
+        (NODES_FILE, nodes_table),
+        (RELATIONSHIPS_FILE, relationships_table),
+    ):
+        with pa.OSFile(str(path / file_name), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+
+    for stale in path.glob("embeddings_*.npy"):
+        stale.unlink()
+    for dim, rows in vectors.items():
+        np.save(path / f"embeddings_{dim}.npy", np.asarray(rows, dtype=embedding_dtype))
+
+
+def _read_table(pa, file_path: Path):
+    with pa.memory_map(str(file_path), "r") as source:
+        table = pa.ipc.open_file(source).read_all()
+    metadata = table.schema.metadata or {}
+    if metadata.get(b"format") != FORMAT_NAME.encode():
+        raise ValueError(f"{file_path} is not a ragas knowledge graph file")
+    return table
+
+
+def _load_node_properties(
+    properties: str,
+    embeddings: t.Optional[str],
+    matrices: t.Dict[int, np.ndarray],
+) -> t.Dict[str, t.Any]:
+    values = json.loads(properties)
+    if not embeddings:
+        return values
+    # put the embeddings back at their original positions
+    items = list(values.items())
+    refs = sorted(json.loads(embeddings).items(), key=lambda ref: ref[1][2])
+    for key, (dim, row, position) in refs:
+        items.insert(position, (key, matrices[dim][row]))
+    return dict(items)
+
+
+def is_binary_graph(path: t.Union[str, Path]) -> bool:
+    """Whether ``path`` holds a knowledge graph in the binary format."""
+    path = Path(path)
+    return path.is_dir() and (path / NODES_FILE).exists()
+
+
+def load_binary(
+    path: t.Union[str, Path], mmap: bool = True
+) -> t.Tuple[t.List[t.Any], t.List[t.Any]]:
+    """
+    Loads the nodes and relationships of a graph saved with `save_binary`.
+
+    Embedding properties are returned as rows of the memory-mapped
+    embedding matrices (read-only numpy arrays) unless ``mmap`` is False.
+    """
+    from ragas.testset.graph import Node, NodeType, Relationship
+
+    pa = _require_pyarrow()
+    path = Path(path)
+    nodes_table = _read_table(pa, path / NODES_FILE)
+    relationships_table = _read_table(pa, path / RELATIONSHIPS_FILE)
+
+    matrices: t.Dict[int, np.ndarray] = {}
+    for file_path in path.glob("embeddings_*.npy"):
+        dim = int(file_path.stem.rsplit("_", 1)[1])
+        matrices[dim] = np.load(file_path, mmap_mode="r" if mmap else None)
+
+    node_types = {node_type.value: node_type for node_type in NodeType}
+    nodes = [
+        Node.model_construct(
+            id=uuid.UUID(bytes=node_id),
+            type=node_types[node_type],
+            properties=LazyProperties(
+                partial(_load_node_properties, properties, embeddings, matrices)
+            ),
+        )
+        for node_id, node_type, properties, embeddings in zip(
+            nodes_table.column("id").to_pylist(),
+            nodes_table.column("type").to_pylist(),
+            nodes_table.column("properties").to_pylist(),
+            nodes_table.column("embeddings").to_pylist(),
+        )
+    ]
+
+    nodes_map = {node.id.bytes: node for node in nodes}
+    relationships = [
+        Relationship.model_construct(
+            id=uuid.UUID(bytes=rel_id),
+            type=rel_type,
+            source=nodes_map[source],
+            target=nodes_map[target],
+            bidirectional=bidirectional,
+            properties=LazyProperties(partial(json.loads, properties)),
+        )
+        for rel_id, rel_type, source, target, bidirectional, properties in zip(
+            relationships_table.column("id").to_pylist(),
+            relationships_table.column("type").to_pylist(),
+            relationships_table.column("source").to_pylist(),
+            relationships_table.column("target").to_pylist(),
+            relationships_table.column("bidirectional").to_pylist(),
+            relationships_table.column("properties").to_pylist(),
+        )
+    ]
+    return nodes, relationships
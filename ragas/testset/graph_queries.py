@@ -27,10 +27,9 @@ def get_child_nodes(node: Node, graph: KnowledgeGraph, level: int = 1) -> t.List
     def dfs(current_node: Node, current_level: int):
         if current_level > level:
             return
-        for rel in graph.relationships:
-            if rel.source == current_node and rel.type == "child":
-                children.append(rel.target)
-                dfs(rel.target, current_level + 1)
+        for rel in graph.get_outgoing_relationships(current_node, "child"):
+            children.append(rel.target)
+            dfs(rel.target, current_level + 1)
 
     # Start DFS from the initial node at level 0
     dfs(node, 1)
@@ -62,10 +61,9 @@ def get_parent_nodes(node: Node, graph: KnowledgeGraph, level: int = 1) -> t.Lis
     def dfs(current_node: Node, current_level: int):
         if current_level > level:
             return
-        for rel in graph.relationships:
-            if rel.target == current_node and rel.type == "child":
-                parents.append(rel.source)
-                dfs(rel.source, current_level + 1)
+        for rel in graph.get_incoming_relationships(current_node, "child"):
+            parents.append(rel.source)
+            dfs(rel.source, current_level + 1)
 
     # Start DFS from the initial node at level 0
     dfs(node, 1)
@@ -84,17 +84,14 @@ class MultiHopAbstractQuerySynthesizer(MultiHopQuerySynthesizer):
             )
         num_sample_per_cluster = int(np.ceil(n / len(node_clusters)))
 
-        child_relationships = [
-            rel for rel in knowledge_graph.relationships if rel.type == "child"
-        ]
-
         for cluster in node_clusters:
             if len(scenarios) >= n:
                 break
             nodes = []
             for node in cluster:
                 child_nodes = [
-                    rel.target for rel in child_relationships if rel.source == node
+                    rel.target
+                    for rel in knowledge_graph.get_outgoing_relationships(node, "child")
                 ]
                 if child_nodes:
                     nodes.extend(child_nodes)
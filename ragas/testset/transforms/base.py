@@ -1,14 +1,19 @@
+import dataclasses
 import logging
 import typing as t
+import uuid
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 
+import numpy as np
 import tiktoken
 from tiktoken.core import Encoding
 
+from ragas.cache import _CacheKeyBuilder
 from ragas.llms import BaseRagasLLM, llm_factory
 from ragas.prompt import PromptMixin
 from ragas.testset.graph import KnowledgeGraph, Node, Relationship
+from ragas.testset.graph_io import is_embedding
 
 if t.TYPE_CHECKING:
     from ragas.llms.base import InstructorBaseRagasLLM
@@ -18,10 +23,32 @@ DEFAULT_TOKENIZER = tiktoken.get_encoding("o200k_base")
 logger = logging.getLogger(__name__)
 
 
+# names used in `reads`/`writes` for changes to the graph structure itself
+NODES = "<nodes>"
+RELATIONSHIPS = "<relationships>"
+
+
+# node property holding, per transformation fingerprint, what the transformation
+# last saw of the node; lets re-runs skip nodes that are already up to date
+TRANSFORM_STATE_PROPERTY = "_transform_state"
+
+
 def default_filter(node: Node) -> bool:
     return True
 
 
+def _get_transform_state(node: Node, fingerprint: str) -> t.Any:
+    state = node.properties.get(TRANSFORM_STATE_PROPERTY)
+    return state.get(fingerprint) if isinstance(state, dict) else None
+
+
+def _set_transform_state(node: Node, fingerprint: str, value: t.Any):
+    state = node.properties.get(TRANSFORM_STATE_PROPERTY)
+    if not isinstance(state, dict):
+        state = node.properties[TRANSFORM_STATE_PROPERTY] = {}
+    state[fingerprint] = value
+
+
 def _default_llm_factory() -> t.Union[BaseRagasLLM, "InstructorBaseRagasLLM"]:
     """Create a default LLM instance with OpenAI gpt-4o-mini.
 
@@ -102,6 +129,55 @@ class BaseGraphTransformation(ABC):
             relationships=filtered_relationships,
         )
 
+    def reads(self) -> t.Optional[t.Set[str]]:
+        """
+        Node properties the transformation reads (`RELATIONSHIPS` if it reads the
+        relationships), or ``None`` if unknown.
+
+        Used by `Parallel` to decide which transformations can run concurrently;
+        transformations that return ``None`` are never run alongside others.
+        """
+        return None
+
+    def writes(self) -> t.Optional[t.Set[str]]:
+        """
+        Node properties the transformation writes (`NODES` / `RELATIONSHIPS` if it
+        adds or removes nodes / relationships), or ``None`` if unknown.
+        """
+        return None
+
+    def fingerprint(self) -> str:
+        """
+        Hash of the transformation's class and parameters, including its LLM,
+        embedding model and prompts. Nodes record the fingerprints of the
+        transformations applied to them, so re-running an identical
+        transformation skips nodes whose input did not change.
+        """
+        builder = _CacheKeyBuilder()
+        builder.update(type(self).__qualname__)
+        for f in dataclasses.fields(self):
+            builder.update(f.name)
+            builder.update(getattr(self, f.name))
+        return builder.hexdigest()
+
+    def input_hash(self, node: Node) -> t.Optional[str]:
+        """
+        Hash of the node properties listed by `reads`, or ``None`` if they are
+        unknown (then the node is always processed).
+        """
+        reads = self.reads()
+        if reads is None:
+            return None
+        builder = _CacheKeyBuilder()
+        for name in sorted(reads - {NODES, RELATIONSHIPS}):
+            value = node.properties.get(name)
+            if is_embedding(value):
+                # hash lists and (memory-mapped) arrays alike
+                value = np.asarray(value, dtype=np.float32)
+            builder.update(name)
+            builder.update(value)
+        return builder.hexdigest()
+
     @abstractmethod
     def generate_execution_plan(self, kg: KnowledgeGraph) -> t.Sequence[t.Coroutine]:
         """
@@ -166,6 +242,10 @@ class Extractor(BaseGraphTransformation):
         filtered = self.filter(kg)
         return [(node, await self.extract(node)) for node in filtered.nodes]
 
+    def writes(self) -> t.Optional[t.Set[str]]:
+        property_name = getattr(self, "property_name", None)
+        return {property_name} if property_name else None
+
     @abstractmethod
     async def extract(self, node: Node) -> t.Tuple[str, t.Any]:
         """
@@ -198,23 +278,56 @@ class Extractor(BaseGraphTransformation):
             A sequence of coroutines to be executed in parallel.
         """
 
-        async def apply_extract(node: Node):
+        fingerprint = self.fingerprint()
+        writes = self.writes()
+
+        async def apply_extract(node: Node, input_hash: t.Optional[str]):
             property_name, property_value = await self.extract(node)
             if node.get_property(property_name) is None:
                 node.add_property(property_name, property_value)
+            elif (
+                input_hash is not None
+                and _get_transform_state(node, fingerprint) is not None
+            ):
+                # the input changed since this transformation last ran
+                node.properties[property_name.lower()] = property_value
             else:
                 logger.warning(
                     "Property '%s' already exists in node '%.6s'. Skipping!",
                     property_name,
                     node.id,
                 )
+                return
+            if input_hash is not None:
+                _set_transform_state(node, fingerprint, input_hash)
 
         filtered = self.filter(kg)
-        plan = [apply_extract(node) for node in filtered.nodes]
+        plan = []
+        skipped = 0
+        for node in filtered.nodes:
+            input_hash = self.input_hash(node) if writes else None
+            if input_hash is not None and all(
+                name.lower() in node.properties for name in writes
+            ):
+                recorded = _get_transform_state(node, fingerprint)
+                if recorded == input_hash:
+                    skipped += 1
+                    continue
+                if recorded is None:
+                    # set by something else; extracting would be thrown away
+                    logger.warning(
+                        "Property '%s' already exists in node '%.6s'. Skipping!",
+                        ", ".join(sorted(writes)),
+                        node.id,
+                    )
+                    skipped += 1
+                    continue
+            plan.append(apply_extract(node, input_hash))
         logger.debug(
-            "Created %d coroutines for %s",
+            "Created %d coroutines for %s (%d nodes up to date)",
             len(plan),
             self.__class__.__name__,
+            skipped,
         )
         return plan
 
@@ -284,6 +397,9 @@ class Splitter(BaseGraphTransformation):
 
         return all_nodes, all_relationships
 
+    def writes(self) -> t.Optional[t.Set[str]]:
+        return {NODES, RELATIONSHIPS}
+
     @abstractmethod
     async def split(self, node: Node) -> t.Tuple[t.List[Node], t.List[Relationship]]:
         """
@@ -316,17 +432,40 @@ class Splitter(BaseGraphTransformation):
             A sequence of coroutines to be executed in parallel.
         """
 
-        async def apply_split(node: Node):
+        fingerprint = self.fingerprint()
+
+        async def apply_split(node: Node, input_hash: t.Optional[str]):
             nodes, relationships = await self.split(node)
+            if input_hash is not None:
+                # the node changed since it was last split: replace its chunks
+                recorded = _get_transform_state(node, fingerprint)
+                for child_id in recorded[1] if recorded else []:
+                    child = kg.get_node_by_id(child_id)
+                    if child is not None:
+                        kg.remove_node(child)
+                _set_transform_state(
+                    node,
+                    fingerprint,
+                    [input_hash, [str(n.id) for n in nodes if n is not node]],
+                )
             kg.nodes.extend(nodes)
             kg.relationships.extend(relationships)
 
         filtered = self.filter(kg)
-        plan = [apply_split(node) for node in filtered.nodes]
+        plan = []
+        skipped = 0
+        for node in filtered.nodes:
+            input_hash = self.input_hash(node)
+            recorded = _get_transform_state(node, fingerprint)
+            if input_hash is not None and recorded and recorded[0] == input_hash:
+                skipped += 1
+                continue
+            plan.append(apply_split(node, input_hash))
         logger.debug(
-            "Created %d coroutines for %s",
+            "Created %d coroutines for %s (%d nodes up to date)",
             len(plan),
             self.__class__.__name__,
+            skipped,
         )
         return plan
 
@@ -341,6 +480,97 @@ class RelationshipBuilder(BaseGraphTransformation):
         Transforms the KnowledgeGraph by building relationships.
     """
 
+    def writes(self) -> t.Optional[t.Set[str]]:
+        return {RELATIONSHIPS}
+
+    def relationship_type(self) -> t.Optional[str]:
+        """
+        Type of the relationships the builder creates, or ``None`` if unknown (then
+        the builder always runs on the whole graph). Builders that return a type
+        must also declare their inputs with `reads`.
+        """
+        return None
+
+    async def transform_changed(
+        self, kg: KnowledgeGraph, changed: t.Set[uuid.UUID]
+    ) -> t.List[Relationship]:
+        """
+        Builds the relationships of ``kg`` that involve at least one node in
+        ``changed``. Builders that can search from a subset of nodes should
+        override this; the default runs `transform` and filters its output.
+        """
+        relationships = await self.transform(kg)
+        if len(changed) >= len(kg.nodes):
+            return relationships
+        return [
+            rel
+            for rel in relationships
+            if rel.source.id in changed or rel.target.id in changed
+        ]
+
+    def _incremental_plan(
+        self, kg: KnowledgeGraph, filtered_kg: KnowledgeGraph
+    ) -> t.Optional[t.List[t.Coroutine]]:
+        """
+        Plan that only rebuilds the relationships of nodes whose input changed
+        since the builder last ran, or ``None`` if that cannot be tracked.
+        """
+        relationship_type = self.relationship_type()
+        if relationship_type is None:
+            return None
+        fingerprint = self.fingerprint()
+        hashes = [self.input_hash(node) for node in filtered_kg.nodes]
+        if any(h is None for h in hashes):
+            return None
+        recorded = [
+            _get_transform_state(node, fingerprint) for node in filtered_kg.nodes
+        ]
+        changed = {
+            node.id for node, h, r in zip(filtered_kg.nodes, hashes, recorded) if h != r
+        }
+        if not changed:
+            logger.debug("%s is up to date", self.__class__.__name__)
+            return []
+        members = {node.id for node in filtered_kg.nodes}
+        if all(r is None for r in recorded):
+            # no state under this fingerprint (first run, or the builder's
+            # parameters changed): relationships of this type among the nodes
+            # are outdated
+            stale = members
+        else:
+            # only nodes the builder saw before can have relationships from it
+            stale = {
+                node.id
+                for node, h, r in zip(filtered_kg.nodes, hashes, recorded)
+                if r is not None and h != r
+            }
+
+        async def apply_build_changed():
+            relationships = await self.transform_changed(filtered_kg, changed)
+            if stale:
+                # assign a new list so the graph rebuilds its relationship index
+                kg.relationships = [
+                    rel
+                    for rel in kg.relationships
+                    if not (
+                        rel.type == relationship_type
+                        and (rel.source.id in stale or rel.target.id in stale)
+                        and rel.source.id in members
+                        and rel.target.id in members
+                    )
+                ]
+            kg.relationships.extend(relationships)
+            for node, h in zip(filtered_kg.nodes, hashes):
+                _set_transform_state(node, fingerprint, h)
+
+        logger.debug(
+            "Rebuilding relationships of %d of %d nodes for %s",
+            len(changed),
+            len(filtered_kg.nodes),
+            self.__class__.__name__,
+        )
+        return [apply_build_changed()]
+
     @abstractmethod
     async def transform(self, kg: KnowledgeGraph) -> t.List[Relationship]:
         """
@@ -380,6 +610,9 @@ class RelationshipBuilder(BaseGraphTransformation):
             original_kg.relationships.extend(relationships)
 
         filtered_kg = self.filter(kg)
+        plan = self._incremental_plan(kg, filtered_kg)
+        if plan is not None:
+            return plan
         plan = [apply_build_relationships(filtered_kg=filtered_kg, original_kg=kg)]
         logger.debug(
             "Created %d coroutines for %s",
@@ -404,6 +637,9 @@ class NodeFilter(BaseGraphTransformation):
                     raise ValueError("Error in removing node")
         return kg
 
+    def writes(self) -> t.Optional[t.Set[str]]:
+        return {NODES, RELATIONSHIPS}
+
     @abstractmethod
     async def custom_filter(self, node: Node, kg: KnowledgeGraph) -> bool:
         """
@@ -426,16 +662,32 @@ class NodeFilter(BaseGraphTransformation):
         Generates a sequence of coroutines to be executed
         """
 
-        async def apply_filter(node: Node):
+        fingerprint = self.fingerprint()
+
+        async def apply_filter(node: Node, input_hash: t.Optional[str]):
             if await self.custom_filter(node, kg):
                 kg.remove_node(node)
+            elif input_hash is not None:
+                _set_transform_state(node, fingerprint, input_hash)
 
         filtered = self.filter(kg)
-        plan = [apply_filter(node) for node in filtered.nodes]
+        plan = []
+        skipped = 0
+        for node in filtered.nodes:
+            input_hash = self.input_hash(node)
+            if (
+                input_hash is not None
+                and _get_transform_state(node, fingerprint) == input_hash
+            ):
+                # kept by this filter before and unchanged since
+                skipped += 1
+                continue
+            plan.append(apply_filter(node, input_hash))
         logger.debug(
-            "Created %d coroutines for %s",
+            "Created %d coroutines for %s (%d nodes up to date)",
             len(plan),
             self.__class__.__name__,
+            skipped,
         )
         return plan
 
@@ -4,9 +4,10 @@ import logging
 import typing as t
 
 from ragas.async_utils import apply_nest_asyncio, run_async_tasks
+from ragas.concurrency import AdaptiveConcurrencyLimiter
 from ragas.run_config import RunConfig
 from ragas.testset.graph import KnowledgeGraph
-from ragas.testset.transforms.base import BaseGraphTransformation
+from ragas.testset.transforms.base import NODES, RELATIONSHIPS, BaseGraphTransformation
 
 if t.TYPE_CHECKING:
     from langchain_core.callbacks import Callbacks
@@ -24,6 +25,12 @@ class Parallel:
     """
     Collection of transformations to be applied in parallel.
 
+    The execution plans of all transformations are merged into one task pool, so
+    independent transformations share the same concurrency window. Transformations
+    that conflict (one writes a property or graph structure the other reads or
+    writes, see `BaseGraphTransformation.reads` / `writes`) are run in successive
+    stages instead, in the order given.
+
     Examples
     --------
     >>> Parallel(HeadlinesExtractor(), SummaryExtractor())
@@ -32,6 +39,36 @@ class Parallel:
     def __init__(self, *transformations: t.Union[BaseGraphTransformation, "Parallel"]):
         self.transformations = list(transformations)
 
+    def flatten(self) -> t.List[BaseGraphTransformation]:
+        """The transformations of this and any nested `Parallel`, in order."""
+        flat = []
+        for transformation in self.transformations:
+            if isinstance(transformation, Parallel):
+                flat.extend(transformation.flatten())
+            else:
+                flat.append(transformation)
+        return flat
+
+    def stages(self) -> t.List[t.List[BaseGraphTransformation]]:
+        """
+        Group the transformations into stages that can each run concurrently.
+
+        Every transformation is placed in the stage after the last earlier
+        transformation it conflicts with.
+        """
+        stages: t.List[t.List[BaseGraphTransformation]] = []
+        placed: t.List[t.Tuple[BaseGraphTransformation, int]] = []
+        for transformation in self.flatten():
+            stage = 0
+            for other, other_stage in placed:
+                if transformations_conflict(other, transformation):
+                    stage = max(stage, other_stage + 1)
+            if stage == len(stages):
+                stages.append([])
+            stages[stage].append(transformation)
+            placed.append((transformation, stage))
+        return stages
+
     def generate_execution_plan(self, kg: KnowledgeGraph) -> t.Sequence[t.Coroutine]:
         coroutines = []
         for transformation in self.transformations:
@@ -43,6 +80,34 @@ class Parallel:
         return coroutines
 
 
+def transformations_conflict(
+    first: BaseGraphTransformation, second: BaseGraphTransformation
+) -> bool:
+    """
+    Whether two transformations can interfere when run concurrently.
+
+    Every transformation implicitly reads the node list (to build its plan), so
+    one that adds or removes nodes conflicts with all others. Relationships added
+    by two transformations do not conflict, since additions commute.
+    """
+    reads_first, writes_first = first.reads(), first.writes()
+    reads_second, writes_second = second.reads(), second.writes()
+    if (
+        reads_first is None
+        or writes_first is None
+        or reads_second is None
+        or writes_second is None
+    ):
+        return True
+    reads_first = reads_first | {NODES}
+    reads_second = reads_second | {NODES}
+    return bool(
+        writes_first & reads_second
+        or writes_second & reads_first
+        or (writes_first & writes_second) - {RELATIONSHIPS}
+    )
+
+
 def get_desc(transform: BaseGraphTransformation | Parallel):
     if isinstance(transform, Parallel):
         transform_names = [t.__class__.__name__ for t in transform.transformations]
@@ -56,20 +121,51 @@ def apply_transforms(
     transforms: Transforms,
     run_config: RunConfig = RunConfig(),
     callbacks: t.Optional[Callbacks] = None,
+    concurrency_limiter: t.Optional[AdaptiveConcurrencyLimiter] = None,
 ):
     """
     Recursively apply transformations to a knowledge graph in place.
+
+    When ``run_config.adaptive_concurrency`` is enabled, a single adaptive
+    limiter is shared by all transformations (unless one is passed in), so what
+    it learns about the provider carries over from one transformation to the next.
     """
     # apply nest_asyncio to fix the event loop issue in jupyter
     apply_nest_asyncio()
 
     max_workers = getattr(run_config, "max_workers", -1)
+    owns_limiter = False
+    if concurrency_limiter is None and getattr(
+        run_config, "adaptive_concurrency", False
+    ):
+        concurrency_limiter = AdaptiveConcurrencyLimiter.from_run_config(run_config)
+        owns_limiter = True
 
     if isinstance(transforms, t.Sequence):
         for transform in transforms:
-            apply_transforms(kg, transform, run_config, callbacks)
+            apply_transforms(kg, transform, run_config, callbacks, concurrency_limiter)
     elif isinstance(transforms, Parallel):
-        apply_transforms(kg, transforms.transformations, run_config, callbacks)
+        for stage in transforms.stages():
+            if len(stage) == 1:
+                apply_transforms(
+                    kg, stage[0], run_config, callbacks, concurrency_limiter
+                )
+                continue
+            # one task pool (and progress bar) for all independent transformations
+            coros = []
+            for transform in stage:
+                logger.debug(
+                    f"Generating execution plan for transformation {transform.__class__.__name__}"
+                )
+                coros.extend(transform.generate_execution_plan(kg))
+            run_async_tasks(
+                coros,
+                batch_size=None,
+                show_progress=True,
+                progress_bar_desc=get_desc(Parallel(*stage)),
+                max_workers=max_workers,
+                limiter=concurrency_limiter,
+            )
     elif isinstance(transforms, BaseGraphTransformation):
         logger.debug(
             f"Generating execution plan for transformation {transforms.__class__.__name__}"
@@ -82,11 +178,16 @@ def apply_transforms(
             show_progress=True,
             progress_bar_desc=desc,
             max_workers=max_workers,
+            limiter=concurrency_limiter,
         )
     else:
         raise ValueError(
             f"Invalid transforms type: {type(transforms)}. Expects a sequence of BaseGraphTransformations or a Parallel instance."
         )
+    if owns_limiter and concurrency_limiter is not None:
+        logger.info(
+            "Adaptive concurrency settled at %d workers", concurrency_limiter.limit
+        )
     logger.debug("All transformations applied successfully.")
 
 
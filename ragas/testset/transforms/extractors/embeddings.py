@@ -29,6 +29,9 @@ class EmbeddingExtractor(Extractor):
         default_factory=embedding_factory
     )
 
+    def reads(self) -> t.Optional[t.Set[str]]:
+        return {self.embed_property_name}
+
     async def extract(self, node: Node) -> t.Tuple[str, t.Any]:
         """
         Extracts the embedding for a given node.
@@ -172,6 +172,9 @@ class SummaryExtractor(LLMBasedExtractor):
     property_name: str = "summary"
     prompt: SummaryExtractorPrompt = SummaryExtractorPrompt()
 
+    def reads(self) -> t.Optional[t.Set[str]]:
+        return {"page_content"}
+
     async def extract(self, node: Node) -> t.Tuple[str, t.Any]:
         node_text = node.get_property("page_content")
         if node_text is None:
@@ -198,6 +201,9 @@ class KeyphrasesExtractor(LLMBasedExtractor):
     prompt: KeyphrasesExtractorPrompt = KeyphrasesExtractorPrompt()
     max_num: int = 5
 
+    def reads(self) -> t.Optional[t.Set[str]]:
+        return {"page_content"}
+
     async def extract(self, node: Node) -> t.Tuple[str, t.Any]:
         node_text = node.get_property("page_content")
         if node_text is None:
@@ -228,6 +234,9 @@ class TitleExtractor(LLMBasedExtractor):
     property_name: str = "title"
     prompt: TitleExtractorPrompt = TitleExtractorPrompt()
 
+    def reads(self) -> t.Optional[t.Set[str]]:
+        return {"page_content"}
+
     async def extract(self, node: Node) -> t.Tuple[str, t.Any]:
         node_text = node.get_property("page_content")
         if node_text is None:
@@ -254,6 +263,9 @@ class HeadlinesExtractor(LLMBasedExtractor):
     prompt: HeadlinesExtractorPrompt = HeadlinesExtractorPrompt()
     max_num: int = 5
 
+    def reads(self) -> t.Optional[t.Set[str]]:
+        return {"page_content"}
+
     async def extract(self, node: Node) -> t.Tuple[str, t.Any]:
         node_text = node.get_property("page_content")
         if node_text is None:
@@ -286,6 +298,9 @@ class NERExtractor(LLMBasedExtractor):
     prompt: PydanticPrompt[TextWithExtractionLimit, NEROutput] = NERPrompt()
     max_num_entities: int = 10
 
+    def reads(self) -> t.Optional[t.Set[str]]:
+        return {"page_content"}
+
     async def extract(self, node: Node) -> t.Tuple[str, t.List[str]]:
         node_text = node.get_property("page_content")
         if node_text is None:
@@ -337,6 +352,9 @@ class TopicDescriptionExtractor(LLMBasedExtractor):
     property_name: str = "topic_description"
     prompt: PydanticPrompt = TopicDescriptionPrompt()
 
+    def reads(self) -> t.Optional[t.Set[str]]:
+        return {"page_content"}
+
     async def extract(self, node: Node) -> t.Tuple[str, t.Any]:
         node_text = node.get_property("page_content")
         if node_text is None:
@@ -393,6 +411,9 @@ class ThemesExtractor(LLMBasedExtractor):
     prompt: ThemesAndConceptsExtractorPrompt = ThemesAndConceptsExtractorPrompt()
     max_num_themes: int = 10
 
+    def reads(self) -> t.Optional[t.Set[str]]:
+        return {"page_content"}
+
     async def extract(self, node: Node) -> t.Tuple[str, t.List[str]]:
         node_text = node.get_property("page_content")
         if node_text is None:
@@ -12,6 +12,9 @@ class RegexBasedExtractor(Extractor):
     is_multiline: bool = False
     property_name: str = "regex"
 
+    def reads(self) -> t.Optional[t.Set[str]]:
+        return {"page_content"}
+
     async def extract(self, node: Node) -> t.Tuple[str, t.Any]:
         text = node.get_property("page_content")
         if not isinstance(text, str):
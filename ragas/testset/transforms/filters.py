@@ -61,6 +61,10 @@ class CustomNodeFilter(LLMBasedNodeFilter):
     min_score: int = 2
     rubrics: t.Dict[str, str] = field(default_factory=lambda: DEFAULT_RUBRICS)
 
+    def reads(self) -> t.Optional[t.Set[str]]:
+        # chunks are scored against their parent's summary, which only gives context
+        return {"page_content", "summary"}
+
     async def custom_filter(self, node: Node, kg: KnowledgeGraph) -> bool:
         if node.type.name == "CHUNK":
             parent_nodes = get_parent_nodes(node, kg)
@@ -1,51 +1,98 @@
 import typing as t
+import uuid
 from dataclasses import dataclass
 
-import numpy as np
-
-from ragas.testset.graph import KnowledgeGraph, NodeType, Relationship
+from ragas.testset.graph import KnowledgeGraph, Node, NodeType, Relationship
 from ragas.testset.transforms.base import RelationshipBuilder
+from ragas.testset.transforms.relationship_builders.similarity import (
+    exact_similar_pairs,
+    lsh_similar_pairs,
+    normalize_embeddings,
+    similar_pairs_with,
+)
 
 
 @dataclass
 class CosineSimilarityBuilder(RelationshipBuilder):
+    """
+    Builds relationships between nodes whose embeddings have a cosine similarity of
+    at least ``threshold``.
+
+    Attributes
+    ----------
+    block_size : int
+        Number of embeddings per block of the similarity matrix.
+    max_workers : int, optional
+        Threads used by the exact search; defaults to the number of CPUs.
+    index : str
+        ``"exact"`` compares every pair of nodes. ``"lsh"`` only compares nodes that
+        share a random-projection hash bucket, which is near-linear on large graphs
+        but may miss a small fraction of pairs close to the threshold.
+    lsh_tables : int
+        Number of LSH hash tables. More tables find more pairs for the same speed.
+    lsh_recall : float
+        Target probability of finding a pair right at the threshold; lower values
+        use narrower buckets and run faster.
+    seed : int
+        Seed for the LSH hyperplanes.
+    """
+
     property_name: str = "embedding"
     new_property_name: str = "cosine_similarity"
     threshold: float = 0.9
     block_size: int = 1024
-
-    def _block_cosine_similarity(self, i: np.ndarray, j: np.ndarray):
-        """Calculate cosine similarity matrix between two sets of embeddings."""
-        i_norm = i / np.linalg.norm(i, axis=1, keepdims=True)
-        j_norm = j / np.linalg.norm(j, axis=1, keepdims=True)
-        return np.dot(i_norm, j_norm.T)
-
-    def _find_similar_embedding_pairs(
-        self, embeddings: np.ndarray, threshold: float
-    ) -> t.List[t.Tuple[int, int, float]]:
-        """Sharded computation of cosine similarity to find similar pairs."""
-
-        def process_block(i: int, j: int) -> t.Set[t.Tuple[int, int, float]]:
-            end_i = min(i + self.block_size, n_embeddings)
-            end_j = min(j + self.block_size, n_embeddings)
-            block = self._block_cosine_similarity(
-                embeddings[i:end_i, :], embeddings[j:end_j, :]
+    max_workers: t.Optional[int] = None
+    index: t.Literal["exact", "lsh"] = "exact"
+    lsh_tables: int = 16
+    lsh_recall: float = 0.95
+    seed: int = 42
+
+    def reads(self) -> t.Optional[t.Set[str]]:
+        return {self.property_name}
+
+    def relationship_type(self) -> t.Optional[str]:
+        return self.new_property_name
+
+    def _similar_pairs(
+        self, embeddings: t.List[t.Any]
+    ) -> t.Iterator[t.Tuple[int, int, float]]:
+        """Yield ``(i, j, similarity)`` for similar pairs using the configured index."""
+        matrix = normalize_embeddings(embeddings)
+        if self.index == "lsh":
+            rows, cols, scores = lsh_similar_pairs(
+                matrix,
+                self.threshold,
+                n_tables=self.lsh_tables,
+                recall=self.lsh_recall,
+                block_size=self.block_size,
+                seed=self.seed,
             )
-            similar_idx = np.argwhere(block >= threshold)
-            return {
-                (int(i + ii), int(j + jj), float(block[ii, jj]))
-                for ii, jj in similar_idx
-                if int(i + ii) < int(j + jj)
-            }
-
-        n_embeddings, _dimension = embeddings.shape
-        triplets = set()
-
-        for i in range(0, n_embeddings, self.block_size):
-            for j in range(i, n_embeddings, self.block_size):
-                triplets.update(process_block(i, j))
+        elif self.index == "exact":
+            rows, cols, scores = exact_similar_pairs(
+                matrix,
+                self.threshold,
+                block_size=self.block_size,
+                max_workers=self.max_workers,
+            )
+        else:
+            raise ValueError(
+                f"Unknown index {self.index!r}. Expected 'exact' or 'lsh'."
+            )
+        return zip(rows.tolist(), cols.tolist(), scores.tolist())
 
-        return list(triplets)
+    def _build_relationships(
+        self, nodes: t.List[Node], embeddings: t.List[t.Any]
+    ) -> t.List[Relationship]:
+        return [
+            Relationship(
+                source=nodes[i],
+                target=nodes[j],
+                type=self.new_property_name,
+                properties={self.new_property_name: similarity_float},
+                bidirectional=True,
+            )
+            for i, j, similarity_float in self._similar_pairs(embeddings)
+        ]
 
     def _validate_embedding_shapes(self, embeddings: t.List[t.Any]):
         if not embeddings:
@@ -58,7 +105,7 @@ class CosineSimilarityBuilder(RelationshipBuilder):
                     "All embeddings must have the same length."
                 )
 
-    async def transform(self, kg: KnowledgeGraph) -> t.List[Relationship]:
+    def _get_embeddings(self, kg: KnowledgeGraph) -> t.List[t.Any]:
         embeddings = []
         for node in kg.nodes:
             embedding = node.get_property(self.property_name)
@@ -66,8 +113,25 @@ class CosineSimilarityBuilder(RelationshipBuilder):
                 raise ValueError(f"Node {node.id} has no {self.property_name}")
             embeddings.append(embedding)
         self._validate_embedding_shapes(embeddings)
-        similar_pairs = self._find_similar_embedding_pairs(
-            np.array(embeddings), self.threshold
+        return embeddings
+
+    async def transform(self, kg: KnowledgeGraph) -> t.List[Relationship]:
+        embeddings = self._get_embeddings(kg)
+        return self._build_relationships(kg.nodes, embeddings)
+
+    async def transform_changed(
+        self, kg: KnowledgeGraph, changed: t.Set[uuid.UUID]
+    ) -> t.List[Relationship]:
+        embeddings = self._get_embeddings(kg)
+        if len(changed) >= len(kg.nodes):
+            return self._build_relationships(kg.nodes, embeddings)
+        # compare only the changed nodes against the graph; always exact
+        rows = [i for i, node in enumerate(kg.nodes) if node.id in changed]
+        pairs = similar_pairs_with(
+            normalize_embeddings(embeddings),
+            rows,
+            self.threshold,
+            block_size=self.block_size,
         )
         return [
             Relationship(
@@ -77,7 +141,7 @@ class CosineSimilarityBuilder(RelationshipBuilder):
                 properties={self.new_property_name: similarity_float},
                 bidirectional=True,
             )
-            for i, j, similarity_float in similar_pairs
+            for i, j, similarity_float in zip(*(a.tolist() for a in pairs))
         ]
 
     def generate_execution_plan(self, kg: KnowledgeGraph) -> t.List[t.Coroutine]:
@@ -85,28 +149,15 @@ class CosineSimilarityBuilder(RelationshipBuilder):
         Generates a coroutine task for finding similar embedding pairs, which can be scheduled/executed by an Executor.
         """
         filtered_kg = self.filter(kg)
-
-        embeddings = []
-        for node in filtered_kg.nodes:
-            embedding = node.get_property(self.property_name)
-            if embedding is None:
-                raise ValueError(f"Node {node.id} has no {self.property_name}")
-            embeddings.append(embedding)
-        self._validate_embedding_shapes(embeddings)
+        embeddings = self._get_embeddings(filtered_kg)
+        plan = self._incremental_plan(kg, filtered_kg)
+        if plan is not None:
+            return plan
 
         async def find_and_add_relationships():
-            similar_pairs = self._find_similar_embedding_pairs(
-                np.array(embeddings), self.threshold
+            kg.relationships.extend(
+                self._build_relationships(filtered_kg.nodes, embeddings)
             )
-            for i, j, similarity_float in similar_pairs:
-                rel = Relationship(
-                    source=filtered_kg.nodes[i],
-                    target=filtered_kg.nodes[j],
-                    type=self.new_property_name,
-                    properties={self.new_property_name: similarity_float},
-                    bidirectional=True,
-                )
-                kg.relationships.append(rel)
 
         return [find_and_add_relationships()]
 
@@ -140,16 +191,4 @@ class SummaryCosineSimilarityBuilder(CosineSimilarityBuilder):
         ]
         if not embeddings:
             raise ValueError(f"No nodes have a valid {self.property_name}")
-        similar_pairs = self._find_similar_embedding_pairs(
-            np.array(embeddings), self.threshold
-        )
-        return [
-            Relationship(
-                source=filtered_kg.nodes[i],
-                target=filtered_kg.nodes[j],
-                type=self.new_property_name,
-                properties={self.new_property_name: similarity_float},
-                bidirectional=True,
-            )
-            for i, j, similarity_float in similar_pairs
-        ]
+        return self._build_relationships(filtered_kg.nodes, embeddings)
@@ -0,0 +1,621 @@
+"""Engines for thresholded cosine- and Jaccard-similarity pair search."""
+
+import bisect
+import logging
+import math
+import os
+import typing as t
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# buckets up to this size are expanded into explicit candidate pairs; larger ones
+# are compared with blocked matrix products
+_SMALL_BUCKET = 64
+_MAX_BITS = 62
+
+PairArrays = t.Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+def empty_pairs() -> PairArrays:
+    return (
+        np.empty(0, dtype=np.int64),
+        np.empty(0, dtype=np.int64),
+        np.empty(0, dtype=np.float32),
+    )
+
+
+def normalize_embeddings(embeddings: t.Any) -> np.ndarray:
+    """Return embeddings as a contiguous, L2-normalised float32 matrix."""
+    matrix = np.array(embeddings, dtype=np.float32)
+    if matrix.ndim != 2:
+        raise ValueError(f"Expected a 2D embedding matrix, got shape {matrix.shape}")
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    matrix /= norms
+    return matrix
+
+
+def lsh_bits_for_recall(threshold: float, n_tables: int, recall: float) -> int:
+    """
+    Number of hyperplanes per table so that a pair at exactly ``threshold`` cosine
+    similarity collides in at least one of ``n_tables`` tables with probability
+    ``recall``. Pairs that are more similar collide more often.
+    """
+    threshold = min(max(threshold, -1.0), 1.0)
+    # probability that one random hyperplane does not separate the pair
+    p = 1.0 - math.acos(threshold) / math.pi
+    if p >= 1.0:
+        return _MAX_BITS
+    per_table = 1.0 - (1.0 - recall) ** (1.0 / n_tables)
+    if per_table <= 0.0 or p <= 0.0:
+        return 1
+    bits = int(math.floor(math.log(per_table) / math.log(p)))
+    return min(max(bits, 1), _MAX_BITS)
+
+
+def _sorted_unique(keys: np.ndarray) -> np.ndarray:
+    # sort-based unique; much faster than hashing for large int64 arrays
+    keys.sort()
+    if len(keys) < 2:
+        return keys
+    return keys[np.concatenate(([True], keys[1:] != keys[:-1]))]
+
+
+def _block_pairs(
+    left: np.ndarray, right: np.ndarray, threshold: float, diagonal: bool
+) -> t.Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Thresholded pairs of one block; local indices, upper triangle if diagonal."""
+    block = left @ right.T
+    ii, jj = np.nonzero(block >= threshold)
+    if diagonal:
+        keep = ii < jj
+        ii, jj = ii[keep], jj[keep]
+    return ii, jj, block[ii, jj]
+
+
+def _concat_pairs(
+    rows: t.List[np.ndarray], cols: t.List[np.ndarray], scores: t.List[np.ndarray]
+) -> PairArrays:
+    if not rows:
+        return empty_pairs()
+    return (
+        np.concatenate(rows).astype(np.int64, copy=False),
+        np.concatenate(cols).astype(np.int64, copy=False),
+        np.concatenate(scores).astype(np.float32, copy=False),
+    )
+
+
+def exact_similar_pairs(
+    matrix: np.ndarray,
+    threshold: float,
+    block_size: int = 1024,
+    max_workers: t.Optional[int] = None,
+) -> PairArrays:
+    """
+    Find all pairs ``(i, j)``, ``i < j``, with cosine similarity >= ``threshold``.
+
+    The upper triangle of the similarity matrix is split into
+    ``block_size x block_size`` blocks which are computed on a thread pool; the
+    matrix products release the GIL, so blocks run in parallel.
+
+    Parameters
+    ----------
+    matrix : np.ndarray
+        L2-normalised embeddings, one row per node (see `normalize_embeddings`).
+    threshold : float
+        Minimum cosine similarity of reported pairs.
+    block_size : int
+        Number of rows per block.
+    max_workers : int, optional
+        Number of threads; defaults to the number of CPUs.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray, np.ndarray]
+        Row indices, column indices and similarities of the pairs, ordered by
+        block.
+    """
+    n = matrix.shape[0]
+    if n < 2:
+        return empty_pairs()
+    starts = range(0, n, block_size)
+    block_pairs = [(i, j) for i in starts for j in starts if j >= i]
+
+    def process_block(i: int, j: int) -> PairArrays:
+        ii, jj, scores = _block_pairs(
+            matrix[i : i + block_size], matrix[j : j + block_size], threshold, i == j
+        )
+        return ii + i, jj + j, scores
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = min(max_workers, len(block_pairs))
+    if max_workers <= 1:
+        results = [process_block(i, j) for i, j in block_pairs]
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            results = list(pool.map(lambda ij: process_block(*ij), block_pairs))
+
+    return _concat_pairs(
+        [r for r, _, _ in results],
+        [c for _, c, _ in results],
+        [s for _, _, s in results],
+    )
+
+
+def similar_pairs_with(
+    matrix: np.ndarray,
+    rows: t.Sequence[int],
+    threshold: float,
+    block_size: int = 1024,
+) -> PairArrays:
+    """
+    Find all pairs ``(i, j)``, ``i < j``, with cosine similarity >= ``threshold``
+    that involve at least one of ``rows``.
+
+    Costs ``len(rows) x n`` dot products instead of the ``n x n`` of
+    `exact_similar_pairs`, for updating the pairs of a few changed rows.
+    """
+    n = matrix.shape[0]
+    query = np.unique(np.asarray(rows, dtype=np.int64))
+    if n < 2 or query.size == 0:
+        return empty_pairs()
+    is_query = np.zeros(n, dtype=bool)
+    is_query[query] = True
+    found_rows, found_cols, found_scores = [], [], []
+    for start in range(0, query.size, block_size):
+        chunk = query[start : start + block_size]
+        ii, jj, scores = _block_pairs(matrix[chunk], matrix, threshold, False)
+        ii = chunk[ii]
+        # pairs of two queried rows show up twice; keep the one with ii < jj
+        keep = (ii != jj) & ~(is_query[jj] & (jj < ii))
+        ii, jj, scores = ii[keep], jj[keep], scores[keep]
+        found_rows.append(np.minimum(ii, jj))
+        found_cols.append(np.maximum(ii, jj))
+        found_scores.append(scores)
+    return _concat_pairs(found_rows, found_cols, found_scores)
+
+
+def _pairs_in_subset(
+    matrix: np.ndarray, members: np.ndarray, threshold: float, block_size: int
+) -> PairArrays:
+    """Exact thresholded pairs among ``members`` (indices into ``matrix``)."""
+    members = np.sort(members)
+    rows, cols, scores = exact_similar_pairs(
+        matrix[members], threshold, block_size, max_workers=1
+    )
+    return members[rows], members[cols], scores
+
+
+def _bucket_candidates(
+    codes: np.ndarray,
+) -> t.Tuple[t.List[np.ndarray], t.List[np.ndarray]]:
+    """
+    Group rows by hash code.
+
+    Returns the pair keys ``i * n + j`` (``i < j``) of rows sharing a small bucket,
+    and the members of buckets larger than ``_SMALL_BUCKET``.
+    """
+    n = len(codes)
+    order = np.argsort(codes, kind="stable")
+    sorted_codes = codes[order]
+    group_id = np.concatenate(([0], np.cumsum(sorted_codes[1:] != sorted_codes[:-1])))
+    sizes = np.bincount(group_id)
+    small = sizes[group_id] <= _SMALL_BUCKET
+
+    # pair every position with the next d positions of its bucket
+    keys = []
+    max_small = int(sizes[sizes <= _SMALL_BUCKET].max()) if small.any() else 0
+    for d in range(1, max_small):
+        same = (group_id[:-d] == group_id[d:]) & small[:-d]
+        if not same.any():
+            break
+        a = order[:-d][same]
+        b = order[d:][same]
+        keys.append(np.minimum(a, b) * n + np.maximum(a, b))
+
+    large = [order[group_id == gid] for gid in np.nonzero(sizes > _SMALL_BUCKET)[0]]
+    return keys, large
+
+
+def lsh_similar_pairs(
+    matrix: np.ndarray,
+    threshold: float,
+    n_tables: int = 16,
+    recall: float = 0.95,
+    block_size: int = 1024,
+    seed: int = 42,
+) -> PairArrays:
+    """
+    Find pairs ``(i, j)``, ``i < j``, with cosine similarity >= ``threshold``.
+
+    Each of ``n_tables`` hash tables buckets the vectors by the signs of their
+    projections on random hyperplanes; only vectors sharing a bucket in some table
+    are compared. Every reported pair is verified exactly, so there are no false
+    positives; ``recall`` (the chance of finding a pair right at the threshold)
+    trades completeness for speed through the number of hyperplanes per table.
+
+    Parameters
+    ----------
+    matrix : np.ndarray
+        L2-normalised embeddings, one row per node.
+    threshold : float
+        Minimum cosine similarity of reported pairs.
+    n_tables : int
+        Number of hash tables; more tables give higher recall at a given speed.
+    recall : float
+        Target probability of finding a pair whose similarity equals ``threshold``.
+    block_size : int
+        Block size for comparing vectors in large buckets.
+    seed : int
+        Seed for the random hyperplanes.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray, np.ndarray]
+        Row indices, column indices and similarities of the pairs.
+    """
+    n, dim = matrix.shape
+    if n < 2:
+        return empty_pairs()
+    n_bits = lsh_bits_for_recall(threshold, n_tables, recall)
+    logger.debug(
+        "LSH search over %d vectors with %d tables x %d bits", n, n_tables, n_bits
+    )
+
+    rng = np.random.default_rng(seed)
+    weights = (np.int64(1) << np.arange(n_bits, dtype=np.int64)).astype(np.int64)
+    candidate_keys = []
+    verified: t.List[PairArrays] = []
+
+    for _ in range(n_tables):
+        planes = rng.standard_normal((dim, n_bits)).astype(np.float32)
+        codes = ((matrix @ planes) > 0).astype(np.int64) @ weights
+
+        keys, large = _bucket_candidates(codes)
+        candidate_keys.extend(keys)
+        for members in large:
+            # large buckets: compare blockwise without materialising all pairs
+            verified.append(_pairs_in_subset(matrix, members, threshold, block_size))
+
+    rows_list, cols_list, scores_list = [], [], []
+    if candidate_keys:
+        keys = _sorted_unique(np.concatenate(candidate_keys))
+        rows, cols = keys // n, keys % n
+        for start in range(0, len(keys), 1 << 20):
+            r = rows[start : start + (1 << 20)]
+            c = cols[start : start + (1 << 20)]
+            scores = np.einsum("ij,ij->i", matrix[r], matrix[c])
+            keep = scores >= threshold
+            rows_list.append(r[keep])
+            cols_list.append(c[keep])
+            scores_list.append(scores[keep])
+    for r, c, s in verified:
+        rows_list.append(r)
+        cols_list.append(c)
+        scores_list.append(s)
+    if not rows_list:
+        return empty_pairs()
+
+    rows = np.concatenate(rows_list)
+    cols = np.concatenate(cols_list)
+    scores = np.concatenate(scores_list).astype(np.float32)
+    # pairs can be found by several tables
+    order = np.argsort(rows * n + cols, kind="stable")
+    rows, cols, scores = rows[order], cols[order], scores[order]
+    first = np.ones(len(rows), dtype=bool)
+    first[1:] = (rows[1:] != rows[:-1]) | (cols[1:] != cols[:-1])
+    return rows[first], cols[first], scores[first]
+
+
+ItemSets = t.Sequence[t.AbstractSet[t.Hashable]]
+
+
+def _jaccard(set1: t.AbstractSet[t.Hashable], set2: t.AbstractSet[t.Hashable]) -> float:
+    union = len(set1 | set2)
+    return len(set1 & set2) / union if union > 0 else 0.0
+
+
+def _triples_to_pairs(
+    rows: t.List[int], cols: t.List[int], scores: t.List[float]
+) -> PairArrays:
+    return (
+        np.asarray(rows, dtype=np.int64),
+        np.asarray(cols, dtype=np.int64),
+        np.asarray(scores, dtype=np.float32),
+    )
+
+
+def inverted_index_jaccard_pairs(item_sets: ItemSets, threshold: float) -> PairArrays:
+    """
+    Find all pairs ``(i, j)``, ``i < j``, with Jaccard similarity >= ``threshold``.
+
+    Only pairs sharing at least one item are compared, found through an inverted
+    index from item to set indices; this is exact and fast when sets are sparse
+    relative to the vocabulary. Requires ``threshold > 0``, since pairs without
+    shared items have similarity 0.
+    """
+    if threshold <= 0:
+        raise ValueError("The inverted index requires a positive threshold")
+    postings: t.DefaultDict[t.Hashable, t.List[int]] = defaultdict(list)
+    for i, items in enumerate(item_sets):
+        for item in items:
+            postings[item].append(i)
+    sizes = [len(items) for items in item_sets]
+
+    rows, cols, scores = [], [], []
+    for i, items in enumerate(item_sets):
+        intersections: t.Counter[int] = Counter()
+        for item in items:
+            posting = postings[item]
+            intersections.update(posting[bisect.bisect_right(posting, i) :])
+        for j, intersection in intersections.items():
+            similarity = intersection / (sizes[i] + sizes[j] - intersection)
+            if similarity >= threshold:
+                rows.append(i)
+                cols.append(j)
+                scores.append(similarity)
+    return _triples_to_pairs(rows, cols, scores)
+
+
+# Mersenne prime for the universal hash functions; a * x stays below 2**62
+_MINHASH_PRIME = (1 << 31) - 1
+
+
+def minhash_signatures(
+    item_sets: ItemSets, num_perm: int = 128, seed: int = 42
+) -> np.ndarray:
+    """
+    MinHash signatures of ``item_sets`` as an ``(n_sets, num_perm)`` int64 matrix.
+
+    Empty sets get the signature ``-1`` in every position.
+    """
+    vocabulary: t.Dict[t.Hashable, int] = {}
+    ids, indptr = [], [0]
+    for items in item_sets:
+        ids.extend(vocabulary.setdefault(item, len(vocabulary)) for item in items)
+        indptr.append(len(ids))
+    ids_arr = np.asarray(ids, dtype=np.int64)
+    lengths = np.diff(np.asarray(indptr, dtype=np.int64))
+    non_empty = lengths > 0
+
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, _MINHASH_PRIME, num_perm, dtype=np.int64)
+    b = rng.integers(0, _MINHASH_PRIME, num_perm, dtype=np.int64)
+
+    signatures = np.full((len(item_sets), num_perm), -1, dtype=np.int64)
+    if not len(ids_arr):
+        return signatures
+    starts = np.asarray(indptr[:-1], dtype=np.int64)[non_empty]
+    # bound memory to roughly 2**24 hash values per chunk
+    chunk = max(1, (1 << 24) // len(ids_arr))
+    for p in range(0, num_perm, chunk):
+        hashes = (a[p : p + chunk, None] * ids_arr + b[p : p + chunk, None]) % (
+            _MINHASH_PRIME
+        )
+        signatures[non_empty, p : p + chunk] = np.minimum.reduceat(
+            hashes, starts, axis=1
+        ).T
+    return signatures
+
+
+def minhash_band_rows(threshold: float, num_perm: int, recall: float) -> int:
+    """
+    Rows per band so that a pair at exactly ``threshold`` Jaccard similarity shares
+    at least one band with probability ``recall``.
+    """
+    best = 1
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        if 1.0 - (1.0 - threshold**rows) ** bands >= recall:
+            best = rows
+    return best
+
+
+def minhash_similar_pairs(
+    item_sets: ItemSets,
+    threshold: float,
+    num_perm: int = 128,
+    recall: float = 0.95,
+    verify: bool = True,
+    seed: int = 42,
+) -> PairArrays:
+    """
+    Find pairs ``(i, j)``, ``i < j``, with Jaccard similarity >= ``threshold``
+    using MinHash signatures and banded LSH.
+
+    Sets sharing a band of their signatures are candidates. With ``verify`` the
+    candidates are checked with the exact Jaccard similarity, so there are no
+    false positives; otherwise the similarity is estimated from the signatures.
+    Either way a small fraction of pairs close to the threshold may be missed.
+
+    Parameters
+    ----------
+    item_sets : Sequence[Set]
+        One set of items per node.
+    threshold : float
+        Minimum Jaccard similarity of reported pairs.
+    num_perm : int
+        Number of hash functions in each signature.
+    recall : float
+        Target probability of finding a pair whose similarity equals ``threshold``.
+    verify : bool
+        Whether to compute the exact similarity of candidate pairs.
+    seed : int
+        Seed for the hash functions.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray, np.ndarray]
+        Row indices, column indices and similarities of the pairs.
+    """
+    n = len(item_sets)
+    if n < 2 or threshold > 1:
+        return empty_pairs()
+    signatures = minhash_signatures(item_sets, num_perm, seed)
+    band_rows = minhash_band_rows(max(threshold, 0.0), num_perm, recall)
+    logger.debug(
+        "MinHash search over %d sets with %d bands x %d rows",
+        n,
+        num_perm // band_rows,
+        band_rows,
+    )
+
+    # empty sets have similarity 0 with everything; keep them out of the buckets
+    non_empty = np.nonzero(signatures[:, 0] >= 0)[0]
+    weights = (
+        np.random.default_rng(seed + 1).integers(1, 1 << 62, band_rows, dtype=np.int64)
+        | 1
+    )
+    candidate_keys = []
+    for start in range(0, num_perm - band_rows + 1, band_rows):
+        band = signatures[non_empty, start : start + band_rows]
+        # int64 overflow wraps around, which is fine for a hash
+        with np.errstate(over="ignore"):
+            codes = band @ weights
+        keys, large = _bucket_candidates(codes)
+        for key in keys:
+            rows, cols = key // len(non_empty), key % len(non_empty)
+            candidate_keys.append(non_empty[rows] * n + non_empty[cols])
+        for members in large:
+            members = np.sort(non_empty[members])
+            ii, jj = np.triu_indices(len(members), k=1)
+            candidate_keys.append(members[ii] * n + members[jj])
+    if not candidate_keys:
+        return empty_pairs()
+    keys = _sorted_unique(np.concatenate(candidate_keys))
+    rows, cols = keys // n, keys % n
+
+    if verify:
+        scores = np.fromiter(
+            (
+                _jaccard(item_sets[i], item_sets[j])
+                for i, j in zip(rows.tolist(), cols.tolist())
+            ),
+            dtype=np.float32,
+            count=len(rows),
+        )
+    else:
+        scores = np.concatenate(
+            [
+                (signatures[rows[k : k + 4096]] == signatures[cols[k : k + 4096]]).mean(
+                    axis=1
+                )
+                for k in range(0, len(rows), 4096)
+            ]
+        ).astype(np.float32)
+    keep = scores >= threshold
+    return rows[keep], cols[keep], scores[keep]
+
+
+def _padded_ngrams(text: str, n: int) -> t.Set[str]:
+    padded = f"\x02{text}\x03"
+    return {padded[k : k + n] for k in range(max(1, len(padded) - n + 1))}
+
+
+def fuzzy_match_pairs(
+    strings: t.Sequence[str],
+    scorer: t.Callable[..., t.Any],
+    max_distance: float,
+    ngram: t.Optional[int] = None,
+    chunk_size: int = 512,
+    workers: int = -1,
+) -> t.Tuple[np.ndarray, np.ndarray]:
+    """
+    Find pairs ``(i, j)``, ``i < j``, of strings whose ``scorer`` distance is at
+    most ``max_distance``.
+
+    Scoring runs in batches through ``rapidfuzz.process.cdist``. With ``ngram`` set,
+    a blocking index restricts each batch to strings sharing a padded character
+    n-gram with it, and only such pairs are reported; pairs without a common
+    n-gram (e.g. no common character for bigrams) are treated as non-matches,
+    so blocking is approximate: it can miss pairs within ``max_distance``.
+
+    Parameters
+    ----------
+    strings : Sequence[str]
+        Distinct strings to match.
+    scorer : Callable
+        A rapidfuzz distance function, e.g. ``rapidfuzz.distance.JaroWinkler.distance``.
+    max_distance : float
+        Maximum distance of reported pairs.
+    ngram : int, optional
+        Length of the n-grams used for blocking; ``None`` (default) compares all
+        pairs.
+    chunk_size : int
+        Number of strings scored per ``cdist`` call.
+    workers : int
+        Threads used by ``cdist``; -1 uses all CPUs.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        Indices of the matching pairs.
+    """
+    from rapidfuzz import process
+
+    n = len(strings)
+    if n < 2 or max_distance < 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+    grams: t.List[t.Set[str]] = []
+    postings: t.DefaultDict[str, t.List[int]] = defaultdict(list)
+    if ngram is not None:
+        for i, text in enumerate(strings):
+            grams.append(_padded_ngrams(text, ngram))
+            for gram in grams[i]:
+                postings[gram].append(i)
+
+    rows, cols = [], []
+    all_columns = np.arange(n, dtype=np.int64)
+    for start in range(0, n - 1, chunk_size):
+        stop = min(start + chunk_size, n)
+        if ngram is None:
+            columns = all_columns[start + 1 :]
+        else:
+            candidates = set()
+            for i in range(start, stop):
+                for gram in grams[i]:
+                    posting = postings[gram]
+                    candidates.update(posting[bisect.bisect_right(posting, i) :])
+            if not candidates:
+                continue
+            columns = np.fromiter(candidates, dtype=np.int64, count=len(candidates))
+            columns.sort()
+        scores = process.cdist(
+            strings[start:stop],
+            [strings[j] for j in columns.tolist()],
+            scorer=scorer,
+            score_cutoff=max_distance,
+            # float32 scores would round distances onto the cutoff
+            dtype=np.float64,
+            workers=workers,
+        )
+        ii, jj = np.nonzero(scores <= max_distance)
+        ii = ii + start
+        jj = columns[jj]
+        keep = ii < jj
+        ii, jj = ii[keep], jj[keep]
+        if ngram is not None and len(ii):
+            # batches cover the union of their candidates; drop unblocked pairs
+            shared = np.fromiter(
+                (
+                    not grams[i].isdisjoint(grams[j])
+                    for i, j in zip(ii.tolist(), jj.tolist())
+                ),
+                dtype=bool,
+                count=len(ii),
+            )
+            ii, jj = ii[shared], jj[shared]
+        rows.append(ii)
+        cols.append(jj)
+    if not rows:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    return (
+        np.concatenate(rows).astype(np.int64, copy=False),
+        np.concatenate(cols).astype(np.int64, copy=False),
+    )
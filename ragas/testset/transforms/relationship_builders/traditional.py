@@ -1,48 +1,112 @@
+import bisect
 import itertools
 import typing as t
-from collections import Counter
+from collections import Counter, defaultdict
 from dataclasses import dataclass
 
 from ragas.metrics._string import DistanceMeasure
 from ragas.testset.graph import KnowledgeGraph, Node, Relationship
 from ragas.testset.transforms.base import RelationshipBuilder
+from ragas.testset.transforms.relationship_builders.similarity import (
+    fuzzy_match_pairs,
+    inverted_index_jaccard_pairs,
+    minhash_similar_pairs,
+)
 
 
 @dataclass
 class JaccardSimilarityBuilder(RelationshipBuilder):
+    """
+    Builds relationships between nodes whose item sets (e.g. entities) have a
+    Jaccard similarity of at least ``threshold``.
+
+    Attributes
+    ----------
+    index : str
+        ``"inverted"`` (default) only compares nodes that share an item, using an
+        inverted index from item to nodes; results are exact. ``"minhash"`` finds
+        candidates with MinHash signatures and banded LSH, which scales to very
+        large graphs but may miss a small fraction of pairs close to the threshold.
+        ``"brute_force"`` compares every pair of nodes.
+    num_perm : int
+        Number of hash functions in each MinHash signature.
+    minhash_recall : float
+        Target probability of finding a pair right at the threshold with MinHash.
+    verify : bool
+        Whether MinHash candidates are checked with the exact Jaccard similarity;
+        otherwise the similarity estimated from the signatures is used.
+    seed : int
+        Seed for the MinHash hash functions.
+    """
+
     property_name: str = "entities"
     key_name: t.Optional[str] = None
     new_property_name: str = "jaccard_similarity"
     threshold: float = 0.5
+    index: t.Literal["inverted", "minhash", "brute_force"] = "inverted"
+    num_perm: int = 128
+    minhash_recall: float = 0.95
+    verify: bool = True
+    seed: int = 42
+
+    def reads(self) -> t.Optional[t.Set[str]]:
+        return {self.property_name}
+
+    def relationship_type(self) -> t.Optional[str]:
+        return self.new_property_name
 
     def _jaccard_similarity(self, set1: t.Set[str], set2: t.Set[str]) -> float:
         intersection = len(set1.intersection(set2))
         union = len(set1.union(set2))
         return intersection / union if union > 0 else 0.0
 
+    def _get_item_sets(self, kg: KnowledgeGraph) -> t.List[t.Set[str]]:
+        item_sets = []
+        for node in kg.nodes:
+            items = node.get_property(self.property_name)
+            if items is None:
+                raise ValueError(f"Node {node.id} has no {self.property_name}")
+            if self.key_name is not None:
+                items = items.get(self.key_name, [])
+            item_sets.append(set(items))
+        return item_sets
+
     def _find_similar_embedding_pairs(
         self, kg: KnowledgeGraph
     ) -> t.List[t.Tuple[int, int, float]]:
         """
         Finds all node index pairs with Jaccard similarity above the threshold.
-        Returns a set of (i, j, similarity) tuples.
+        Returns a list of (i, j, similarity) tuples.
         """
-
-        similar_pairs = set()
-        for (i, node1), (j, node2) in itertools.combinations(enumerate(kg.nodes), 2):
-            items1 = node1.get_property(self.property_name)
-            items2 = node2.get_property(self.property_name)
-            if items1 is None or items2 is None:
-                raise ValueError(
-                    f"Node {node1.id} or {node2.id} has no {self.property_name}"
-                )
-            if self.key_name is not None:
-                items1 = items1.get(self.key_name, [])
-                items2 = items2.get(self.key_name, [])
-            similarity = self._jaccard_similarity(set(items1), set(items2))
-            if similarity >= self.threshold:
-                similar_pairs.add((i, j, similarity))
-        return list(similar_pairs)
+        item_sets = self._get_item_sets(kg)
+        if self.index == "minhash":
+            rows, cols, scores = minhash_similar_pairs(
+                item_sets,
+                self.threshold,
+                num_perm=self.num_perm,
+                recall=self.minhash_recall,
+                verify=self.verify,
+                seed=self.seed,
+            )
+        elif self.index == "inverted" and self.threshold > 0:
+            rows, cols, scores = inverted_index_jaccard_pairs(item_sets, self.threshold)
+        elif self.index in ("inverted", "brute_force"):
+            # also used for non-positive thresholds, where pairs without shared
+            # items qualify and the inverted index does not help
+            similar_pairs = []
+            for (i, items1), (j, items2) in itertools.combinations(
+                enumerate(item_sets), 2
+            ):
+                similarity = self._jaccard_similarity(items1, items2)
+                if similarity >= self.threshold:
+                    similar_pairs.append((i, j, similarity))
+            return similar_pairs
+        else:
+            raise ValueError(
+                f"Unknown index {self.index!r}. "
+                "Expected 'inverted', 'minhash' or 'brute_force'."
+            )
+        return list(zip(rows.tolist(), cols.tolist(), scores.tolist()))
 
     async def transform(self, kg: KnowledgeGraph) -> t.List[Relationship]:
         similar_pairs = self._find_similar_embedding_pairs(kg)
@@ -61,6 +125,9 @@ class JaccardSimilarityBuilder(RelationshipBuilder):
         """
         Generates a coroutine task for finding similar pairs, which can be scheduled/executed by an Executor.
         """
+        plan = self._incremental_plan(kg, kg)
+        if plan is not None:
+            return plan
 
         async def find_and_add_relationships():
             similar_pairs = self._find_similar_embedding_pairs(kg)
@@ -79,12 +146,30 @@ class JaccardSimilarityBuilder(RelationshipBuilder):
 
 @dataclass
 class OverlapScoreBuilder(RelationshipBuilder):
+    """
+    Builds relationships between nodes whose items (e.g. entities) fuzzily overlap.
+
+    The overlap score of two nodes is the fraction of their item pairs within
+    ``distance_threshold`` of each other, ignoring the most frequent (noisy) items.
+    Items are lower-cased and deduplicated once and matched in batches, and only
+    node pairs sharing a matching item are scored.
+
+    Attributes
+    ----------
+    blocking_ngram : int, optional
+        Length of the character n-grams used to block item comparisons: items
+        sharing no n-gram are never compared. This is an approximate mode that
+        may miss matching items, mostly short ones at loose thresholds. ``None``
+        (default) compares all item pairs.
+    """
+
     property_name: str = "entities"
     key_name: t.Optional[str] = None
     new_property_name: str = "overlap_score"
     distance_measure: DistanceMeasure = DistanceMeasure.JARO_WINKLER
     distance_threshold: float = 0.9
     threshold: float = 0.01
+    blocking_ngram: t.Optional[int] = None
 
     def __post_init__(self):
         try:
@@ -102,8 +187,8 @@ class OverlapScoreBuilder(RelationshipBuilder):
             DistanceMeasure.JARO_WINKLER: distance.JaroWinkler,
         }
 
-    def _overlap_score(self, overlaps: t.List[bool]) -> float:
-        return sum(overlaps) / len(overlaps) if len(overlaps) > 0 else 0.0
+    def _overlap_score(self, n_overlaps: int, n_comparisons: int) -> float:
+        return n_overlaps / n_comparisons if n_comparisons > 0 else 0.0
 
     def _get_noisy_items(
         self, nodes: t.List[Node], property_name: str, percent_cut_off: float = 0.05
@@ -126,53 +211,128 @@ class OverlapScoreBuilder(RelationshipBuilder):
         ]
         return noisy_list
 
+    def _get_items(
+        self, kg: KnowledgeGraph, noisy_items: t.Set[str]
+    ) -> t.List[t.List[str]]:
+        node_items = []
+        for node in kg.nodes:
+            items = node.get_property(self.property_name)
+            if items is None:
+                raise ValueError(f"Node {node.id} has no {self.property_name}")
+            if self.key_name is not None:
+                items = items.get(self.key_name, [])
+            node_items.append([x for x in items if x not in noisy_items])
+        return node_items
+
+    def _find_matching_items(
+        self, node_items: t.List[t.List[str]]
+    ) -> t.Tuple[t.Dict[str, int], t.Set[t.Tuple[int, int]]]:
+        """
+        Lower-case and deduplicate all items, then find the pairs of distinct items
+        within ``distance_threshold``. Returns the item vocabulary and the matching
+        pairs of vocabulary ids (both orders, plus identical items).
+        """
+        vocabulary: t.Dict[str, int] = {}
+        for items in node_items:
+            for x in items:
+                vocabulary.setdefault(x.lower(), len(vocabulary))
+
+        matches: t.Set[t.Tuple[int, int]] = set()
+        max_distance = 1 - self.distance_threshold
+        if max_distance < 0:
+            return vocabulary, matches
+        # an item is always at distance 0 from itself
+        matches.update((u, u) for u in vocabulary.values())
+        rows, cols = fuzzy_match_pairs(
+            list(vocabulary),
+            self.distance_measure_map[self.distance_measure].distance,
+            max_distance,
+            ngram=self.blocking_ngram,
+        )
+        for u, v in zip(rows.tolist(), cols.tolist()):
+            matches.add((u, v))
+            matches.add((v, u))
+        return vocabulary, matches
+
+    def _candidate_node_pairs(
+        self, item_ids: t.List[t.List[int]], matches: t.Set[t.Tuple[int, int]]
+    ) -> t.List[t.Tuple[int, int]]:
+        """
+        Node pairs ``(i, j)``, ``i < j``, reaching ``threshold``. Overlaps are counted
+        through an item -> nodes index, so node pairs without any matching items are
+        never visited.
+        """
+        neighbors: t.DefaultDict[int, t.List[int]] = defaultdict(list)
+        for u, v in matches:
+            neighbors[u].append(v)
+        postings: t.DefaultDict[int, t.List[int]] = defaultdict(list)
+        for j, ids in enumerate(item_ids):
+            for v in ids:
+                postings[v].append(j)
+
+        node_pairs = []
+        for i, ids in enumerate(item_ids):
+            if not ids:
+                continue
+            weights: t.Counter[int] = Counter()
+            for u in ids:
+                weights.update(neighbors[u])
+            overlaps: t.Counter[int] = Counter()
+            for v, weight in weights.items():
+                posting = postings[v]
+                for j in posting[bisect.bisect_right(posting, i) :]:
+                    overlaps[j] += weight
+            n_i = len(ids)
+            node_pairs.extend(
+                (i, j)
+                for j, n_overlaps in overlaps.items()
+                if self._overlap_score(n_overlaps, n_i * len(item_ids[j]))
+                >= self.threshold
+            )
+        node_pairs.sort()
+        return node_pairs
+
+    def reads(self) -> t.Optional[t.Set[str]]:
+        return {self.property_name}
+
+    def relationship_type(self) -> t.Optional[str]:
+        # the noisy items are counted over the whole corpus, so editing some
+        # nodes can change the overlaps of untouched ones: never run incrementally
+        return None
+
     async def transform(self, kg: KnowledgeGraph) -> t.List[Relationship]:
-        if self.property_name is None:
-            self.property_name
+        noisy_items = set(self._get_noisy_items(kg.nodes, self.property_name))
+        node_items = self._get_items(kg, noisy_items)
+        vocabulary, matches = self._find_matching_items(node_items)
+        item_ids = [[vocabulary[x.lower()] for x in items] for items in node_items]
+
+        if self.threshold > 0:
+            node_pairs = self._candidate_node_pairs(item_ids, matches)
+        else:
+            node_pairs = list(itertools.combinations(range(len(kg.nodes)), 2))
 
-        distance_measure = self.distance_measure_map[self.distance_measure]
-        noisy_items = self._get_noisy_items(kg.nodes, self.property_name)
         relationships = []
-        for i, node_x in enumerate(kg.nodes):
-            for j, node_y in enumerate(kg.nodes):
-                if i >= j:
-                    continue
-                node_x_items = node_x.get_property(self.property_name)
-                node_y_items = node_y.get_property(self.property_name)
-                if node_x_items is None or node_y_items is None:
-                    raise ValueError(
-                        f"Node {node_x.id} or {node_y.id} has no {self.property_name}"
-                    )
-                if self.key_name is not None:
-                    node_x_items = node_x_items.get(self.key_name, [])
-                    node_y_items = node_y_items.get(self.key_name, [])
-
-                overlaps = []
-                overlapped_items = []
-                for x in node_x_items:
-                    if x not in noisy_items:
-                        for y in node_y_items:
-                            if y not in noisy_items:
-                                similarity = 1 - distance_measure.distance(
-                                    x.lower(), y.lower()
-                                )
-                                verdict = similarity >= self.distance_threshold
-                                overlaps.append(verdict)
-                                if verdict:
-                                    overlapped_items.append((x, y))
-
-                similarity = self._overlap_score(overlaps)
-                if similarity >= self.threshold:
-                    relationships.append(
-                        Relationship(
-                            source=node_x,
-                            target=node_y,
-                            type=f"{self.property_name}_overlap",
-                            properties={
-                                f"{self.property_name}_{self.new_property_name}": similarity,
-                                "overlapped_items": overlapped_items,
-                            },
-                        )
+        for i, j in node_pairs:
+            overlapped_items = [
+                (x, y)
+                for x, u in zip(node_items[i], item_ids[i])
+                for y, v in zip(node_items[j], item_ids[j])
+                if (u, v) in matches
+            ]
+            similarity = self._overlap_score(
+                len(overlapped_items), len(item_ids[i]) * len(item_ids[j])
+            )
+            if similarity >= self.threshold:
+                relationships.append(
+                    Relationship(
+                        source=kg.nodes[i],
+                        target=kg.nodes[j],
+                        type=f"{self.property_name}_overlap",
+                        properties={
+                            f"{self.property_name}_{self.new_property_name}": similarity,
+                            "overlapped_items": overlapped_items,
+                        },
                     )
+                )
 
         return relationships
@@ -55,6 +55,9 @@ class HeadlineSplitter(Splitter):
 
         return adjusted_chunks
 
+    def reads(self) -> t.Optional[t.Set[str]]:
+        return {"page_content", "headlines"}
+
     async def split(self, node: Node) -> t.Tuple[t.List[Node], t.List[Relationship]]:
         text = node.get_property("page_content")
         if text is None:
@@ -256,6 +256,28 @@ def num_tokens_from_string(string: str, encoding_name: str = "cl100k_base") -> i
     return num_tokens
 
 
+def pack_texts(
+    texts: t.Sequence[str], max_tokens: int, encoding_name: str = "cl100k_base"
+) -> t.List[t.List[int]]:
+    """
+    Group consecutive texts into packs of at most ``max_tokens`` tokens.
+
+    Returns the indices of the texts in each pack. Texts are never split: a text
+    longer than ``max_tokens`` gets a pack of its own.
+    """
+    packs: t.List[t.List[int]] = []
+    pack_tokens = 0
+    for i, text in enumerate(texts):
+        n_tokens = num_tokens_from_string(text, encoding_name)
+        if packs and pack_tokens + n_tokens <= max_tokens:
+            packs[-1].append(i)
+            pack_tokens += n_tokens
+        else:
+            packs.append([i])
+            pack_tokens = n_tokens
+    return packs
+
+
 def batched(iterable: t.Iterable, n: int) -> t.Iterator[t.Tuple]:
     """Batch data from the iterable into tuples of length n. The last batch may be shorter than n."""
     # batched('ABCDEFG', 3) → ABC DEF G